@@ -0,0 +1,161 @@
+"""Load test of the HTTP JSON API with many concurrent local clients.
+
+Starts `task_manager.py api` on a temporary dataset, drives it with
+keep-alive asyncio clients mixing reads and writes, and prints latency
+percentiles, throughput and how many writes shared each fsync:
+
+    python benchmarks/api_load.py --tasks 10000 --clients 50 --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from dataset import generate_tasks
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = ROOT / "src" / "task_manager.py"
+STATUSES = ("TODO", "ONGOING", "DONE")
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+async def _request(reader, writer, method, path, body=None):
+    payload = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def _client(port, tasks, requests, write_ratio, rng, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for _ in range(requests):
+            task_id = rng.randint(1, tasks)
+            roll = rng.random()
+            if roll < write_ratio:
+                request = (
+                    "PATCH",
+                    f"/tasks/{task_id}",
+                    {"status": rng.choice(STATUSES)},
+                )
+            elif roll < (1 + write_ratio) / 2:
+                request = ("GET", f"/tasks/{task_id}", None)
+            else:
+                request = ("GET", "/tasks?status=TODO&size=20", None)
+            start = time.perf_counter()
+            status, _ = await _request(reader, writer, *request)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                raise RuntimeError(f"{request[:2]} answered {status}")
+    finally:
+        writer.close()
+
+
+async def _drive(port, args):
+    latencies = []
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _client(
+                port,
+                args.tasks,
+                args.requests,
+                args.write_ratio,
+                random.Random(rng.random()),
+                latencies,
+            )
+            for _ in range(args.clients)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    _, stats = await _request(reader, writer, "GET", "/stats")
+    writer.close()
+    return latencies, elapsed, stats
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as workdir:
+        data_file = os.path.join(workdir, "tasks.json")
+        with open(data_file, "w", encoding="utf-8") as f:
+            json.dump(
+                generate_tasks(args.tasks, args.seed), f, ensure_ascii=False
+            )
+        server = subprocess.Popen(
+            [sys.executable, str(CLI), "api", "--port", str(port)],
+            cwd=workdir,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            server.stdout.readline()  # waits until the API listens
+            latencies, elapsed, stats = asyncio.run(_drive(port, args))
+        finally:
+            server.terminate()
+            server.wait()
+
+    ms = [latency * 1000 for latency in latencies]
+    result = {
+        "tasks": args.tasks,
+        "clients": args.clients,
+        "requests": len(ms),
+        "write_ratio": args.write_ratio,
+        "throughput_rps": round(len(ms) / elapsed, 1),
+        "p50_ms": round(statistics.median(ms), 3),
+        "p99_ms": round(_percentile(ms, 0.99), 3),
+        "max_ms": round(max(ms), 3),
+        "writes": stats.get("writes"),
+        "fsyncs": stats.get("commits"),
+        "writes_per_fsync": round(
+            stats.get("writes", 0) / max(stats.get("commits", 0), 1), 2
+        ),
+        "journal_writes": stats.get("journal_writes"),
+        "write_amplification": stats.get("write_amplification"),
+    }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
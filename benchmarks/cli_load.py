@@ -0,0 +1,278 @@
+"""Concurrent load test of the CLI on the file-based store.
+
+Starts N worker processes that each run a mix of `task_manager.py`
+invocations (create_task, change_task_status, view_tasks, tags_manager)
+against the same data file, then prints the throughput, the latency
+percentiles per command and a consistency check of the final file against
+the log of the operations that reported success:
+
+    python benchmarks/cli_load.py --tasks 1000 --workers 8 --ops 50
+    python benchmarks/cli_load.py --workers 8 --mix view_tasks=1 --server
+
+Every worker mutates its own tasks only (IDs equal to its index modulo
+the number of workers) so the expected final state is known: a created
+task, a status or a tag missing from the file is a lost update.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from dataset import parse_size, write_dataset
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = ROOT / "src" / "task_manager.py"
+STATUSES = ("TODO", "ONGOING", "DONE")
+DEFAULT_MIX = "create_task=0.2,change_task_status=0.3,view_tasks=0.4,tags_manager=0.1"  # noqa: E501
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parse 'command=weight,...' into normalized weights."""
+    mix = {}
+    for item in value.split(","):
+        command, _, weight = item.partition("=")
+        mix[command.strip()] = float(weight or 1)
+    unknown = set(mix) - set(_OPERATIONS)
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown commands: {', '.join(sorted(unknown))}"
+        )
+    total = sum(mix.values())
+    return {command: weight / total for command, weight in mix.items()}
+
+
+def _create(worker, i, own_ids, rng):
+    title = f"charge w{worker} n{i}"
+    return ["create_task", "--title", title], {"title": title}
+
+
+def _status(worker, i, own_ids, rng):
+    task_id, status = rng.choice(own_ids), rng.choice(STATUSES)
+    args = ["change_task_status", str(task_id), "--status", status]
+    return args, {"id": task_id, "status": status}
+
+
+def _view(worker, i, own_ids, rng):
+    return ["view_tasks", "--status", "TODO", "--format", "plain"], {}
+
+
+def _tag(worker, i, own_ids, rng):
+    task_id, tag = rng.choice(own_ids), f"w{worker}n{i}"
+    return ["tags_manager", str(task_id), "add", tag], {
+        "id": task_id,
+        "tag": tag,
+    }
+
+
+_OPERATIONS = {
+    "create_task": _create,
+    "change_task_status": _status,
+    "view_tasks": _view,
+    "tags_manager": _tag,
+}
+
+
+def _run_worker(job) -> List[Dict]:
+    """Run the operations of one worker in sequence; return its log."""
+    worker, workers, tasks, ops, mix, seed, workdir, env = job
+    rng = random.Random(seed * 1_000_003 + worker)
+    own_ids = list(range(worker + 1, tasks + 1, workers)) or [1]
+    log = []
+    for i in range(ops):
+        command = rng.choices(tuple(mix), tuple(mix.values()))[0]
+        args, expected = _OPERATIONS[command](worker, i, own_ids, rng)
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, str(CLI), *args],
+            cwd=workdir,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        log.append(
+            {
+                "command": command,
+                "worker": worker,
+                "seconds": time.perf_counter() - start,
+                "ok": result.returncode == 0,
+                "error": result.stderr.strip().splitlines()[-1:],
+                **expected,
+            }
+        )
+    return log
+
+
+def check_consistency(tasks: List[Dict], log: List[Dict]) -> Dict:
+    """Compare the final tasks with the successful operations of `log`.
+
+    Operations are applied in the order each worker ran them; since the
+    workers touch disjoint tasks, the last status set on a task is the
+    expected one.
+    """
+    by_id = {}
+    duplicate_ids = 0
+    for task in tasks:
+        duplicate_ids += task["id"] in by_id
+        by_id[task["id"]] = task
+    titles = [task.get("title") for task in tasks]
+
+    expected_status, expected_tags, created = {}, set(), []
+    for entry in log:
+        if not entry["ok"]:
+            continue
+        if entry["command"] == "create_task":
+            created.append(entry["title"])
+        elif entry["command"] == "change_task_status":
+            expected_status[entry["id"]] = entry["status"]
+        elif entry["command"] == "tags_manager":
+            expected_tags.add((entry["id"], entry["tag"]))
+
+    lost_status = sum(
+        by_id.get(task_id, {}).get("status") != status
+        for task_id, status in expected_status.items()
+    )
+    lost_tags = sum(
+        tag not in by_id.get(task_id, {}).get("tags", [])
+        for task_id, tag in expected_tags
+    )
+    lost_creates = sum(title not in titles for title in set(created))
+    return {
+        "tasks": len(tasks),
+        "duplicate_ids": duplicate_ids,
+        "lost_creates": lost_creates,
+        "lost_status_updates": lost_status,
+        "lost_tags": lost_tags,
+        "consistent": not (
+            duplicate_ids or lost_creates or lost_status or lost_tags
+        ),
+    }
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def _latencies(entries: List[Dict]) -> Dict:
+    ms = [entry["seconds"] * 1000 for entry in entries]
+    return {
+        "count": len(ms),
+        "failed": sum(not entry["ok"] for entry in entries),
+        "p50_ms": round(statistics.median(ms), 1),
+        "p95_ms": round(_percentile(ms, 0.95), 1),
+        "p99_ms": round(_percentile(ms, 0.99), 1),
+        "max_ms": round(max(ms), 1),
+    }
+
+
+def _start_server(workdir, env):
+    server = subprocess.Popen(
+        [sys.executable, str(CLI), "serve"],
+        cwd=workdir,
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    server.stdout.readline()  # waits until the server listens
+    return server
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=parse_size, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=25, help="per worker")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="weights of the commands, e.g. view_tasks=3,create_task=1",
+    )
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="run the commands through `task_manager.py serve`",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        data_file = os.path.join(workdir, "tasks.json")
+        write_dataset(data_file, args.tasks, args.seed)
+        # never forward to a server other than the one started here
+        env = dict(
+            os.environ,
+            TASK_MANAGER_SOCKET=os.path.join(workdir, ".tasks.sock"),
+        )
+        server = _start_server(workdir, env) if args.server else None
+        jobs = [
+            (
+                worker,
+                args.workers,
+                args.tasks,
+                args.ops,
+                args.mix,
+                args.seed,
+                workdir,
+                env,
+            )
+            for worker in range(args.workers)
+        ]
+        start = time.perf_counter()
+        try:
+            with multiprocessing.Pool(args.workers) as pool:
+                logs = pool.map(_run_worker, jobs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if server is not None:
+                server.terminate()
+                server.wait()
+        try:
+            with open(data_file, encoding="utf-8") as f:
+                final_tasks = json.load(f)
+        except ValueError:
+            final_tasks = None
+
+    log = [entry for worker_log in logs for entry in worker_log]
+    errors = {}
+    for entry in log:
+        if not entry["ok"]:
+            message = (entry["error"] or ["(no message)"])[0]
+            errors[message] = errors.get(message, 0) + 1
+    report = {
+        "tasks": args.tasks,
+        "workers": args.workers,
+        "server": args.server,
+        "operations": len(log),
+        "throughput_ops": round(len(log) / elapsed, 1),
+        "latency": _latencies(log),
+        "by_command": {
+            command: _latencies(
+                [entry for entry in log if entry["command"] == command]
+            )
+            for command in args.mix
+            if any(entry["command"] == command for entry in log)
+        },
+        "errors": errors,
+        "consistency": (
+            {"consistent": False, "corrupt_file": True}
+            if final_tasks is None
+            else check_consistency(final_tasks, log)
+        ),
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0 if report["consistency"]["consistent"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
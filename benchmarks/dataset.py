@@ -0,0 +1,142 @@
+"""Deterministic synthetic task datasets for the benchmarks.
+
+The same seed always gives the same tasks. Statuses, priorities, tags and
+deadlines follow skewed distributions close to a real backlog (most tasks
+TODO or DONE, a few critical ones, a long tail of rarely used tags), and
+titles and descriptions are French with accented characters:
+
+    python benchmarks/dataset.py --tasks 100000 --output tasks.json
+"""
+
+import argparse
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+STATUSES = {"TODO": 0.45, "ONGOING": 0.15, "DONE": 0.40}
+PRIORITIES = {"LOW": 0.20, "NORMAL": 0.55, "HIGH": 0.20, "CRITICAL": 0.05}
+# Ordered from most to least used; weights follow a Zipf law
+TAGS = (
+    "urgent",
+    "réunion",
+    "client",
+    "équipe",
+    "budget",
+    "priorité",
+    "déploiement",
+    "sécurité",
+    "révision",
+    "été",
+    "école",
+    "santé",
+    "numérique",
+    "qualité",
+    "références",
+    "achats",
+    "événement",
+    "bénévolat",
+    "voyage",
+    "thèse",
+)
+VERBS = (
+    "Préparer",
+    "Rédiger",
+    "Vérifier",
+    "Planifier",
+    "Réviser",
+    "Envoyer",
+    "Corriger",
+    "Télécharger",
+    "Organiser",
+    "Améliorer",
+)
+OBJECTS = (
+    "la réunion d'équipe",
+    "le rapport trimestriel",
+    "la présentation client",
+    "le budget prévisionnel",
+    "les évaluations",
+    "le déploiement en préproduction",
+    "la documentation sécurité",
+    "les congés d'été",
+    "le séminaire à Montréal",
+    "la facture détaillée",
+)
+DETAILS = (
+    "avant la fin de la semaine",
+    "avec l'équipe élargie",
+    "en tenant compte des retours reçus",
+    "pour le comité de pilotage",
+    "après validation par la direction",
+    "selon la procédure définie",
+    "et prévenir les intéressés",
+    "en français et en anglais",
+)
+START = datetime(2024, 1, 1, 8, 0, 0)
+DEADLINE_SHARE = 0.4
+PRIORITY_SHARE = 0.8
+
+
+def _weighted(rng: random.Random, weights: Dict[str, float]) -> str:
+    return rng.choices(tuple(weights), tuple(weights.values()))[0]
+
+
+def generate_tasks(count: int, seed: int = 0) -> List[Dict]:
+    """Return `count` tasks with IDs 1..count, identical for a given seed."""
+    rng = random.Random(seed)
+    tag_weights = [1 / rank for rank in range(1, len(TAGS) + 1)]
+    span = timedelta(days=730).total_seconds()
+    tasks = []
+    for task_id in range(1, count + 1):
+        created_at = START + timedelta(
+            seconds=int(span * task_id / max(count, 1)) + rng.randint(0, 3600)
+        )
+        task = {
+            "id": task_id,
+            "title": f"{rng.choice(VERBS)} {rng.choice(OBJECTS)}",
+            "description": " ".join(rng.sample(DETAILS, rng.randint(0, 2))),
+            "status": _weighted(rng, STATUSES),
+            "created_at": created_at.isoformat(timespec="seconds"),
+        }
+        if rng.random() < PRIORITY_SHARE:
+            task["priority"] = _weighted(rng, PRIORITIES)
+        tag_count = rng.choices((0, 1, 2, 3), (0.3, 0.4, 0.2, 0.1))[0]
+        if tag_count:
+            task["tags"] = sorted(
+                set(rng.choices(TAGS, tag_weights, k=tag_count))
+            )
+        if rng.random() < DEADLINE_SHARE:
+            deadline = created_at + timedelta(days=rng.randint(-5, 60))
+            task["deadline"] = deadline.date().isoformat()
+        tasks.append(task)
+    return tasks
+
+
+def write_dataset(path: str, count: int, seed: int = 0) -> None:
+    """Write a generated dataset in the format of the data file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(generate_tasks(count, seed), f, ensure_ascii=False)
+
+
+def parse_size(value: str) -> int:
+    """Parse a task count such as '10000', '10k' or '1m'."""
+    value = value.strip().lower()
+    factor = {"k": 1_000, "m": 1_000_000}.get(value[-1:], 1)
+    return int(value.rstrip("km")) * factor
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=parse_size, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="tasks.json")
+    args = parser.parse_args(argv)
+    write_dataset(args.output, args.tasks, args.seed)
+    print(f"{args.tasks} tasks written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
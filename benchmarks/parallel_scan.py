@@ -0,0 +1,86 @@
+"""Scaling of the parallel task scan with the number of worker processes.
+
+Builds a synthetic in-memory dataset (see dataset.py), runs the same
+filter + sort with `parallel_scan` for 1, 2, 4, ... workers up to the core
+count, and prints the median time and the speedup over the single-process
+scan:
+
+    python benchmarks/parallel_scan.py --tasks 1000000 --repeat 3
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dataset import generate_tasks, parse_size  # noqa: E402
+
+from src.tasks_manager.utils.parallel_scan import parallel_scan  # noqa: E402
+
+
+def _worker_counts(limit: int):
+    counts, workers = [], 1
+    while workers < limit:
+        counts.append(workers)
+        workers *= 2
+    return counts + [limit]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=parse_size, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--search", default="équipe")
+    parser.add_argument("--sort-by", default="title")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    tasks = generate_tasks(args.tasks, args.seed)
+    results = []
+    for workers in _worker_counts(args.max_workers):
+        timings, matches = [], 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            matches = len(
+                parallel_scan(
+                    tasks,
+                    status="TODO",
+                    search=args.search,
+                    sort_by=args.sort_by,
+                    workers=workers,
+                    min_shard_size=1,
+                )
+            )
+            timings.append(time.perf_counter() - start)
+        results.append(
+            {
+                "workers": workers,
+                "median_s": round(statistics.median(timings), 4),
+                "matches": matches,
+            }
+        )
+
+    baseline = results[0]["median_s"]
+    for result in results:
+        result["speedup"] = round(baseline / result["median_s"], 2)
+    print(
+        json.dumps(
+            {
+                "tasks": args.tasks,
+                "cpu_count": os.cpu_count(),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
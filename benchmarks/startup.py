@@ -0,0 +1,82 @@
+"""Startup time benchmark of the Task Manager CLI.
+
+Runs `python -X importtime` on the CLI entry module several times and
+reports the median cumulative import time, the slowest modules, and
+whether rich got imported. Exits with status 1 when the median exceeds
+the budget, so it can guard against startup regressions in CI:
+
+    python benchmarks/startup.py --budget-ms 120
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ENTRY_MODULE = "src.task_manager"
+DEFAULT_BUDGET_MS = 120.0
+
+
+def import_profile(module: str = ENTRY_MODULE):
+    """Return the `-X importtime` rows of a fresh interpreter.
+
+    Each row is (self_us, cumulative_us, module name).
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def measure(runs: int = 5, module: str = ENTRY_MODULE, top: int = 10):
+    """Measure the startup import time of `module` over several runs."""
+    totals = []
+    rows = []
+    for _ in range(runs):
+        rows = import_profile(module)
+        totals.append(
+            next(cum for _, cum, name in rows if name == module) / 1000
+        )
+    slowest = sorted(rows, key=lambda row: row[0], reverse=True)[:top]
+    return {
+        "module": module,
+        "runs": runs,
+        "median_ms": round(statistics.median(totals), 2),
+        "min_ms": round(min(totals), 2),
+        "rich_imported": any(name == "rich" for _, _, name in rows),
+        "slowest_self_ms": [
+            {"module": name, "self_ms": round(self_us / 1000, 2)}
+            for self_us, _, name in slowest
+        ],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--module", default=ENTRY_MODULE)
+    args = parser.parse_args(argv)
+
+    result = measure(args.runs, args.module)
+    result["budget_ms"] = args.budget_ms
+    result["within_budget"] = result["median_ms"] <= args.budget_ms
+    print(json.dumps(result, indent=2))
+    return 0 if result["within_budget"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
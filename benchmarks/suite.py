@@ -0,0 +1,252 @@
+"""Benchmark suite of the task utilities and CLI commands by dataset size.
+
+Times the core functions on synthetic datasets (see dataset.py) and a few
+end-to-end CLI commands run in a subprocess, then prints or writes the
+results as JSON. With --compare, the medians are checked against a
+previous run and the command exits with status 1 on a regression:
+
+    python benchmarks/suite.py --sizes 1k,10k,100k,1m --output base.json
+    python benchmarks/suite.py --sizes 1k,10k --compare base.json
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = ROOT / "src" / "task_manager.py"
+sys.path.insert(0, str(ROOT))
+
+from dataset import generate_tasks, parse_size  # noqa: E402
+
+from src.tasks_manager.utils.data_manager import _create_task  # noqa: E402
+from src.tasks_manager.utils.file_utils import (  # noqa: E402
+    _load_tasks,
+    _save_tasks,
+)
+from src.tasks_manager.utils.priority_manager import (  # noqa: E402
+    sort_tasks_by_priority,
+)
+from src.tasks_manager.utils.query_utils import (  # noqa: E402
+    filter_by_id,
+    filter_tasks_by_status,
+    search_tasks,
+    sorted_task,
+)
+from src.tasks_manager.utils.task_tags import (  # noqa: E402
+    _filter_tasks_by_tags,
+)
+
+MIN_SAMPLE_TIME = 0.01
+CLI_COMMANDS = {
+    "cli:view_tasks": ["view_tasks", "--status", "TODO", "--size", "20"],
+    "cli:view_tasks_search": [
+        "view_tasks",
+        "--search",
+        "réunion",
+        "--sort_by",
+        "title",
+    ],
+    "cli:create_task": [
+        "create_task",
+        "--title",
+        "Préparer le bilan",
+        "--description",
+        "Écrire la synthèse",
+    ],
+    "cli:next": ["next", "-k", "5"],
+}
+
+
+def _time(function, repeat: int, min_time: float = 0.0):
+    """Time `repeat` samples of the mean duration of one call.
+
+    Fast functions are called enough times per sample for the sample to
+    last at least `min_time` seconds, which keeps timer noise low.
+    """
+    number = 1
+    with redirect_stdout(io.StringIO()):
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            if time.perf_counter() - start >= min_time:
+                break
+            number *= 10
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            timings.append((time.perf_counter() - start) / number)
+    return timings
+
+
+def _create_and_undo(tasks):
+    _create_task("Préparer le bilan", "Écrire la synthèse", tasks)
+    tasks.pop()
+
+
+def _function_benchmarks(tasks, data_file):
+    last_id = tasks[-1]["id"]
+    return {
+        "_load_tasks": lambda: _load_tasks(data_file=data_file),
+        "_save_tasks": lambda: _save_tasks(tasks, data_file=data_file),
+        "_create_task": lambda: _create_and_undo(tasks),
+        "filter_by_id": lambda: filter_by_id(last_id, tasks),
+        "filter_tasks_by_status": lambda: filter_tasks_by_status(
+            "TODO", tasks
+        ),
+        "search_tasks": lambda: search_tasks("réunion", tasks),
+        "sorted_task": lambda: sorted_task(tasks, sort_by="title"),
+        "_filter_tasks_by_tags": lambda: _filter_tasks_by_tags(
+            tasks, ["sécurité", "thèse"]
+        ),
+        "sort_tasks_by_priority": lambda: sort_tasks_by_priority(tasks),
+    }
+
+
+def _run_cli(args, workdir):
+    subprocess.run(
+        [sys.executable, str(CLI), *args],
+        cwd=workdir,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+        # never forward to a server that may run in the current directory
+        env=dict(
+            os.environ,
+            TASK_MANAGER_SOCKET=os.path.join(workdir, "none.sock"),
+        ),
+    )
+
+
+def run_suite(sizes, repeat: int, cli_repeat: int, seed: int, cli: bool):
+    results = []
+
+    def record(name, size, timings):
+        results.append(
+            {
+                "name": name,
+                "size": size,
+                "median_s": round(statistics.median(timings), 9),
+                "min_s": round(min(timings), 9),
+                "runs": len(timings),
+            }
+        )
+        median_ms = statistics.median(timings) * 1e3
+        print(f"{name:<28} {size:>9} {median_ms:12.3f} ms", file=sys.stderr)
+
+    for size in sizes:
+        tasks = generate_tasks(size, seed)
+        with tempfile.TemporaryDirectory() as workdir:
+            data_file = os.path.join(workdir, "tasks.json")
+            _save_tasks(tasks, data_file=data_file)
+            for name, function in _function_benchmarks(
+                tasks, data_file
+            ).items():
+                record(name, size, _time(function, repeat, MIN_SAMPLE_TIME))
+            if not cli:
+                continue
+            for name, args in CLI_COMMANDS.items():
+                _save_tasks(tasks, data_file=data_file)
+                record(
+                    name,
+                    size,
+                    _time(lambda: _run_cli(args, workdir), cli_repeat),
+                )
+    return results
+
+
+def compare(results, baseline, tolerance: float):
+    """Return the results slower than the baseline beyond `tolerance`."""
+    previous = {
+        (entry["name"], entry["size"]): entry["median_s"]
+        for entry in baseline["results"]
+    }
+    regressions = []
+    for entry in results:
+        before = previous.get((entry["name"], entry["size"]))
+        if before and entry["median_s"] > before * (1 + tolerance):
+            regressions.append(
+                dict(
+                    entry,
+                    baseline_s=before,
+                    ratio=round(entry["median_s"] / before, 2),
+                )
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="1k,10k,100k,1m",
+        help="comma-separated task counts, e.g. 1k,10k,100k,1m",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cli-repeat", type=int, default=3)
+    parser.add_argument("--no-cli", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON results to a file")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed slowdown over the baseline median (0.2 = 20%%)",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    report = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": run_suite(
+            sizes, args.repeat, args.cli_repeat, args.seed, not args.no_cli
+        ),
+    }
+
+    status = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report["results"], baseline, args.tolerance)
+        report["regressions"] = regressions
+        for entry in regressions:
+            print(
+                f"REGRESSION {entry['name']} @ {entry['size']}: "
+                f"{entry['median_s']}s vs {entry['baseline_s']}s "
+                f"(x{entry['ratio']})",
+                file=sys.stderr,
+            )
+        status = 1 if regressions else 0
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Disk writes of a burst of edits, with and without the background writer.
+
+Applies the same burst of status changes to a temporary dataset through a
+`TaskStore` journaling every mutation, then through one coalescing them
+with a `BackgroundWriter`, and prints the write statistics of both:
+
+    python benchmarks/write_coalescing.py --tasks 10000 --edits 100000
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dataset import write_dataset  # noqa: E402
+
+from src.tasks_manager.utils.data_manager import (  # noqa: E402
+    _change_task_status,
+)
+from src.tasks_manager.utils.task_store import TaskStore  # noqa: E402
+
+STATUSES = ("TODO", "ONGOING", "DONE")
+
+
+def _burst(write_delay, args) -> dict:
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as workdir:
+        data_file = os.path.join(workdir, "tasks.json")
+        write_dataset(data_file, args.tasks, args.seed)
+        store = TaskStore(
+            data_file, write_delay=write_delay, write_threshold=args.threshold
+        )
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            for _ in range(args.edits):
+                _change_task_status(
+                    store.tasks_list,
+                    rng.randint(1, args.hot_tasks),
+                    rng.choice(STATUSES),
+                )
+        store.sync()
+        elapsed = time.perf_counter() - start
+        store.close()
+    stats = store.write_stats()
+    stats["burst_s"] = round(elapsed, 3)
+    return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--edits", type=int, default=100000)
+    parser.add_argument(
+        "--hot-tasks",
+        type=int,
+        default=100,
+        help="edits are spread over the first N tasks",
+    )
+    parser.add_argument("--delay", type=float, default=1.0)
+    parser.add_argument("--threshold", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    args.hot_tasks = min(args.hot_tasks, args.tasks)
+
+    result = {
+        "tasks": args.tasks,
+        "edits": args.edits,
+        "per_mutation": _burst(None, args),
+        "coalesced": _burst(args.delay, args),
+    }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,30 +1,209 @@
-import click
 from pathlib import Path
 import sys
+import time
+
+# Début de l'invocation, pour le temps de démarrage de --timings
+STARTED = time.perf_counter()
 
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.tasks_manager.utils.file_utils import _load_tasks, _save_tasks
-from src.tasks_manager.cli_tools.cli_data_manager import (
-    create_task,
-    modify_task,
-    change_task_status,
-    delete_task,
+if __name__ == "__main__":
+    # Si un serveur tourne, la commande lui est transmise sans charger
+    # click ni les tâches
+    from src.tasks_manager.utils.task_client import forward
+
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+import os
+
+import click
+
+from src.tasks_manager.utils.file_utils import (
+    _load_tasks,
+    _save_tasks,
+    _is_compact_file,
 )
-from src.tasks_manager.cli_tools.view_tasks import view_tasks
-from src.tasks_manager.cli_tools.task_sheduler import task_deadline
-from src.tasks_manager.cli_tools.tags import tags_cli
-from src.tasks_manager.cli_tools.priority_tasks import manage_priority
+from src.classes.errors import TaskNotFoundError, TaskValidationError
+from src.tasks_manager.cli_tools.lazy_group import LazyGroup
+from src.tasks_manager.utils import timings
+
+CLI_TOOLS = "src.tasks_manager.cli_tools"
 
+# Sous-commandes importées seulement lorsqu'elles sont appelées
+SUBCOMMANDS = {
+    "create_task": f"{CLI_TOOLS}.cli_data_manager:create_task",
+    "modify_task": f"{CLI_TOOLS}.cli_data_manager:modify_task",
+    "change_task_status": f"{CLI_TOOLS}.cli_data_manager:change_task_status",  # noqa: E501
+    "delete_task": f"{CLI_TOOLS}.cli_data_manager:delete_task",
+    "view_tasks": f"{CLI_TOOLS}.view_tasks:view_tasks",
+    "task_sheduler": f"{CLI_TOOLS}.task_sheduler:task_deadline",
+    "tags_manager": f"{CLI_TOOLS}.tags:tags_cli",
+    "bulk_tags": f"{CLI_TOOLS}.tags:bulk_tags_cli",
+    "priority_manager": f"{CLI_TOOLS}.priority_tasks:manage_priority",
+    "next": f"{CLI_TOOLS}.next_tasks:next_tasks",
+    "recurrence": f"{CLI_TOOLS}.recurrence:recurrence",
+    "reminders": f"{CLI_TOOLS}.reminders:reminders",
+    "serve": f"{CLI_TOOLS}.serve:serve",
+    "shell": f"{CLI_TOOLS}.shell:shell",
+    "api": f"{CLI_TOOLS}.api:api",
+    "undo": f"{CLI_TOOLS}.history:undo",
+    "redo": f"{CLI_TOOLS}.history:redo",
+    "history": f"{CLI_TOOLS}.history:history",
+    "backup": f"{CLI_TOOLS}.backup:backup",
+    "restore": f"{CLI_TOOLS}.backup:restore",
+    "dependencies": f"{CLI_TOOLS}.dependencies:dependencies",
+    "unblocked": f"{CLI_TOOLS}.dependencies:unblocked",
+    "subtasks": f"{CLI_TOOLS}.subtasks:subtasks",
+}
 
-@click.group()
+# Commandes longue durée : leurs sous-commandes (serveur, shell) ont chacune
+# leur groupe dans le journal des opérations
+UNLOGGED_COMMANDS = {"serve", "shell", "api", "reminders"}
+
+
+class TaskManagerGroup(LazyGroup):
+    """Groupe racine : compte les erreurs des commandes dans les métriques"""
+
+    def invoke(self, ctx):
+        try:
+            return super().invoke(ctx)
+        except (TaskValidationError, TaskNotFoundError) as e:
+            from src.tasks_manager.utils import metrics
+
+            metrics.record_error(e)
+            raise
+
+
+@click.group(cls=TaskManagerGroup, lazy_subcommands=SUBCOMMANDS)
+@click.option(
+    "--storage",
+    type=click.Choice(["json", "compact"]),
+    default=None,
+    help="Format du fichier de données (par défaut : format actuel)",
+)
+@click.option(
+    "--timings",
+    "timings_flag",
+    is_flag=True,
+    help="Affiche le temps passé dans chaque phase (sur stderr)",
+)
+@click.option(
+    "--memory-report",
+    is_flag=True,
+    help="Mesure la mémoire par phase avec tracemalloc (sur stderr)",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile la commande avec cProfile (voir --profile-file)",
+)
+@click.option(
+    "--profile-file",
+    default="task_manager.pstats",
+    show_default=True,
+    help="Fichier pstats écrit par --profile",
+)
 @click.pass_context
-def task_manager(ctx):
+def task_manager(
+    ctx, storage, timings_flag, memory_report, profile, profile_file
+):
     """Gestionnaire de Tâches - Version CLI Python"""
-    # Charge les tâches une fois et les met dans le contexte Click
     ctx.ensure_object(dict)
-    ctx.obj["tasks_list"] = _load_tasks(data_file="tasks.json")
+    _start_instrumentation(
+        ctx, timings_flag, memory_report, profile, profile_file
+    )
+    # Charge les tâches une fois et les met dans le contexte Click ; en mode
+    # serveur, les tâches sont déjà en mémoire et partagées entre commandes
+    shared = "tasks_list" in ctx.obj
+    if shared:
+        if storage is not None:
+            ctx.obj["compact"] = storage == "compact"
+    else:
+        ctx.obj["data_file"] = "tasks.json"
+        ctx.obj["tasks_list"] = _load_tasks(data_file="tasks.json")
+        if storage is None:
+            ctx.obj["compact"] = _is_compact_file(data_file="tasks.json")
+        else:
+            ctx.obj["compact"] = storage == "compact"
+    if ctx.invoked_subcommand not in UNLOGGED_COMMANDS:
+        from src.tasks_manager.utils.task_history import operation_log
+
+        op_log = operation_log(ctx.obj)
+        op_log.begin(ctx.invoked_subcommand, shared=shared)
+        ctx.call_on_close(op_log.discard)
+    if timings.active() is not None:
+        timings.active().push("command")
+
+
+def _start_instrumentation(ctx, show, memory, profile, profile_file):
+    """Active temps par phase, mémoire, métriques et cProfile jusqu'à la
+    fin du contexte"""
+    # variable METRICS_FILE_ENV, lue ici sans importer le module metrics
+    metrics_file = os.environ.get("TASK_MANAGER_METRICS_FILE")
+    if metrics_file and "tasks_list" not in ctx.obj:
+        from src.tasks_manager.utils import metrics
+
+        metrics.enable()
+
+        def export():
+            metrics.write_textfile(metrics_file, ctx.obj.get("tasks_list"))
+            metrics.disable()
+
+        ctx.call_on_close(export)
+
+    log_file = os.environ.get(timings.TIMINGS_LOG_ENV)
+    if show or log_file or memory:
+        # En mode serveur, le démarrage du processus est déjà loin
+        shared = "tasks_list" in ctx.obj
+        timer_class = timings.PhaseTimer
+        if memory:
+            from src.tasks_manager.utils.memory_report import MemoryTimer
+
+            timer_class = MemoryTimer
+        timer = timer_class(None if shared else STARTED)
+        if not shared:
+            timer.add("startup", time.perf_counter() - STARTED)
+        timings.activate(timer)
+
+        def finish():
+            timings.activate(None)
+            timer.stop()
+            if show:
+                click.echo(timer.report(), err=True)
+            if memory:
+                click.echo(
+                    timer.memory_report(ctx.obj.get("tasks_list")), err=True
+                )
+            if log_file:
+                timings.append_record(
+                    log_file,
+                    timer.as_record(
+                        command=ctx.invoked_subcommand,
+                        tasks=len(ctx.obj.get("tasks_list") or ()),
+                    ),
+                )
+
+        ctx.call_on_close(finish)
+
+    if profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def dump():
+            profiler.disable()
+            profiler.dump_stats(profile_file)
+            click.echo(
+                f"Profil écrit dans {profile_file} "
+                f"(python -m pstats {profile_file})",
+                err=True,
+            )
+
+        ctx.call_on_close(dump)
 
 
 @task_manager.result_callback()
@@ -32,19 +211,21 @@ def task_manager(ctx):
 def save_tasks(ctx, result, **kwargs):
     """Sauvegarde les tâches modifiées automatiquement si besoin"""
     tasks_list = ctx.obj.get("tasks_list")
-    if tasks_list is not None:
-        _save_tasks(tasks_list, data_file="tasks.json")
-
-
-# Ajout des sous-commandes
-task_manager.add_command(create_task)
-task_manager.add_command(modify_task)
-task_manager.add_command(change_task_status)
-task_manager.add_command(delete_task)
-task_manager.add_command(view_tasks)
-task_manager.add_command(task_deadline)
-task_manager.add_command(tags_cli)
-task_manager.add_command(manage_priority)
+    # Les commandes longue durée (rappels, serveur...) désactivent la
+    # sauvegarde : elles n'écrasent pas les modifications faites entre-temps
+    # ou gèrent elles-mêmes la persistance
+    saved = tasks_list is not None and ctx.obj.get("autosave", True)
+    if saved:
+        _save_tasks(
+            tasks_list,
+            data_file="tasks.json",
+            compact=ctx.obj.get("compact", False),
+        )
+    # Les modifications sont journalisées une fois sauvegardées (undo/redo)
+    op_log = ctx.obj.get("op_log")
+    if op_log is not None:
+        op_log.commit(saved)
+
 
 if __name__ == "__main__":
     task_manager(obj={})
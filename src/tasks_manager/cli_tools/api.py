@@ -0,0 +1,55 @@
+"""Module cli to serve the tasks over a local HTTP JSON API."""
+
+import asyncio
+import signal
+
+import click
+from src.tasks_manager.cli_tools.store_options import (
+    echo_write_stats,
+    open_store,
+    write_options,
+)
+from src.tasks_manager.utils import metrics
+from src.tasks_manager.utils.task_api import GroupCommit, TaskAPI, start_api
+from src.tasks_manager.utils.task_store import TaskStore
+
+
+async def _run(store: TaskStore, host: str, port: int, interval: float):
+    stop = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    api = TaskAPI(store, GroupCommit(store.sync))
+    server = await start_api(api, host, port)
+    click.echo(f"API en écoute sur http://{host}:{port}")
+    async with server:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), min(interval, 1.0))
+            except asyncio.TimeoutError:
+                pass
+            store.maybe_snapshot(interval)
+
+
+@click.command(name="api")
+@click.option("--host", default="127.0.0.1", help="Adresse d'écoute")
+@click.option("--port", type=int, default=8765, help="Port d'écoute")
+@click.option(
+    "--snapshot-interval",
+    type=float,
+    default=30.0,
+    help="Délai (s) entre deux écritures complètes du fichier de données",
+)
+@write_options
+@click.pass_context
+def api(ctx, host, port, snapshot_interval, write_delay, write_threshold):
+    """Sert les tâches via une API HTTP/JSON locale"""
+    metrics.enable()
+    store = open_store(ctx, write_delay, write_threshold)
+    try:
+        asyncio.run(_run(store, host, port, snapshot_interval))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+        metrics.disable()
+        click.echo("API arrêtée, tâches sauvegardées.")
+        echo_write_stats(store)
@@ -0,0 +1,87 @@
+"""Module cli to back up the tasks incrementally and restore them."""
+
+import click
+from src.tasks_manager.utils.backup import (
+    BACKUP_DIR,
+    FULL_EVERY,
+    BackupSet,
+)
+from src.tasks_manager.utils.task_events import replace_tasks
+
+_DATETIME_FORMATS = ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"]
+
+
+@click.command(name="backup")
+@click.option(
+    "--dir",
+    "directory",
+    default=BACKUP_DIR,
+    show_default=True,
+    help="Dossier des sauvegardes",
+)
+@click.option("--full", is_flag=True, help="Force une sauvegarde complète")
+@click.option(
+    "--full-every",
+    type=click.IntRange(min=1),
+    default=FULL_EVERY,
+    show_default=True,
+    help="Nombre de sauvegardes par chaîne (une complète puis des deltas)",
+)
+@click.pass_context
+def backup(ctx, directory, full, full_every):
+    """Sauvegarde les tâches modifiées depuis la dernière sauvegarde"""
+    ctx.obj["autosave"] = False
+    entry = BackupSet(directory).backup(
+        ctx.obj["tasks_list"], full=full, full_every=full_every
+    )
+    click.echo(
+        f"Sauvegarde {entry['kind']} n°{entry['n']} ({entry['file']}) : "
+        f"{entry['changed']} tâche(s) écrite(s), {entry['deleted']} "
+        f"supprimée(s), {entry['bytes']} octets"
+    )
+
+
+@click.command(name="restore")
+@click.option(
+    "--at",
+    type=click.DateTime(formats=_DATETIME_FORMATS),
+    default=None,
+    help="Restaure l'état de la dernière sauvegarde faite à cette date "
+    "(par défaut : la plus récente)",
+)
+@click.option(
+    "--dir",
+    "directory",
+    default=BACKUP_DIR,
+    show_default=True,
+    help="Dossier des sauvegardes",
+)
+@click.option(
+    "--verify",
+    is_flag=True,
+    help="Vérifie toutes les sauvegardes sans rien restaurer",
+)
+@click.pass_context
+def restore(ctx, at, directory, verify):
+    """Restaure les tâches depuis les sauvegardes incrémentales"""
+    backups = BackupSet(directory)
+    if verify:
+        ctx.obj["autosave"] = False
+        problems = 0
+        for entry, problem in backups.verify():
+            problems += problem is not None
+            click.echo(
+                f"n°{entry['n']:<5} {entry['ts']}  {entry['kind']:<5} "
+                f"{entry['tasks']:>8} tâches  {problem or 'OK'}"
+            )
+        if problems:
+            raise click.ClickException(
+                f"{problems} sauvegarde(s) invalide(s)."
+            )
+        return
+    entry, tasks = backups.restore(at)
+    changed = replace_tasks(ctx.obj["tasks_list"], tasks)
+    click.echo(
+        f"Sauvegarde n°{entry['n']} du {entry['ts']} restaurée : "
+        f"{len(tasks)} tâches, {changed} modifiée(s) (annulable avec undo)"
+    )
@@ -64,6 +64,8 @@ def change_task_status(ctx, task_id: int, status: str):
 def delete_task(ctx, task_id: int):
     """Supprime une tâche existante"""
     tasks_list = ctx.obj["tasks_list"]
-    updated_list = _delete_task(task_id, tasks_list)
+    updated_list = _delete_task(
+        task_id, tasks_list, dependencies=ctx.obj.get("dependency_graph")
+    )
     ctx.obj["tasks_list"] = updated_list
     click.echo(f"Tâche avec l'ID {task_id} supprimée")
@@ -0,0 +1,72 @@
+"""Module cli to manage the dependencies between tasks."""
+
+import click
+from src.classes.errors import TaskNotFoundError
+from src.tasks_manager.cli_tools.output_format import format_option
+from src.tasks_manager.utils.file_utils import display_tasks
+from src.tasks_manager.utils.task_dependencies import (
+    DependencyGraph,
+    add_dependencies,
+    remove_dependencies,
+)
+from src.tasks_manager.utils.task_events import cached_index
+
+
+def _graph(ctx):
+    return cached_index(
+        ctx.obj, "dependency_graph", DependencyGraph.from_tasks
+    )
+
+
+@click.command(name="dependencies")
+@click.argument("task_id", type=int)
+@click.argument("action", type=click.Choice(["add", "remove", "list"]))
+@click.argument("blocker_ids", type=int, nargs=-1)
+@click.pass_context
+def dependencies(ctx, task_id, action, blocker_ids):
+    """Gère les tâches qui bloquent une tâche.
+
+    ACTION vaut 'add' ou 'remove' (suivi des IDs des tâches bloquantes) ou
+    'list'.
+    """
+    if action != "list" and not blocker_ids:
+        raise click.UsageError("Aucun ID de tâche bloquante fourni.")
+    tasks_list = ctx.obj["tasks_list"]
+    if action == "add":
+        add_dependencies(tasks_list, task_id, blocker_ids, graph=_graph(ctx))
+        click.echo(
+            f"Tâche {task_id} bloquée par : "
+            + ", ".join(str(tid) for tid in blocker_ids)
+        )
+        return
+    if action == "remove":
+        remove_dependencies(tasks_list, task_id, blocker_ids)
+        click.echo(f"Dépendances retirées de la tâche {task_id}")
+        return
+
+    graph = _graph(ctx)
+    if task_id not in graph.tasks:
+        raise TaskNotFoundError(f"Tâche avec l'ID {task_id} non trouvée.")
+    for label, ids in (
+        ("Bloquée par", graph.blockers.get(task_id, ())),
+        ("Bloque", graph.dependents.get(task_id, ())),
+    ):
+        click.echo(f"{label} :")
+        for other in sorted(ids):
+            task = graph.tasks[other]
+            click.echo(f"  [{other}] {task['title']} ({task.get('status')})")
+    if task_id in graph.ready:
+        click.echo("Aucune dépendance ouverte.")
+
+
+@click.command(name="unblocked")
+@click.option("-k", "--count", default=10, help="Nombre de tâches affichées")
+@format_option
+@click.pass_context
+def unblocked(ctx, count, fmt):
+    """Affiche les tâches ouvertes dont toutes les dépendances sont faites"""
+    graph = _graph(ctx)
+    tasks = graph.unblocked(count)
+    display_tasks(
+        tasks, page=1, total_pages=1, total_tasks=len(graph), fmt=fmt
+    )
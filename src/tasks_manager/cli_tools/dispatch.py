@@ -0,0 +1,61 @@
+"""Module cli to run commands of the root group against shared state."""
+
+import io
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Dict, List
+
+import click
+
+
+class _Capture(io.StringIO):
+    """Captured output reporting the TTY status of the real client."""
+
+    def __init__(self, isatty: bool = False):
+        super().__init__()
+        self._isatty = isatty
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+
+def run_command(
+    root: click.Command, obj: Dict, args: List[str], isatty: bool = False
+) -> Dict:
+    """Run a command line with `obj` as context object.
+
+    Returns the exit code and the captured stdout and stderr. Prompts get
+    an empty stdin, so a missing required value aborts the command.
+    """
+    out, err = _Capture(isatty), _Capture()
+    stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                result = root.main(
+                    args,
+                    prog_name="task_manager",
+                    obj=obj,
+                    standalone_mode=False,
+                )
+                exit_code = result if isinstance(result, int) else 0
+            except click.ClickException as e:
+                e.show(file=err)
+                exit_code = e.exit_code
+            except click.exceptions.Exit as e:
+                exit_code = e.exit_code
+            except click.Abort:
+                err.write("Aborted!\n")
+                exit_code = 1
+            except Exception:
+                err.write(traceback.format_exc())
+                exit_code = 1
+    finally:
+        sys.stdin = stdin
+    return {
+        "exit_code": exit_code,
+        "output": out.getvalue(),
+        "error": err.getvalue(),
+    }
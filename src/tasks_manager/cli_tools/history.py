@@ -0,0 +1,78 @@
+"""Module cli to undo, redo and list the changes made to the tasks."""
+
+import click
+from src.tasks_manager.utils.task_history import operation_log
+
+
+def _describe(entry):
+    if entry["a"] == "create":
+        return f"création : {entry['f'].get('title', '')}"
+    if entry["a"] == "delete":
+        return f"suppression : {entry['b'].get('title', '')}"
+    return ", ".join(
+        f"{field} : {entry['b'][field]!r} → {entry['f'][field]!r}"
+        for field in entry["b"]
+    )
+
+
+def _run(ctx, action, steps, verb, empty):
+    step = getattr(operation_log(ctx.obj), action)
+    for _ in range(steps):
+        result = step(ctx.obj["tasks_list"])
+        if result is None:
+            click.echo(empty)
+            return
+        group, count = result
+        click.echo(
+            f"{verb} : {group[3] or 'commande'} "
+            f"(#{group[0]}, {count} modification(s))"
+        )
+
+
+@click.command(name="undo")
+@click.option(
+    "-n",
+    "--steps",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Nombre de commandes à annuler",
+)
+@click.pass_context
+def undo(ctx, steps):
+    """Annule les modifications de la dernière commande"""
+    _run(ctx, "undo", steps, "Annulé", "Rien à annuler.")
+
+
+@click.command(name="redo")
+@click.option(
+    "-n",
+    "--steps",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Nombre de commandes à rétablir",
+)
+@click.pass_context
+def redo(ctx, steps):
+    """Rétablit la dernière commande annulée"""
+    _run(ctx, "redo", steps, "Rétabli", "Rien à rétablir.")
+
+
+@click.command(name="history")
+@click.argument("task_id", type=int)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Nombre de modifications affichées (les plus récentes)",
+)
+@click.pass_context
+def history(ctx, task_id, limit):
+    """Affiche l'historique des modifications d'une tâche"""
+    entries = list(operation_log(ctx.obj).history(task_id, limit))
+    if not entries:
+        click.echo(f"Aucune modification enregistrée pour la tâche {task_id}.")
+    for entry, undone in entries:
+        click.echo(
+            f"#{entry['s']:<6} {entry['t']}  {entry['a']:<10} "
+            f"{_describe(entry)}{'  (annulée)' if undone else ''}"
+        )
@@ -0,0 +1,38 @@
+"""Module cli for a click group importing its subcommands on demand."""
+
+import importlib
+from typing import Dict
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Click group whose subcommands are imported only when invoked.
+
+    `lazy_subcommands` maps a command name to 'module.path:attribute'.
+    """
+
+    def __init__(self, *args, lazy_subcommands: Dict[str, str] = None, **kw):
+        super().__init__(*args, **kw)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        names = set(super().list_commands(ctx)) | set(self.lazy_subcommands)
+        return sorted(names)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy subcommand '{cmd_name}' is not a click command."
+            )
+        # Cache the loaded command so the module is resolved once
+        self.add_command(command, cmd_name)
+        del self.lazy_subcommands[cmd_name]
+        return command
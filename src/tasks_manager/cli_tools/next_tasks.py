@@ -0,0 +1,66 @@
+"""Module cli to pick the next tasks to work on."""
+
+import click
+from src.tasks_manager.utils.task_queue import UrgencyQueue, DEFAULT_WEIGHTS
+from src.tasks_manager.utils.file_utils import (
+    MACHINE_FORMATS,
+    display_tasks,
+    resolve_format,
+)
+from src.tasks_manager.utils.task_events import cached_index
+from src.tasks_manager.cli_tools.output_format import format_option
+
+
+@click.command(name="next")
+@click.option("-k", "--count", default=5, help="Nombre de tâches à proposer")
+@click.option(
+    "--priority-weight",
+    type=float,
+    default=DEFAULT_WEIGHTS["priority"],
+    help="Poids de la priorité dans le score d'urgence",
+)
+@click.option(
+    "--deadline-weight",
+    type=float,
+    default=DEFAULT_WEIGHTS["deadline"],
+    help="Poids de l'échéance dans le score d'urgence",
+)
+@click.option(
+    "--age-weight",
+    type=float,
+    default=DEFAULT_WEIGHTS["age"],
+    help="Poids de l'ancienneté (par jour) dans le score d'urgence",
+)
+@format_option
+@click.pass_context
+def next_tasks(
+    ctx, count, priority_weight, deadline_weight, age_weight, fmt
+):
+    """Affiche les prochaines tâches à traiter (TODO/ONGOING) par urgence
+
+    Les formats tsv/json/ndjson listent les tâches (avec un champ `score`
+    en json/ndjson), les autres affichent le rang et le score de chacune.
+    """
+    weights = {
+        "priority": priority_weight,
+        "deadline": deadline_weight,
+        "age": age_weight,
+    }
+    queue = cached_index(ctx.obj, "urgency_queue", UrgencyQueue.from_tasks)
+    queue.configure(weights)
+
+    tasks = queue.top(count)
+    if resolve_format(fmt) in MACHINE_FORMATS:
+        scored = [
+            {**task, "score": round(queue.score(task["id"]), 2)}
+            for task in tasks
+        ]
+        display_tasks(
+            scored, page=1, total_pages=1, total_tasks=len(queue), fmt=fmt
+        )
+        return
+    for rank, task in enumerate(tasks, start=1):
+        click.echo(
+            f"{rank}. [{task['id']}] {task['title']} "
+            f"(score {queue.score(task['id']):.2f})"
+        )
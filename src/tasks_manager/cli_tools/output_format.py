@@ -0,0 +1,30 @@
+"""Module cli for the output format shared by the listing commands."""
+
+import click
+from src.tasks_manager.utils.file_utils import OUTPUT_FORMATS, MACHINE_FORMATS
+
+format_option = click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(OUTPUT_FORMATS),
+    default=None,
+    help="Output format (default: table on a terminal, plain otherwise)",
+)
+
+
+def echo_status(message: str, fmt: str = None) -> None:
+    """Echo a status message, on stderr for machine-readable formats."""
+    click.echo(message, err=fmt in MACHINE_FORMATS)
+
+
+def echo_page_status(
+    page: int, total_pages: int, total_tasks: int, fmt: str = None
+) -> None:
+    """Explain why a page of `get_tasks` is empty, if it is."""
+    if not total_tasks:
+        echo_status(f"Total de tâches: {total_tasks}", fmt)
+        echo_status(f"Total de pages: {total_pages}", fmt)
+    elif page > total_pages:
+        echo_status(
+            f"Page {page} n'existe pas. Total de pages: {total_pages}", fmt
+        )
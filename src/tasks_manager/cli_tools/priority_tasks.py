@@ -1,31 +1,90 @@
 import click
-from src.tasks_manager.utils.priority_manager import task_priority
+from src.tasks_manager.utils.priority_manager import (
+    task_priority,
+    PriorityIndex,
+)
+from src.tasks_manager.utils.query_utils import get_tasks, filter_by_id
 from src.tasks_manager.utils.file_utils import display_tasks
+from src.tasks_manager.utils.task_events import cached_index
+from src.tasks_manager.cli_tools.output_format import (
+    format_option,
+    echo_status,
+    echo_page_status,
+)
+
+ACTIONS = ["set", "get", "sort", "filter"]
+LIST_ACTIONS = ("sort", "filter")
 
 
 @click.command(name="priority_manager")
-@click.argument("task_id", type=int)
-@click.argument("action", type=click.Choice(["set", "get", "sort", "filter"]))
+@click.argument("target", metavar="[TASK_ID] ACTION")
+@click.argument("action", required=False, type=click.Choice(ACTIONS))
 @click.option(
     "--priority",
     type=click.Choice(["LOW", "NORMAL", "HIGH", "CRITICAL"]),
-    help="Priority to set for the task (required for 'set' and 'filter' actions).",
+    help="Priority to set for the task (required for 'set' and 'filter' actions).",  # noqa: E501
 )
+@click.option("--page", default=1, help="Page number for 'sort' and 'filter'")
+@click.option("--size", default=10, help="Number of tasks per page")
+@format_option
 @click.pass_context
-def manage_priority(ctx, task_id: int, action: str, priority: str = None):
+def manage_priority(
+    ctx,
+    target: str,
+    action: str,
+    priority: str,
+    page: int,
+    size: int,
+    fmt: str,
+):
+    """Manage task priorities.
+
+    'set' and 'get' need a TASK_ID; 'sort' and 'filter' work on all tasks.
+    """
     tasks_list = ctx.obj["tasks_list"]
 
-    updated_task = task_priority(tasks_list, task_id, action, priority)
+    task_id = None
+    if action is None:
+        if target not in LIST_ACTIONS:
+            raise click.UsageError(
+                "ACTION is required; TASK_ID can only be omitted for "
+                "'sort' and 'filter'."
+            )
+        action = target
+    else:
+        try:
+            task_id = int(target)
+        except ValueError:
+            raise click.BadParameter(
+                f"'{target}' is not a valid task ID.", param_hint="TASK_ID"
+            )
+
+    if action in LIST_ACTIONS:
+        index = cached_index(
+            ctx.obj, "priority_index", PriorityIndex.from_tasks
+        )
+        tasks = task_priority(
+            tasks_list, task_id, action, priority, index=index
+        )
+        paginated_tasks, total_tasks, total_pages = get_tasks(
+            page, size, tasks
+        )
+        echo_page_status(page, total_pages, total_tasks, fmt)
+        display_tasks(
+            paginated_tasks, page, total_pages, total_tasks, fmt=fmt
+        )
+        return
+
+    result = task_priority(tasks_list, task_id, action, priority)
 
-    # update the task in the tasks list
-    tasks_list = [
-        task if task["id"] != task_id else updated_task for task in tasks_list
-    ]
-    ctx.obj["tasks_list"] = tasks_list
+    if action == "get":
+        echo_status(f"Priority of task {task_id}: {result}", fmt)
+        result = filter_by_id(task_id, tasks_list)
 
     display_tasks(
-        [updated_task],
+        [result],
         page=1,
         total_pages=1,
         total_tasks=1,
+        fmt=fmt,
     )
@@ -0,0 +1,96 @@
+"""Module cli to manage recurring tasks in Task Manager application."""
+
+import click
+from src.tasks_manager.utils.recurrence import (
+    set_recurrence,
+    clear_recurrence,
+    parse_occurrence_id,
+    materialize_occurrence,
+)
+from src.tasks_manager.utils.data_manager import (
+    _change_task_status,
+    _modify_task,
+)
+
+
+@click.command(name="recurrence")
+@click.argument("action", type=click.Choice(["set", "clear", "touch"]))
+@click.argument("target", metavar="TASK_ID|OCCURRENCE")
+@click.option(
+    "--freq",
+    type=click.Choice(["daily", "weekly", "monthly"]),
+    help="Fréquence de répétition (set)",
+)
+@click.option("--interval", default=1, help="Tous les N jours/semaines/mois")
+@click.option("--start", help="Première occurrence 'YYYY-MM-DD'")
+@click.option("--until", help="Dernière date possible 'YYYY-MM-DD'")
+@click.option("--count", type=int, help="Nombre maximal d'occurrences")
+@click.option(
+    "--status",
+    type=click.Choice(["TODO", "ONGOING", "DONE"]),
+    help="Nouveau statut de l'occurrence (touch)",
+)
+@click.option("--title", default=None, help="Nouveau titre (touch)")
+@click.option("--description", default=None, help="Nouvelle description")
+@click.pass_context
+def recurrence(
+    ctx,
+    action,
+    target,
+    freq,
+    interval,
+    start,
+    until,
+    count,
+    status,
+    title,
+    description,
+):
+    """Gère les tâches récurrentes.
+
+    'set' et 'clear' prennent l'ID de la tâche modèle ; 'touch' prend une
+    occurrence '<id>@<YYYY-MM-DD>' et l'enregistre comme tâche concrète.
+    """
+    tasks_list = ctx.obj["tasks_list"]
+
+    if action == "touch":
+        template_id, deadline = parse_occurrence_id(target)
+        task, tasks_list = materialize_occurrence(
+            tasks_list, template_id, deadline
+        )
+        if status:
+            task, tasks_list = _change_task_status(
+                tasks_list=tasks_list, task_id=task["id"], new_status=status
+            )
+        if title is not None or description is not None:
+            task, tasks_list = _modify_task(
+                tasks_list, task["id"], title=title, description=description
+            )
+        ctx.obj["tasks_list"] = tasks_list
+        click.echo(f"Occurrence {target} enregistrée comme tâche {task['id']}")
+        return
+
+    try:
+        task_id = int(target)
+    except ValueError:
+        raise click.BadParameter(
+            f"'{target}' n'est pas un ID de tâche.", param_hint="TASK_ID"
+        )
+
+    if action == "set":
+        if not freq:
+            raise click.UsageError("--freq est requis pour 'set'.")
+        task, tasks_list = set_recurrence(
+            tasks_list,
+            task_id,
+            freq,
+            interval=interval,
+            start=start,
+            until=until,
+            count=count,
+        )
+        click.echo(f"Tâche {task_id} répétée ({freq}, tous les {interval})")
+    else:
+        task, tasks_list = clear_recurrence(tasks_list, task_id)
+        click.echo(f"Tâche {task_id} n'est plus récurrente")
+    ctx.obj["tasks_list"] = tasks_list
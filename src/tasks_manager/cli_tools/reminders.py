@@ -0,0 +1,70 @@
+"""Module cli to run the deadline reminder daemon."""
+
+import time
+from datetime import timedelta
+
+import click
+from src.classes.errors import TaskValidationError
+from src.tasks_manager.utils.file_utils import _load_tasks
+from src.tasks_manager.utils.file_watcher import FileWatcher
+from src.tasks_manager.utils.reminders import (
+    ReminderScheduler,
+    make_sink,
+    run_reminders,
+)
+
+
+@click.command(name="reminders")
+@click.option(
+    "--lead",
+    type=float,
+    default=24.0,
+    help="Délai (en heures) entre le rappel et l'échéance",
+)
+@click.option(
+    "--at", default="09:00", help="Heure d'échéance des tâches (HH:MM)"
+)
+@click.option(
+    "--sink",
+    default="stdout",
+    help="Destination : 'stdout', 'file:<chemin>' ou 'command:<commande>'",
+)
+@click.option(
+    "--poll-min",
+    type=float,
+    default=0.5,
+    help="Intervalle minimal (s) de surveillance du fichier",
+)
+@click.option(
+    "--poll-max",
+    type=float,
+    default=8.0,
+    help="Intervalle maximal (s) de surveillance du fichier",
+)
+@click.option(
+    "--once", is_flag=True, help="Envoie les rappels dus puis s'arrête"
+)
+@click.pass_context
+def reminders(ctx, lead, at, sink, poll_min, poll_max, once):
+    """Envoie des rappels avant les échéances des tâches (TODO/ONGOING)"""
+    ctx.obj["autosave"] = False
+    data_file = ctx.obj.get("data_file", "tasks.json")
+    try:
+        scheduler = ReminderScheduler(lead=timedelta(hours=lead), at=at)
+        sink = make_sink(sink)
+    except TaskValidationError as e:
+        raise click.BadParameter(str(e))
+
+    scheduler.sync(ctx.obj["tasks_list"])
+    if once:
+        for reminder in scheduler.pop_due(time.time()):
+            sink.send(reminder)
+        return
+
+    watcher = FileWatcher(data_file, poll_min, poll_max)
+    try:
+        run_reminders(
+            scheduler, lambda: _load_tasks(data_file=data_file), watcher, sink
+        )
+    except KeyboardInterrupt:
+        click.echo("Arrêt des rappels.")
@@ -0,0 +1,162 @@
+"""Module cli to serve commands from tasks kept in memory."""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import click
+from src.tasks_manager.cli_tools.dispatch import run_command
+from src.tasks_manager.cli_tools.store_options import (
+    echo_write_stats,
+    open_store,
+    write_options,
+)
+from src.tasks_manager.utils import metrics
+from src.tasks_manager.utils.task_client import (
+    command_name,
+    runs_locally,
+    socket_path,
+)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        response = self.server.dispatch(
+            request["args"], request.get("isatty", False)
+        )
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class TaskServer(socketserver.UnixStreamServer):
+    """Unix socket server running the CLI commands one at a time.
+
+    Commands share the in-memory tasks of `store`; changes are journaled
+    and snapshotted to the data file every `snapshot_interval` seconds.
+    """
+
+    def __init__(self, path, root, store, snapshot_interval=30.0):
+        self.root = root
+        self.store = store
+        self.snapshot_interval = snapshot_interval
+        super().__init__(path, _Handler)
+
+    def dispatch(self, args, isatty=False):
+        if runs_locally(args):
+            name = command_name(args)
+            return {
+                "exit_code": 2,
+                "output": "",
+                "error": f"Error: '{name}' cannot run on the server.\n",
+            }
+        return run_command(self.root, self.store.obj, args, isatty)
+
+    def service_actions(self):
+        self.store.maybe_snapshot(self.snapshot_interval)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics.enable().render(self.server.store.tasks_list)
+        body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", metrics.CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(store, port, host="127.0.0.1"):
+    """Serve GET /metrics from a daemon thread; the caller shuts it down."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.store = store
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _check_not_running(path: str) -> None:
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.remove(path)
+            return
+    raise click.ClickException(f"A server is already listening on {path}.")
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+@click.command(name="serve")
+@click.option("--socket", "path", default=None, help="Chemin du socket Unix")
+@click.option(
+    "--snapshot-interval",
+    type=float,
+    default=30.0,
+    help="Délai (s) entre deux écritures complètes du fichier de données",
+)
+@click.option(
+    "--fsync", is_flag=True, help="Force l'écriture disque du journal"
+)
+@click.option(
+    "--metrics-port",
+    type=int,
+    default=None,
+    help="Port HTTP local exposant /metrics au format Prometheus",
+)
+@write_options
+@click.pass_context
+def serve(
+    ctx,
+    path,
+    snapshot_interval,
+    fsync,
+    metrics_port,
+    write_delay,
+    write_threshold,
+):
+    """Garde les tâches en mémoire et exécute les commandes reçues"""
+    ctx.obj["autosave"] = False
+    path = path or socket_path()
+    _check_not_running(path)
+
+    store = open_store(ctx, write_delay, write_threshold, fsync=fsync)
+    root = ctx.find_root().command
+    server = TaskServer(path, root, store, snapshot_interval)
+    signal.signal(signal.SIGTERM, _interrupt)
+    click.echo(
+        f"Serveur en écoute sur {path} ({len(store.tasks_list)} tâches)"
+    )
+    metrics_server = None
+    if metrics_port is not None:
+        metrics.enable()
+        metrics_server = start_metrics_server(store, metrics_port)
+        click.echo(f"Métriques sur http://127.0.0.1:{metrics_port}/metrics")
+    try:
+        server.serve_forever(poll_interval=0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(path)
+        if metrics_server is not None:
+            metrics_server.shutdown()
+            metrics_server.server_close()
+            metrics.disable()
+        store.close()
+        click.echo("Serveur arrêté, tâches sauvegardées.")
+        echo_write_stats(store)
@@ -0,0 +1,176 @@
+"""Module cli for an interactive shell sharing one loaded task list."""
+
+import bisect
+import cmd
+import shlex
+import sys
+import threading
+from typing import Dict, List
+
+import click
+from src.tasks_manager.cli_tools.dispatch import run_command
+from src.tasks_manager.cli_tools.store_options import (
+    echo_write_stats,
+    open_store,
+    write_options,
+)
+from src.tasks_manager.utils.tag_dictionary import TagIndex
+from src.tasks_manager.utils.task_events import cached_index, subscribe
+from src.tasks_manager.utils.task_store import TaskStore
+
+
+class TaskIdIndex:
+    """Sorted task IDs as strings, for prefix completion with bisect."""
+
+    def __init__(self, obj: Dict):
+        self._obj = obj
+        self._ids: List[str] = None
+
+    def apply(self, action: str, task: Dict, previous: Dict) -> None:
+        """Follow a task mutation notified through `task_events`."""
+        if action in ("create", "delete"):
+            self._ids = None
+
+    def complete(self, prefix: str) -> List[str]:
+        """Return the IDs starting with `prefix`."""
+        if self._ids is None:
+            self._ids = sorted(
+                str(task["id"]) for task in self._obj["tasks_list"]
+            )
+        start = bisect.bisect_left(self._ids, prefix)
+        end = bisect.bisect_left(self._ids, prefix + "\uffff")
+        return self._ids[start:end]
+
+
+class TaskShell(cmd.Cmd):
+    """Runs the task_manager commands against tasks loaded once.
+
+    Changes are journaled in the background as they happen, and the data
+    file is written on 'save', on 'exit' and every `autosave` seconds when
+    there are unsaved changes.
+    """
+
+    intro = "Shell du gestionnaire de tâches. 'help' liste les commandes."
+    prompt = "tasks> "
+
+    def __init__(self, root, store: TaskStore, autosave: float = 60.0, **kw):
+        super().__init__(**kw)
+        self.root = root
+        self.store = store
+        self.lock = threading.Lock()
+        self.ids = TaskIdIndex(store.obj)
+        subscribe(self.ids.apply)
+        self._stop = threading.Event()
+        self._timer = None
+        if autosave:
+            self._timer = threading.Thread(
+                target=self._autosave, args=(autosave,), daemon=True
+            )
+            self._timer.start()
+
+    def _autosave(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            with self.lock:
+                self.store.maybe_snapshot(interval)
+
+    def _commands(self) -> List[str]:
+        return [
+            name
+            for name in self.root.list_commands(None)
+            if name not in ("shell", "serve")
+        ]
+
+    # --- Commandes propres au shell ---
+
+    def do_save(self, arg):
+        """save : écrit les tâches dans le fichier de données"""
+        with self.lock:
+            self.store.snapshot()
+        count = len(self.store.tasks_list)
+        self.stdout.write(f"{count} tâches sauvegardées.\n")
+
+    def do_exit(self, arg):
+        """exit : sauvegarde et quitte le shell"""
+        self._stop.set()
+        with self.lock:
+            self.store.close()
+        return True
+
+    do_quit = do_exit
+
+    def do_EOF(self, arg):
+        self.stdout.write("\n")
+        return self.do_exit(arg)
+
+    def emptyline(self):
+        pass
+
+    def do_help(self, arg):
+        if arg and arg in self._commands():
+            self.default(f"{arg} --help")
+            return
+        super().do_help(arg)
+        self.stdout.write("Commandes du gestionnaire :\n")
+        self.columnize(self._commands())
+
+    # --- Commandes du gestionnaire ---
+
+    def default(self, line):
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            self.stdout.write(f"Erreur : {e}\n")
+            return
+        if args[0] not in self._commands():
+            self.stdout.write(f"Commande inconnue : {args[0]}\n")
+            return
+        with self.lock:
+            response = run_command(
+                self.root, self.store.obj, args, self.stdout.isatty()
+            )
+        self.stdout.write(response["output"])
+        if response["error"]:
+            sys.stderr.write(response["error"])
+
+    # --- Complétion ---
+
+    def completenames(self, text, *ignored):
+        names = super().completenames(text, *ignored)
+        return names + [n for n in self._commands() if n.startswith(text)]
+
+    def completedefault(self, text, line, begidx, endidx):
+        if text.startswith("-"):
+            command = self.root.get_command(None, line.split()[0])
+            if command is None:
+                return []
+            options = [
+                opt for param in command.params for opt in param.opts
+            ]
+            return sorted(opt for opt in options if opt.startswith(text))
+        with self.lock:
+            tags = cached_index(
+                self.store.obj, "tag_index", TagIndex.from_tasks
+            )
+            return self.ids.complete(text) + [
+                tag for tag in tags.usage() if tag.startswith(text)
+            ]
+
+
+@click.command(name="shell")
+@click.option(
+    "--autosave",
+    type=float,
+    default=60.0,
+    help="Délai (s) entre deux sauvegardes automatiques (0 pour désactiver)",
+)
+@write_options
+@click.pass_context
+def shell(ctx, autosave, write_delay, write_threshold):
+    """Lance un shell interactif qui charge les tâches une seule fois"""
+    store = open_store(ctx, write_delay, write_threshold)
+    task_shell = TaskShell(ctx.find_root().command, store, autosave)
+    try:
+        task_shell.cmdloop()
+    except KeyboardInterrupt:
+        task_shell.do_exit("")
+    echo_write_stats(store)
@@ -0,0 +1,53 @@
+"""Module cli for the commands keeping the tasks in memory."""
+
+import click
+from src.tasks_manager.utils.task_store import TaskStore
+
+
+def write_options(command):
+    """Add the options of the background journal writer to a command."""
+    command = click.option(
+        "--write-threshold",
+        type=click.IntRange(min=1),
+        default=1000,
+        show_default=True,
+        help="Nombre de tâches modifiées déclenchant l'écriture du journal",
+    )(command)
+    command = click.option(
+        "--write-delay",
+        type=click.FloatRange(min=0),
+        default=1.0,
+        show_default=True,
+        help="Délai (s) de regroupement des écritures du journal "
+        "(0 : écriture à chaque modification)",
+    )(command)
+    return command
+
+
+def open_store(
+    ctx, write_delay: float, write_threshold: int, fsync: bool = False
+) -> TaskStore:
+    """Load the tasks of the context in a journaled `TaskStore`."""
+    ctx.obj["autosave"] = False
+    return TaskStore(
+        ctx.obj.get("data_file", "tasks.json"),
+        fsync=fsync,
+        compact=ctx.obj.get("compact"),
+        write_delay=write_delay or None,
+        write_threshold=write_threshold,
+    )
+
+
+def echo_write_stats(store: TaskStore) -> None:
+    """Report on stderr the disk writes made for the mutations."""
+    stats = store.write_stats()
+    if not stats["mutations"]:
+        return
+    message = (
+        f"{stats['mutations']} modifications écrites en "
+        f"{stats['journal_writes']} écritures du journal et "
+        f"{stats['snapshots']} sauvegardes"
+    )
+    if stats["write_amplification"] is not None:
+        message += f" (amplification {stats['write_amplification']})"
+    click.echo(message, err=True)
@@ -0,0 +1,43 @@
+"""Module cli to organize tasks in subtasks."""
+
+import click
+from src.tasks_manager.cli_tools.output_format import format_option
+from src.tasks_manager.utils.file_utils import display_tasks
+from src.tasks_manager.utils.subtasks import SubtaskTree, set_parent
+from src.tasks_manager.utils.task_events import cached_index
+
+
+def subtask_tree(obj):
+    """Return the subtask tree of a context object, building it once."""
+    return cached_index(obj, "subtask_tree", SubtaskTree.from_tasks)
+
+
+@click.command(name="subtasks")
+@click.argument("action", type=click.Choice(["attach", "detach", "open"]))
+@click.argument("task_id", type=int)
+@click.argument("parent_id", type=int, required=False)
+@format_option
+@click.pass_context
+def subtasks(ctx, action, task_id, parent_id, fmt):
+    """Gère les sous-tâches.
+
+    'attach TASK_ID PARENT_ID' fait de la tâche une sous-tâche de PARENT_ID,
+    'detach TASK_ID' la remet au premier niveau et 'open TASK_ID' liste ses
+    sous-tâches (à tous les niveaux) non terminées.
+    """
+    tree = subtask_tree(ctx.obj)
+    if action == "open":
+        tasks = tree.descendants(task_id, open_only=True)
+        display_tasks(
+            tasks, page=1, total_pages=1, total_tasks=len(tasks), fmt=fmt
+        )
+        return
+    if action == "attach" and parent_id is None:
+        raise click.UsageError("PARENT_ID est requis pour 'attach'.")
+    if action == "detach":
+        parent_id = None
+    set_parent(ctx.obj["tasks_list"], task_id, parent_id, tree=tree)
+    if parent_id is None:
+        click.echo(f"Tâche {task_id} remise au premier niveau")
+    else:
+        click.echo(f"Tâche {task_id} rattachée à la tâche {parent_id}")
@@ -1,6 +1,12 @@
 import click
-from src.tasks_manager.utils.task_tags import tags_manager
+from src.tasks_manager.utils.task_tags import tags_manager, bulk_tags_manager
 from src.tasks_manager.utils.file_utils import display_tasks
+from src.tasks_manager.utils.tag_dictionary import TagIndex
+from src.tasks_manager.utils.task_events import cached_index
+from src.tasks_manager.cli_tools.output_format import (
+    format_option,
+    echo_status,
+)
 
 
 @click.command(name="tags_manager")
@@ -9,8 +15,9 @@ from src.tasks_manager.utils.file_utils import display_tasks
     "action", type=click.Choice(["add", "remove", "filter", "get_all_tags"])
 )
 @click.argument("tags", nargs=-1)
+@format_option
 @click.pass_context
-def tags_cli(ctx, task_id, action, tags):
+def tags_cli(ctx, task_id, action, tags, fmt):
     """Manage tags for a specific task.
 
     ACTION can be 'add', 'remove', 'filter', or 'get_all_tags'.
@@ -25,25 +32,97 @@ def tags_cli(ctx, task_id, action, tags):
         click.echo("No tag provided to remove.")
         return
 
+    index = None
+    if action in ("filter", "get_all_tags"):
+        index = cached_index(ctx.obj, "tag_index", TagIndex.from_tasks)
+
     updated_task, updated_tasks_list = tags_manager(
-        tasks_list, task_id, action, list(tags)
+        tasks_list, task_id, action, list(tags), index=index
     )
 
     click.get_current_context().obj["tasks_list"] = updated_tasks_list
-    click.echo(f"Task {task_id} updated successfully with action '{action}'.")
+    echo_status(
+        f"Task {task_id} updated successfully with action '{action}'.", fmt
+    )
     if action == "get_all_tags":
-        click.echo("All tags with usage:")
+        echo_status("All tags with usage:", fmt)
         for tag, count in updated_task.items():
-            click.echo(f"{tag}: {count}")
+            echo_status(f"{tag}: {count}", fmt)
+        return
 
+    # Only the tasks concerned by the action are rendered
     if action == "filter":
-        click.echo("Filtered tasks:")
+        echo_status("Filtered tasks:", fmt)
         for task in updated_task:
-            click.echo(f"Task ID: {task['id']}, Tags: {task.get('tags', [])}")
+            echo_status(
+                f"Task ID: {task['id']}, Tags: {task.get('tags', [])}", fmt
+            )
+        shown = updated_task
+    else:
+        shown = [updated_task]
 
     display_tasks(
-        updated_tasks_list,
+        shown,
         page=1,
         total_pages=1,
-        total_tasks=len(updated_tasks_list),
+        total_tasks=len(shown),
+        fmt=fmt,
+    )
+
+
+@click.command(name="bulk_tags")
+@click.argument(
+    "action", type=click.Choice(["add", "remove", "rename", "merge"])
+)
+@click.argument("tags", nargs=-1, required=True)
+@click.option(
+    "--to",
+    "target",
+    default=None,
+    help="Target tag (required for 'rename' and 'merge' actions).",
+)
+@click.option(
+    "--status",
+    type=click.Choice(["TODO", "ONGOING", "DONE"]),
+    help="Only update tasks with this status.",
+)
+@click.option(
+    "--priority",
+    type=click.Choice(["LOW", "NORMAL", "HIGH", "CRITICAL"]),
+    help="Only update tasks with this priority.",
+)
+@click.option(
+    "--search",
+    type=str,
+    help="Only update tasks whose title or description contain a keyword.",
+)
+@click.option(
+    "--tag",
+    "tag_filter",
+    default=None,
+    help="Only update tasks that already have this tag.",
+)
+@click.pass_context
+def bulk_tags_cli(
+    ctx, action, tags, target, status, priority, search, tag_filter
+):
+    """Manage tags for every task matching the filters.
+
+    ACTION can be 'add', 'remove', 'rename' or 'merge'.
+    """
+    tasks_list = ctx.obj["tasks_list"]
+
+    updated, updated_tasks_list = bulk_tags_manager(
+        tasks_list,
+        action,
+        list(tags),
+        target=target,
+        status=status,
+        priority=priority,
+        search=search,
+        tag=tag_filter,
+        index=cached_index(ctx.obj, "tag_index", TagIndex.from_tasks),
     )
+
+    ctx.obj["tasks_list"] = updated_tasks_list
+    click.echo(f"{updated} task(s) updated with action '{action}'.")
@@ -1,11 +1,27 @@
+import warnings
+
 import click
 
-from src.tasks_manager.utils.task_deadline import DeadlineTask
+from src.classes.errors import TaskNotFoundError
+from src.tasks_manager.utils.task_deadline import (
+    DeadlineTask,
+    DeadlineIndex,
+    query_deadlines,
+    schedule_deadlines,
+    load_deadline_mapping,
+)
+from src.tasks_manager.utils.query_utils import task_matcher
 from src.tasks_manager.utils.file_utils import display_tasks
+from src.tasks_manager.utils.recurrence import RecurrenceIndex
+from src.tasks_manager.utils.task_events import cached_index
+from src.tasks_manager.cli_tools.output_format import (
+    format_option,
+    echo_status,
+)
 
 
 @click.command(name="task_sheduler")
-@click.argument("task_id", type=int)
+@click.argument("task_id", type=int, required=False)
 @click.option(
     "--add_deadline",
     type=bool,
@@ -32,13 +48,95 @@ from src.tasks_manager.utils.file_utils import display_tasks
     type=str,
     help="Deadline to be added or modified in 'YYYY-MM-DD' format",
 )
+@click.option(
+    "--overdue", is_flag=True, help="List unfinished tasks past their deadline"
+)
+@click.option(
+    "--due-within",
+    type=int,
+    metavar="N",
+    help="List tasks due in the next N days",
+)
+@click.option(
+    "--due-between",
+    nargs=2,
+    type=str,
+    metavar="START END",
+    help="List tasks due between two 'YYYY-MM-DD' dates",
+)
+@click.option(
+    "--bulk",
+    is_flag=True,
+    help="Set deadlines on many tasks at once (see --ids, --mapping)",
+)
+@click.option(
+    "--ids",
+    type=str,
+    help="Bulk mode: comma-separated task IDs, e.g. '1,2,3'",
+)
+@click.option(
+    "--mapping",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Bulk mode: JSON or CSV file mapping task IDs to deadlines",
+)
+@click.option(
+    "--status",
+    type=click.Choice(["TODO", "ONGOING", "DONE"]),
+    help="Bulk mode: only tasks with this status",
+)
+@click.option("--tag", type=str, help="Bulk mode: only tasks with this tag")
+@click.option(
+    "--search", type=str, help="Bulk mode: only tasks matching a keyword"
+)
+@format_option
 @click.pass_context
 def task_deadline(
-    ctx, task_id, add_deadline, modify_deadline, remove_deadline, deadline
+    ctx,
+    task_id,
+    add_deadline,
+    modify_deadline,
+    remove_deadline,
+    deadline,
+    overdue,
+    due_within,
+    due_between,
+    bulk,
+    ids,
+    mapping,
+    status,
+    tag,
+    search,
+    fmt,
 ):
     """Manage deadlines for tasks."""
     tasks_list = ctx.obj["tasks_list"]
 
+    if bulk:
+        _schedule_bulk(tasks_list, deadline, ids, mapping, status, tag, search)
+        return
+
+    if overdue or due_within is not None or due_between:
+        index = cached_index(
+            ctx.obj, "deadline_index", DeadlineIndex.from_tasks
+        )
+        tasks = query_deadlines(
+            tasks_list,
+            overdue,
+            due_within,
+            due_between,
+            index=index,
+            occurrences=cached_index(
+                ctx.obj, "recurrence_index", RecurrenceIndex.from_tasks
+            ),
+        )
+        display_tasks(
+            tasks, page=1, total_pages=1, total_tasks=len(tasks), fmt=fmt
+        )
+        return
+
+    if task_id is None:
+        raise click.UsageError("TASK_ID is required to manage a deadline.")
+
     deadline_task = DeadlineTask(
         task_list=tasks_list, task_id=task_id, deadline=deadline
     )
@@ -46,18 +144,91 @@ def task_deadline(
     if add_deadline:
         deadline_task.add_deadline_to_task()
 
-        click.echo(f"Deadline '{deadline}' added to task ID {task_id}.")
+        echo_status(f"Deadline '{deadline}' added to task ID {task_id}.", fmt)
 
     if modify_deadline:
         deadline_task.modify_task_deadline()
-        click.echo(
-            f"Deadline modified to '{modify_deadline}' for task ID {task_id}."
+        echo_status(
+            f"Deadline modified to '{modify_deadline}' for task ID {task_id}.",
+            fmt,
         )
 
     if remove_deadline:
         deadline_task.remove_deadline_from_task()
-        click.echo(f"Deadline removed from task ID {task_id}.")
+        echo_status(f"Deadline removed from task ID {task_id}.", fmt)
 
     task = deadline_task.task
 
-    display_tasks([task], page=1, total_pages=1, total_tasks=len(tasks_list))
+    display_tasks(
+        [task],
+        page=1,
+        total_pages=1,
+        total_tasks=len(tasks_list),
+        fmt=fmt,
+    )
+
+
+def _bulk_selector(tasks_list, ids, status, tag, search):
+    """Builds the filter of the tasks given a deadline in bulk mode.
+
+    Raises TaskNotFoundError if an ID of `ids` matches no task.
+    """
+    if not (ids or status or tag or search):
+        raise click.UsageError(
+            "Bulk mode with --deadline needs --ids, --status, --tag or "
+            "--search to select the tasks."
+        )
+    matches = task_matcher(status=status, tag=tag, search=search)
+    if not ids:
+        return matches
+    try:
+        task_ids = {int(task_id) for task_id in ids.split(",")}
+    except ValueError:
+        raise click.BadParameter(
+            "IDs must be comma-separated integers.", param_hint="--ids"
+        )
+    missing = sorted(task_ids - {task["id"] for task in tasks_list})
+    if missing:
+        raise TaskNotFoundError(
+            f"Tasks not found with IDs {', '.join(map(str, missing))}."
+        )
+    return lambda task: task["id"] in task_ids and matches(task)
+
+
+def _schedule_bulk(tasks_list, deadline, ids, mapping, status, tag, search):
+    """Applies the bulk mode of task_sheduler."""
+    if (deadline is None) == (mapping is None):
+        raise click.UsageError(
+            "Bulk mode needs either --deadline or --mapping."
+        )
+
+    if mapping:
+        if ids or status or tag or search:
+            raise click.UsageError(
+                "--mapping selects the tasks itself and cannot be combined "
+                "with --ids, --status, --tag or --search."
+            )
+        select = None
+        assignments = load_deadline_mapping(mapping)
+    else:
+        select = _bulk_selector(tasks_list, ids, status, tag, search)
+        assignments = None
+
+    # Past deadlines are reported once below instead of as a warning
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        updated, past = schedule_deadlines(
+            tasks_list,
+            deadline=deadline,
+            select=select,
+            assignments=assignments,
+        )
+
+    click.echo(f"Deadline set for {len(updated)} task(s).")
+    if past:
+        shown = ", ".join(str(task_id) for task_id in past[:10])
+        if len(past) > 10:
+            shown += ", ..."
+        click.echo(
+            f"Warning: {len(past)} deadline(s) are in the past (IDs: {shown})."
+        )
@@ -1,5 +1,8 @@
 """Module cli to view tasks in Task Manager application."""
 
+import sys
+import time
+
 import click
 from src.tasks_manager.utils.query_utils import (
     get_tasks,
@@ -8,7 +11,24 @@ from src.tasks_manager.utils.query_utils import (
     search_tasks,
     sorted_task,
 )
-from src.tasks_manager.utils.file_utils import display_tasks
+from src.tasks_manager.utils.task_deadline import (
+    DeadlineIndex,
+    query_deadlines,
+)
+from src.tasks_manager.utils.file_utils import (
+    MACHINE_FORMATS,
+    display_tasks,
+    resolve_format,
+    stream_tasks,
+)
+from src.tasks_manager.utils.file_watcher import FileWatcher
+from src.tasks_manager.cli_tools.output_format import (
+    format_option,
+    echo_page_status,
+)
+from src.tasks_manager.utils.recurrence import RecurrenceIndex
+from src.tasks_manager.utils.task_events import cached_index
+from src.tasks_manager.utils.task_mirror import TaskMirror
 # from src.classes.errors import TaskNotFoundError
 
 
@@ -19,6 +39,12 @@ from src.tasks_manager.utils.file_utils import display_tasks
     help="Filtrer par statut",
 )
 @click.option("--id", type=int, help="Afficher une tâche par ID")
+@click.option(
+    "--tree",
+    type=int,
+    metavar="ID",
+    help="Afficher l'arbre des sous-tâches d'une tâche avec leur avancement",
+)
 @click.option(
     "--search",
     type=str,
@@ -27,20 +53,200 @@ from src.tasks_manager.utils.file_utils import display_tasks
 @click.option(
     "--sort_by",
     type=click.Choice(["title", "created_at", "status"]),
-    default="created_at",
+    default=None,
+    help="Tri des tâches (par défaut : ordre de la liste ou des échéances)",
 )
 @click.option("--asc/--desc", default=True, help="Ordre croissant/décroissant")
 @click.option("--page", default=1, help="Numéro de la page")
 @click.option("--size", default=10, help="Nombre de tâches par page")
+@click.option("--overdue", is_flag=True, help="Tâches non terminées en retard")
+@click.option(
+    "--due-within",
+    type=int,
+    metavar="N",
+    help="Tâches dont l'échéance tombe dans les N prochains jours",
+)
+@click.option(
+    "--due-between",
+    nargs=2,
+    type=str,
+    metavar="DEBUT FIN",
+    help="Tâches dont l'échéance est entre deux dates 'YYYY-MM-DD'",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Nombre de processus pour filtrer et trier les grandes listes",
+)
+@format_option
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Garde la vue ouverte et la rafraîchit quand les tâches changent",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.05),
+    default=0.5,
+    show_default=True,
+    help="Intervalle minimal de scrutation en secondes (avec --watch)",
+)
 @click.pass_context
-def view_tasks(ctx, status, id, search, sort_by, asc, page, size):
+def view_tasks(
+    ctx,
+    status,
+    id,
+    tree,
+    search,
+    sort_by,
+    asc,
+    page,
+    size,
+    overdue,
+    due_within,
+    due_between,
+    jobs,
+    fmt,
+    watch,
+    interval,
+):
     """Affiche les tâches avec options de filtre, tri et pagination"""
-    tasks_list = ctx.obj["tasks_list"]
+    if tree is not None:
+        show_tree(ctx.obj, tree, status, fmt)
+        return
+
+    def select():
+        return _select_page(
+            ctx.obj,
+            status=status,
+            id=id,
+            search=search,
+            sort_by=sort_by,
+            asc=asc,
+            page=page,
+            size=size,
+            overdue=overdue,
+            due_within=due_within,
+            due_between=due_between,
+            jobs=jobs,
+        )
+
+    if not watch:
+        paginated_tasks, total_tasks, total_pages = select()
+        echo_page_status(page, total_pages, total_tasks, fmt)
+        display_tasks(paginated_tasks, page, total_pages, total_tasks, fmt=fmt)
+        return
+
+    ctx.obj["autosave"] = False
+    # la vue ne modifie rien : les changements rechargés par le miroir ne
+    # sont pas des opérations à annuler
+    op_log = ctx.obj.get("op_log")
+    if op_log is not None:
+        op_log.discard()
+    data_file = ctx.obj.get("data_file", "tasks.json")
+    mirror = TaskMirror(ctx.obj, data_file)
+    watcher = FileWatcher(
+        [data_file, mirror.journal_file], min_interval=interval
+    )
+    clear = resolve_format(fmt) == "table" and sys.stdout.isatty()
+
+    def show(selection):
+        paginated_tasks, total_tasks, total_pages = selection
+        if clear:
+            click.clear()
+        echo_page_status(page, total_pages, total_tasks, fmt)
+        display_tasks(paginated_tasks, page, total_pages, total_tasks, fmt=fmt)
+
+    try:
+        watch_page(watcher, mirror, select, show)
+    except KeyboardInterrupt:
+        pass
+
+    # except TaskNotFoundError as e:
+    #     click.echo(str(e), err=True)
+    # except Exception as e:
+    #     click.echo(f"Erreur : {e}", err=True)
+
+
+def show_tree(obj, task_id, status=None, fmt=None):
+    """Affiche le sous-arbre d'une tâche, indenté, avec les rollups.
+
+    Seul le sous-arbre est lu, grâce à l'index des chemins matérialisés.
+    """
+    from src.tasks_manager.cli_tools.subtasks import subtask_tree
+
+    index = subtask_tree(obj)
+    tasks = index.subtree(task_id)
+    if status:
+        tasks = [task for task in tasks if task["status"] == status]
+    fmt = resolve_format(fmt)
+    if fmt in MACHINE_FORMATS:
+        stream_tasks(tasks, fmt)
+        return
+    root_depth = index.depth(task_id)
+    for task in tasks:
+        indent = "  " * (index.depth(task["id"]) - root_depth)
+        line = f"{indent}[{task['id']}] {task['title']} ({task['status']})"
+        rollup = index.rollup(task["id"])
+        if rollup["tasks"] > 1:
+            line += (
+                f" — {rollup['done']}/{rollup['tasks']} faites "
+                f"({rollup['percent_done']:g} %), "
+                f"priorité max {rollup['max_priority']}"
+            )
+        click.echo(line)
+
+
+def _select_page(
+    obj,
+    status,
+    id,
+    search,
+    sort_by,
+    asc,
+    page,
+    size,
+    overdue,
+    due_within,
+    due_between,
+    jobs=1,
+):
+    """Filtre, trie et pagine les tâches de `obj`."""
+    tasks_list = obj["tasks_list"]
+
+    if overdue or due_within is not None or due_between:
+        index = cached_index(obj, "deadline_index", DeadlineIndex.from_tasks)
+        tasks_list = query_deadlines(
+            tasks_list,
+            overdue,
+            due_within,
+            due_between,
+            index=index,
+            occurrences=cached_index(
+                obj, "recurrence_index", RecurrenceIndex.from_tasks
+            ),
+        )
 
     if id is not None:
         task = filter_by_id(id, tasks_list)
         tasks_list = [task] if task else []
 
+    if jobs > 1:
+        # multiprocessing n'est importé que pour les scans parallèles
+        from src.tasks_manager.utils.parallel_scan import parallel_scan
+
+        tasks_list = parallel_scan(
+            tasks_list,
+            status=status,
+            search=search,
+            sort_by=sort_by,
+            ascending=asc,
+            workers=jobs,
+        )
+        return get_tasks(page, size, tasks_list)
+
     # Filtrage
     if status:
         tasks_list = filter_tasks_by_status(status, tasks_list)
@@ -52,12 +258,28 @@ def view_tasks(ctx, status, id, search, sort_by, asc, page, size):
         tasks_list = sorted_task(tasks_list, sort_by=sort_by, ascending=asc)
 
     # Pagination
-    paginated_tasks, total_tasks, total_pages = get_tasks(
-        page, size, tasks_list
-    )
-    display_tasks(paginated_tasks, page, total_pages, total_tasks)
+    return get_tasks(page, size, tasks_list)
 
-    # except TaskNotFoundError as e:
-    #     click.echo(str(e), err=True)
-    # except Exception as e:
-    #     click.echo(f"Erreur : {e}", err=True)
+
+def watch_page(
+    watcher, mirror, select, show, sleep=time.sleep, should_stop=None
+):
+    """Affiche la page puis la ré-affiche à chaque changement visible.
+
+    Seuls les enregistrements modifiés sont appliqués au miroir, et la
+    page n'est redessinée que si son contenu ou ses totaux ont changé.
+    Retourne le nombre d'affichages.
+    """
+    selection = select()
+    show(selection)
+    renders = 1
+    while should_stop is None or not should_stop():
+        sleep(watcher.interval)
+        if not watcher.changed() or not mirror.refresh():
+            continue
+        current = select()
+        if current != selection:
+            selection = current
+            show(selection)
+            renders += 1
+    return renders
@@ -0,0 +1,250 @@
+"""Module to write incremental backups of the tasks and restore them.
+
+A backup is either full (every task) or a delta holding only the tasks
+added or changed since the previous backup, found by comparing per-task
+hashes, and the IDs of the deleted ones. Deltas are chained to the last
+full backup; a new full backup starts a chain every `full_every` backups,
+which bounds the number of deltas read by a restore.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.classes.errors import TaskValidationError
+
+BACKUP_DIR = "backups"
+FULL_EVERY = 24
+_STATE_MODULUS = 1 << 128
+
+
+def task_hash(task: Dict) -> str:
+    """Hash of a task record, independent of the order of its fields."""
+    data = json.dumps(task, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _combine(state: int, added: str = None, removed: str = None) -> int:
+    """Update an order-independent hash of all the records.
+
+    The sum of the record hashes changes in O(1) when one record changes,
+    so the state of each backup is checked without hashing every task.
+    """
+    if added is not None:
+        state += int(added, 16)
+    if removed is not None:
+        state -= int(removed, 16)
+    return state % _STATE_MODULUS
+
+
+class BackupSet:
+    """Manifest and files of the backups kept in `directory`.
+
+    The manifest (one JSON line per backup) is written last, so a backup
+    interrupted before it is ignored.
+    """
+
+    def __init__(self, directory: str = BACKUP_DIR):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.jsonl")
+        self.hashes_path = os.path.join(directory, "hashes.json.gz")
+
+    def entries(self) -> List[Dict]:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    # --- Écriture ---
+
+    def _previous_hashes(self, entries: List[Dict]) -> Dict[int, str]:
+        """Task hashes of the last backup, rebuilt if the cache is stale."""
+        try:
+            with open(self.hashes_path, "rb") as f:
+                cached = json.loads(gzip.decompress(f.read()))
+            if cached["n"] == entries[-1]["n"]:
+                return {int(k): v for k, v in cached["hashes"].items()}
+        except (OSError, ValueError, KeyError, EOFError):
+            pass
+        return {
+            task["id"]: task_hash(task)
+            for task in self.restore_entry(entries, len(entries) - 1)
+        }
+
+    def _write(self, name: str, payload: Dict) -> Tuple[int, str]:
+        """Write a gzipped JSON file atomically; return its size and sha256."""
+        path = os.path.join(self.directory, name)
+        data = gzip.compress(
+            json.dumps(payload, ensure_ascii=False).encode("utf-8"), mtime=0
+        )
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(data)
+        os.replace(f"{path}.tmp", path)
+        return len(data), hashlib.sha256(data).hexdigest()
+
+    def backup(
+        self,
+        tasks_list: List[Dict],
+        full: bool = False,
+        full_every: int = FULL_EVERY,
+        now: datetime = None,
+    ) -> Dict:
+        """Write a backup of `tasks_list` and return its manifest entry."""
+        os.makedirs(self.directory, exist_ok=True)
+        entries = self.entries()
+        hashes = {task["id"]: task_hash(task) for task in tasks_list}
+        chain = 0
+        for entry in reversed(entries):
+            chain += 1
+            if entry["kind"] == "full":
+                break
+        full = full or not entries or chain >= full_every
+
+        number = entries[-1]["n"] + 1 if entries else 1
+        state = 0
+        if full:
+            kind, payload = "full", {"tasks": tasks_list}
+            for value in hashes.values():
+                state = _combine(state, value)
+            changed, deleted = len(tasks_list), 0
+        else:
+            previous = self._previous_hashes(entries)
+            state = int(entries[-1]["state"], 16)
+            upserts = []
+            for task in tasks_list:
+                old = previous.pop(task["id"], None)
+                if old != hashes[task["id"]]:
+                    upserts.append(task)
+                    state = _combine(state, hashes[task["id"]], old)
+            for value in previous.values():
+                state = _combine(state, removed=value)
+            kind = "delta"
+            payload = {"upserts": upserts, "deletes": sorted(previous)}
+            changed, deleted = len(upserts), len(previous)
+
+        name = f"backup-{number:06d}-{kind}.json.gz"
+        size, digest = self._write(name, payload)
+        # cache des empreintes pour le prochain delta
+        self._write(
+            os.path.basename(self.hashes_path),
+            {"n": number, "hashes": hashes},
+        )
+        entry = {
+            "n": number,
+            "ts": (now or datetime.now()).isoformat(timespec="seconds"),
+            "kind": kind,
+            "file": name,
+            "tasks": len(tasks_list),
+            "changed": changed,
+            "deleted": deleted,
+            "bytes": size,
+            "sha256": digest,
+            "state": f"{state:032x}",
+        }
+        with open(self.manifest_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        return entry
+
+    # --- Lecture ---
+
+    def _read(self, entry: Dict) -> Dict:
+        path = os.path.join(self.directory, entry["file"])
+        with open(path, "rb") as f:
+            return json.loads(gzip.decompress(f.read()))
+
+    def _chain(self, entries: List[Dict], position: int) -> List[Dict]:
+        """The last full backup up to `position` and the deltas after it."""
+        start = position
+        while entries[start]["kind"] != "full":
+            start -= 1
+            if start < 0:
+                raise TaskValidationError(
+                    "Chaîne de sauvegardes incomplète : aucune sauvegarde "
+                    "complète."
+                )
+        return entries[start:position + 1]
+
+    def restore_entry(self, entries: List[Dict], position: int) -> List[Dict]:
+        """Tasks as saved by `entries[position]`, ordered by ID."""
+        tasks = {}
+        for entry in self._chain(entries, position):
+            payload = self._read(entry)
+            if entry["kind"] == "full":
+                tasks = {task["id"]: task for task in payload["tasks"]}
+                continue
+            for task in payload["upserts"]:
+                tasks[task["id"]] = task
+            for task_id in payload["deletes"]:
+                tasks.pop(task_id, None)
+        return [tasks[task_id] for task_id in sorted(tasks)]
+
+    def find(self, at: datetime = None) -> Tuple[List[Dict], int]:
+        """Entries and position of the last backup made at or before `at`."""
+        entries = self.entries()
+        position = len(entries) - 1
+        if at is not None:
+            while (
+                position >= 0
+                and datetime.fromisoformat(entries[position]["ts"]) > at
+            ):
+                position -= 1
+        if position < 0:
+            raise TaskValidationError(
+                "Aucune sauvegarde"
+                + (f" antérieure au {at.isoformat()}" if at else "")
+                + f" dans {self.directory}."
+            )
+        return entries, position
+
+    def restore(self, at: datetime = None) -> Tuple[Dict, List[Dict]]:
+        """Entry and tasks of the last backup made at or before `at`."""
+        entries, position = self.find(at)
+        return entries[position], self.restore_entry(entries, position)
+
+    def verify(self) -> Iterator[Tuple[Dict, Optional[str]]]:
+        """Check every backup: file checksum, chain and state hash.
+
+        Yields each manifest entry with None, or with the problem found.
+        The chains are replayed once, updating the per-task hashes.
+        """
+        hashes: Optional[Dict[int, str]] = None
+        state = 0
+        for entry in self.entries():
+            path = os.path.join(self.directory, entry["file"])
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                hashes = None
+                yield entry, "fichier manquant"
+                continue
+            if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                yield entry, "somme de contrôle invalide"
+                hashes = None
+                continue
+            payload = json.loads(gzip.decompress(data))
+            if entry["kind"] == "full":
+                hashes, state = {}, 0
+                for task in payload["tasks"]:
+                    hashes[task["id"]] = task_hash(task)
+                    state = _combine(state, hashes[task["id"]])
+            elif hashes is None:
+                yield entry, "chaîne rompue (sauvegarde précédente invalide)"
+                continue
+            else:
+                for task in payload["upserts"]:
+                    value = task_hash(task)
+                    state = _combine(state, value, hashes.get(task["id"]))
+                    hashes[task["id"]] = value
+                for task_id in payload["deletes"]:
+                    state = _combine(state, removed=hashes.pop(task_id, None))
+            restored = f"{state:032x}", len(hashes)
+            if restored != (entry["state"], entry["tasks"]):
+                yield entry, "état reconstruit différent de l'état sauvegardé"
+                hashes = None
+                continue
+            yield entry, None
@@ -7,6 +7,7 @@ from src.classes.errors import (
     TaskValidationError,
     TaskNotFoundError,
 )
+from src.tasks_manager.utils.task_events import emit
 
 
 VALID_STATUSES = {"TODO", "ONGOING", "DONE"}
@@ -46,6 +47,7 @@ def _create_task(
     }
 
     tasks_list.append(new_task)
+    emit("create", new_task)
 
     return new_task, tasks_list
 
@@ -70,6 +72,10 @@ def _modify_task(
 
     for task in tasks_list:
         if task["id"] == task_id:
+            previous = {
+                "title": task["title"],
+                "description": task.get("description", ""),
+            }
             if title is not None:
                 title = title.strip()
                 if title == "":
@@ -87,8 +93,10 @@ def _modify_task(
                     )
                 task["description"] = description
 
+            emit("modify", task, previous)
             return task, tasks_list
-        raise TaskNotFoundError(f"Tâche avec l'ID {task_id} non trouvée.")
+
+    raise TaskNotFoundError(f"Tâche avec l'ID {task_id} non trouvée.")
 
 
 def _change_task_status(
@@ -97,7 +105,6 @@ def _change_task_status(
     new_status: str,
 ) -> Tuple[Dict, List[Dict]]:
     """Change le statut d'une tâche existante"""
-    print(new_status)
     if new_status not in VALID_STATUSES:
         raise TaskValidationError(
             "Statut invalide. Valeurs autorisées : TODO, ONGOING, DONE"
@@ -105,17 +112,57 @@ def _change_task_status(
 
     for task in tasks_list:
         if task["id"] == task_id:
+            previous = task["status"]
             task["status"] = new_status
+            emit("status", task, {"status": previous})
             return task, tasks_list
 
     raise TaskNotFoundError(f"Tâche avec l'ID {task_id} non trouvée.")
 
 
-def _delete_task(task_id: int, tasks_list: List[Dict]) -> List[Dict]:
-    """Supprime une tâche par son ID et retourne la liste mise à jour"""
-    updated_tasks = [task for task in tasks_list if task["id"] != task_id]
+def _delete_task(
+    task_id: int, tasks_list: List[Dict], dependencies=None
+) -> List[Dict]:
+    """Supprime une tâche par son ID et retourne la liste mise à jour
 
-    if len(updated_tasks) == len(tasks_list):
+    Les tâches bloquées par la tâche supprimée ne le sont plus : avec un
+    graphe de dépendances (`dependencies`), elles sont trouvées par son index
+    inverse, sinon pendant le parcours de la liste. Ses sous-tâches sont
+    rattachées à son parent.
+    """
+    updated_tasks = []
+    deleted_task = None
+    blocked = []
+    children = []
+    for task in tasks_list:
+        if task["id"] == task_id:
+            deleted_task = task
+        else:
+            updated_tasks.append(task)
+            if dependencies is None and task_id in task.get("blocked_by", ()):
+                blocked.append(task)
+            if task.get("parent") == task_id:
+                children.append(task)
+
+    if deleted_task is None:
         raise TaskNotFoundError(f"Tâche avec l'ID {task_id} non trouvée.")
 
+    if dependencies is not None:
+        blocked = [
+            dependencies.tasks[tid]
+            for tid in sorted(dependencies.dependents.get(task_id, ()))
+        ]
+    for task in blocked:
+        previous = task["blocked_by"]
+        task["blocked_by"] = [tid for tid in previous if tid != task_id]
+        if not task["blocked_by"]:
+            del task["blocked_by"]
+        emit("dependencies", task, {"blocked_by": previous})
+    for task in children:
+        if deleted_task.get("parent") is None:
+            del task["parent"]
+        else:
+            task["parent"] = deleted_task["parent"]
+        emit("parent", task, {"parent": task_id})
+    emit("delete", deleted_task)
     return updated_tasks
@@ -2,15 +2,35 @@
 
 import json
 import os
-from typing import List, Dict
-from rich.console import Console
-from rich.table import Table
+import sys
+from typing import Iterable, List, Dict, TextIO
 
-console = Console()
+from src.tasks_manager.utils.tag_dictionary import encode_tags, decode_tags
+from src.tasks_manager.utils.timings import timed
+
+# rich n'est importé qu'au premier affichage en tableau
+_console = None
 
 DATA_FILE = "tasks.json"
+COMPACT_FORMAT = "compact"
+
+# Formats de sortie : "table" (rich) est réservé aux terminaux interactifs,
+# les autres écrivent les tâches ligne par ligne sans construire de tableau
+OUTPUT_FORMATS = ("table", "plain", "tsv", "json", "ndjson")
+MACHINE_FORMATS = ("tsv", "json", "ndjson")
+TSV_FIELDS = (
+    "id",
+    "status",
+    "title",
+    "description",
+    "created_at",
+    "deadline",
+    "tags",
+    "priority",
+)
 
 
+@timed("load")
 def _load_tasks(data_file=DATA_FILE) -> List[Dict]:
     """Charge les tâches depuis le fichier JSON"""
     if not os.path.exists(data_file):
@@ -21,21 +41,129 @@ def _load_tasks(data_file=DATA_FILE) -> List[Dict]:
             indent=2,
         )
     with open(data_file, "r", encoding="utf-8") as f:
-        return json.load(f)
+        data = json.load(f)
+    if isinstance(data, dict) and data.get("format") == COMPACT_FORMAT:
+        return decode_tags(data["tag_dictionary"], data["tasks"])
+    return data
+
+
+@timed("save")
+def _write_tasks(
+    tasks_to_save: List[Dict], data_file=DATA_FILE, compact: bool = False
+):
+    """Écrit les tâches dans le fichier JSON, sans masquer les erreurs
+
+    Avec `compact`, les tags sont stockés sous forme d'identifiants
+    entiers accompagnés du dictionnaire des tags.
+    """
+    if compact:
+        names, tasks = encode_tags(tasks_to_save)
+        data = {
+            "format": COMPACT_FORMAT,
+            "tag_dictionary": names,
+            "tasks": tasks,
+        }
+    else:
+        data = tasks_to_save
+    with open(data_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def _save_tasks(tasks_to_save: List[Dict], data_file=DATA_FILE):
-    """Sauvegarde les tâches dans le fichier JSON"""
+def _save_tasks(
+    tasks_to_save: List[Dict], data_file=DATA_FILE, compact: bool = False
+):
+    """Sauvegarde les tâches dans le fichier JSON (voir `_write_tasks`)"""
     try:
-        with open(data_file, "w", encoding="utf-8") as f:
-            json.dump(tasks_to_save, f, ensure_ascii=False, indent=2)
+        _write_tasks(tasks_to_save, data_file=data_file, compact=compact)
     except IOError:
         pass
 
 
+def _is_compact_file(data_file=DATA_FILE) -> bool:
+    """Indique si le fichier de données utilise le format compact"""
+    try:
+        with open(data_file, "r", encoding="utf-8") as f:
+            return f.read(64).lstrip().startswith("{")
+    except IOError:
+        return False
+
+
+def resolve_format(fmt: str = None) -> str:
+    """Choisit le format de sortie : table pour un terminal, sinon plain"""
+    if fmt is not None:
+        return fmt
+    return "table" if sys.stdout.isatty() else "plain"
+
+
+def _tsv_cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        value = ",".join(value)
+    text = str(value)
+    return text.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+
+
+@timed("display")
+def stream_tasks(tasks: Iterable[Dict], fmt: str, out: TextIO = None):
+    """Écrit les tâches une à une sur `out` au format plain/tsv/json/ndjson"""
+    out = out or sys.stdout
+    if fmt == "plain":
+        for task in tasks:
+            tags = " ".join(f"#{tag}" for tag in task.get("tags") or [])
+            out.write(
+                f"{task['id']} [{task['status']}] {task['title']}"
+                f" | {task.get('deadline') or '-'}"
+                f" | {task.get('priority') or '-'}"
+                f"{' | ' + tags if tags else ''}\n"
+            )
+    elif fmt == "tsv":
+        out.write("\t".join(TSV_FIELDS) + "\n")
+        for task in tasks:
+            out.write(
+                "\t".join(_tsv_cell(task.get(field)) for field in TSV_FIELDS)
+                + "\n"
+            )
+    elif fmt == "ndjson":
+        for task in tasks:
+            out.write(json.dumps(task, ensure_ascii=False) + "\n")
+    elif fmt == "json":
+        separator = "\n"
+        out.write("[")
+        for task in tasks:
+            out.write(separator + json.dumps(task, ensure_ascii=False))
+            separator = ",\n"
+        out.write("\n]\n")
+    else:
+        raise ValueError(f"Format de sortie inconnu : {fmt}")
+
+
+def _get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+@timed("display")
 def display_tasks(
-    tasks: List[Dict], page: int, total_pages: int, total_tasks: int
+    tasks: List[Dict],
+    page: int,
+    total_pages: int,
+    total_tasks: int,
+    fmt: str = None,
 ):
+    """Affiche les tâches dans le format demandé (table sur un terminal)"""
+    fmt = resolve_format(fmt)
+    if fmt != "table":
+        stream_tasks(tasks, fmt)
+        return
+
+    from rich.table import Table
+
+    console = _get_console()
     table = Table(title=f"Liste des tâches (page {page}/{total_pages})")
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Statut", style="green")
@@ -0,0 +1,47 @@
+"""Module to detect changes of a data file by polling its metadata."""
+
+import os
+from typing import Optional, Sequence, Tuple, Union
+
+
+class FileWatcher:
+    """Detects changes of a file with `os.stat` polling and backoff.
+
+    The polling interval doubles each time nothing changed, from
+    `min_interval` up to `max_interval`, and drops back to `min_interval`
+    after a change, so an idle file costs a few stat calls per minute.
+    Several paths can be watched together.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Sequence[str]],
+        min_interval: float = 0.5,
+        max_interval: float = 8.0,
+    ):
+        self.paths = (path,) if isinstance(path, str) else tuple(path)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._signature = self._stat()
+
+    def _stat(self) -> Tuple[Optional[Tuple[int, int, int]], ...]:
+        signature = []
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                signature.append(None)
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        return tuple(signature)
+
+    def changed(self) -> bool:
+        """Return True if a file changed since the previous call."""
+        signature = self._stat()
+        if signature != self._signature:
+            self._signature = signature
+            self.interval = self.min_interval
+            return True
+        self.interval = min(self.interval * 2, self.max_interval)
+        return False
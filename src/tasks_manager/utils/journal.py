@@ -0,0 +1,241 @@
+"""Module to journal task mutations between two snapshots of the data file."""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+
+
+def journal_path(data_file: str) -> str:
+    """Path of the journal kept next to a data file."""
+    return f"{data_file}.journal"
+
+
+def journal_line(action: str, task: Dict) -> str:
+    """Serialize one journal entry, newline included."""
+    entry = {"action": action, "task": task}
+    return json.dumps(entry, ensure_ascii=False) + "\n"
+
+
+class Journal:
+    """Append-only log of the tasks touched by each mutation.
+
+    Subscribed to `task_events`, it writes one JSON line per event holding
+    the action and the task as it is after the mutation, so replaying the
+    lines in order on top of the last snapshot restores the tasks.
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self.entries = 0
+        self.writes = 0
+        self.bytes_written = 0
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __len__(self) -> int:
+        return self.entries
+
+    def record(self, action: str, task: Dict, previous: Dict = None) -> None:
+        """Append a mutation; meant to be subscribed to `task_events`."""
+        self.write([journal_line(action, task)])
+
+    def write(self, lines: Iterable[str]) -> int:
+        """Append lines in one write and return the number of bytes."""
+        lines = list(lines)
+        data = "".join(lines)
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        size = len(data.encode("utf-8"))
+        self.entries += len(lines)
+        self.writes += 1
+        self.bytes_written += size
+        return size
+
+    def sync(self) -> None:
+        """Force the entries written so far to disk."""
+        os.fsync(self._file.fileno())
+
+    def truncate(self) -> None:
+        """Forget the entries, once they are part of a snapshot."""
+        self._file.truncate(0)
+        self._file.seek(0)
+        self.entries = 0
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class BackgroundWriter:
+    """Thread coalescing the journal entries of bursts of mutations.
+
+    `record` replaces `Journal.record` as the `task_events` listener: it
+    only serializes the task and keeps the latest line of each task ID.
+    The thread writes the pending lines in a single write once `delay`
+    seconds have passed since the first of them, or as soon as
+    `threshold` tasks are dirty. `flush` is the barrier for callers that
+    need the entries on disk.
+    """
+
+    def __init__(
+        self, journal: Journal, delay: float = 1.0, threshold: int = 1000
+    ):
+        self.journal = journal
+        self.delay = delay
+        self.threshold = threshold
+        # Held while writing, so that a snapshot can truncate the journal
+        self.io_lock = threading.Lock()
+        self.mutations = 0
+        self.logical_bytes = 0
+        self.records_written = 0
+        self.syncs = 0
+        self._cond = threading.Condition()
+        self._dirty: Dict[int, str] = {}
+        self._since = None
+        self._flush_requested = False
+        self._sync_requested = False
+        self._stopping = False
+        self._flushed = 0
+        self._synced = 0
+        self._epoch = 0
+        self._thread = threading.Thread(
+            target=self._run, name="journal-writer", daemon=True
+        )
+        self._thread.start()
+
+    def record(self, action: str, task: Dict, previous: Dict = None) -> None:
+        """Queue a mutation; meant to be subscribed to `task_events`."""
+        line = journal_line(action, task)
+        with self._cond:
+            self._dirty[task["id"]] = line
+            self.mutations += 1
+            self.logical_bytes += len(line.encode("utf-8"))
+            if self._since is None:
+                self._since = time.monotonic()
+                self._cond.notify_all()
+            elif len(self._dirty) >= self.threshold:
+                self._cond.notify_all()
+
+    def flush(self, sync: bool = False) -> None:
+        """Wait until the mutations recorded so far are written.
+
+        With `sync`, also wait until they are forced to disk.
+        """
+        with self._cond:
+            target = self.mutations
+            done = self._flushed >= target
+            if done and (not sync or self._synced >= target):
+                return
+            self._flush_requested = True
+            self._sync_requested = self._sync_requested or sync
+            self._cond.notify_all()
+            while self._flushed < target or (sync and self._synced < target):
+                self._cond.wait()
+
+    def discard(self) -> None:
+        """Drop the pending lines, once a snapshot holds their tasks."""
+        with self._cond:
+            self._dirty = {}
+            self._since = None
+            self._epoch += 1
+            self._flushed = self._synced = self.mutations
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Write the pending lines and stop the thread."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def stats(self) -> Dict:
+        """Counters of the records saved by coalescing."""
+        with self._cond:
+            return {
+                "records_written": self.records_written,
+                "logical_bytes": self.logical_bytes,
+                "syncs": self.syncs,
+            }
+
+    def _due(self) -> bool:
+        if self._stopping or self._flush_requested:
+            return True
+        if not self._dirty:
+            return False
+        return (
+            len(self._dirty) >= self.threshold
+            or time.monotonic() - self._since >= self.delay
+        )
+
+    def _timeout(self):
+        if not self._dirty:
+            return None
+        return max(0.0, self._since + self.delay - time.monotonic())
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._due():
+                    self._cond.wait(self._timeout())
+                if self._stopping and not self._dirty:
+                    return
+                batch, self._dirty = self._dirty, {}
+                sync = self._sync_requested or self.journal.fsync
+                self._since = None
+                self._flush_requested = self._sync_requested = False
+                target, epoch = self.mutations, self._epoch
+            with self.io_lock:
+                if epoch != self._epoch:
+                    # A snapshot was taken meanwhile and holds these tasks
+                    batch = {}
+                if batch:
+                    self.journal.write(batch.values())
+                if sync and not self.journal.fsync:
+                    self.journal.sync()
+            with self._cond:
+                self.records_written += len(batch)
+                if sync:
+                    self.syncs += 1
+                    self._synced = max(self._synced, target)
+                self._flushed = max(self._flushed, target)
+                self._cond.notify_all()
+
+
+def replay_journal(
+    tasks_list: List[Dict], path: str
+) -> Tuple[List[Dict], int]:
+    """Apply the entries of a journal file to a task list.
+
+    A truncated last line, left by a crash during a write, is ignored.
+    Returns the task list and the number of entries replayed.
+    """
+    if not os.path.exists(path):
+        return tasks_list, 0
+
+    positions = {task["id"]: i for i, task in enumerate(tasks_list)}
+    deleted = set()
+    replayed = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            task = entry["task"]
+            if entry["action"] == "delete":
+                deleted.add(task["id"])
+            elif task["id"] in positions:
+                tasks_list[positions[task["id"]]] = task
+                deleted.discard(task["id"])
+            else:
+                positions[task["id"]] = len(tasks_list)
+                tasks_list.append(task)
+                deleted.discard(task["id"])
+            replayed += 1
+
+    if deleted:
+        tasks_list = [task for task in tasks_list if task["id"] not in deleted]
+    return tasks_list, replayed
@@ -0,0 +1,157 @@
+"""Module to measure the memory used by a CLI invocation with tracemalloc."""
+
+import os
+import sys
+import tracemalloc
+from typing import Dict, List, Optional
+
+from src.tasks_manager.utils.timings import PhaseTimer
+
+# Regroupement des champs d'une tâche pour le coût par tâche
+FIELD_GROUPS = {
+    "title": ("title",),
+    "description": ("description",),
+    "tags": ("tags",),
+    "timestamps": ("created_at", "deadline"),
+}
+TOP_SITES = 10
+# Profondeur des piles gardées, pour remonter d'un site (json...) au code
+# du gestionnaire qui l'a appelé
+TRACE_DEPTH = 12
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+# Allocations de la mesure elle-même, exclues des sites
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _size(value, seen: set) -> int:
+    """Size of `value` and of its items, counting shared objects once."""
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += _size(key, seen) + _size(item, seen)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            size += _size(item, seen)
+    return size
+
+
+def field_sizes(tasks_list: List[Dict]) -> Dict[str, int]:
+    """Bytes used by the tasks, per group of fields (see FIELD_GROUPS).
+
+    "dict" is the size of the task dicts themselves and "other" the fields
+    of no group. Objects shared between tasks, such as the keys decoded
+    by json or the status strings, are counted once.
+    """
+    group_of = {
+        field: group
+        for group, fields in FIELD_GROUPS.items()
+        for field in fields
+    }
+    sizes = dict.fromkeys(("dict", *FIELD_GROUPS, "other"), 0)
+    seen = set()
+    for task in tasks_list:
+        seen.add(id(task))
+        sizes["dict"] += sys.getsizeof(task)
+        for field, value in task.items():
+            group = group_of.get(field, "other")
+            sizes[group] += _size(field, seen) + _size(value, seen)
+    return sizes
+
+
+def _mb(size: float) -> str:
+    return f"{size / 2**20:8.2f} Mo"
+
+
+def _caller(traceback: tracemalloc.Traceback) -> Optional[str]:
+    """Innermost frame of the task manager code in an allocation stack."""
+    for frame in reversed(traceback):
+        if frame.filename.startswith(SOURCE_DIR):
+            relative = os.path.relpath(frame.filename, SOURCE_DIR)
+            return f"{relative}:{frame.lineno}"
+    return None
+
+
+class MemoryTimer(PhaseTimer):
+    """Phase timer also recording the memory peak of each phase.
+
+    The peak of a phase includes its nested phases; "kept" is the memory
+    still allocated when it ends.
+    """
+
+    def __init__(self, started: float = None):
+        super().__init__(started)
+        self.peaks: Dict[str, int] = {}
+        self.kept: Dict[str, int] = {}
+        self.peak = 0
+        self.sites = []
+        self._memory: List[list] = []
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(TRACE_DEPTH)
+        self._base = tracemalloc.get_traced_memory()[0]
+
+    def _fold_peak(self) -> int:
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in self._memory:
+            frame[1] = max(frame[1], peak)
+        self.peak = max(self.peak, peak - self._base)
+        return current
+
+    def push(self, name: str) -> None:
+        # le pic des phases ouvertes est retenu avant sa remise à zéro
+        current = self._fold_peak()
+        tracemalloc.reset_peak()
+        self._memory.append([current, current])
+        super().push(name)
+
+    def pop(self) -> None:
+        name = self._stack[-1][0]
+        super().pop()
+        current = self._fold_peak()
+        start, peak = self._memory.pop()
+        self.peaks[name] = max(self.peaks.get(name, 0), peak - start)
+        self.kept[name] = self.kept.get(name, 0) + current - start
+
+    def stop(self) -> None:
+        super().stop()
+        self._fold_peak()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        self.sites = snapshot.statistics("traceback")[:TOP_SITES]
+        if self._started_tracing:
+            tracemalloc.stop()
+
+    def memory_report(self, tasks_list: List[Dict] = None) -> str:
+        """Peaks per phase, allocation sites and bytes per task field."""
+        lines = ["Mémoire (tracemalloc) :"]
+        lines.append(f"  {'pic':<10} {_mb(self.peak)}")
+        for name in self.phases:
+            if name in self.peaks:
+                lines.append(
+                    f"  {name:<10} {_mb(self.peaks[name])} au pic,"
+                    f" {_mb(self.kept[name])} conservés"
+                )
+        lines.append("Principaux sites d'allocation (mémoire conservée) :")
+        for stat in self.sites:
+            frame = stat.traceback[-1]
+            site = f"{frame.filename}:{frame.lineno}"
+            caller = _caller(stat.traceback)
+            if caller is not None and not site.endswith(caller):
+                site += f" <- {caller}"
+            lines.append(f"  {_mb(stat.size)} {stat.count:8} blocs  {site}")
+        if tasks_list:
+            sizes = field_sizes(tasks_list)
+            count = len(tasks_list)
+            lines.append(
+                f"Octets par tâche ({count} tâches) :"
+                f" {sum(sizes.values()) / count:.0f}"
+            )
+            for group, size in sizes.items():
+                lines.append(f"  {group:<12} {size / count:8.1f}")
+        return "\n".join(lines)
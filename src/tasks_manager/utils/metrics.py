@@ -0,0 +1,305 @@
+"""Module to collect task metrics and export them in Prometheus format."""
+
+import os
+import re
+from collections import Counter as _Tally
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.tasks_manager.utils import timings
+from src.tasks_manager.utils.task_events import subscribe, unsubscribe
+
+# Fichier texte (collecteur textfile de node_exporter) mis à jour par la CLI
+METRICS_FILE_ENV = "TASK_MANAGER_METRICS_FILE"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+MUTATIONS = (
+    "create",
+    "modify",
+    "status",
+    "delete",
+    "tags",
+    "priority",
+    "deadline",
+    "recurrence",
+    "dependencies",
+    "parent",
+)
+ERRORS = ("TaskValidationError", "TaskNotFoundError")
+STATUSES = ("TODO", "ONGOING", "DONE")
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Sample = Tuple[str, str, float]
+
+_SAMPLE_LINE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{.*\})?\s+(\S+)$")
+
+
+def _escape(value: str) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+    )
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Tuple[str, ...], object] = {}
+
+    def samples(self) -> Iterator[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, value in list(self.values.items()):
+            yield self.name, _labels(self.labelnames, labels), value
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def set(self, *labels: str, value: float) -> None:
+        self.values[labels] = value
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, value in list(self.values.items()):
+            yield self.name, _labels(self.labelnames, labels), value
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets) + (float("inf"),)
+
+    def observe(self, *labels: str, value: float) -> None:
+        counts = self.values.get(labels)
+        if counts is None:
+            # un compteur par borne, puis la somme
+            counts = self.values[labels] = [0] * len(self.buckets) + [0.0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        counts[-1] += value
+
+    def samples(self) -> Iterator[Sample]:
+        names = self.labelnames + ("le",)
+        for labels, counts in list(self.values.items()):
+            cumulated = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulated += count
+                yield (
+                    f"{self.name}_bucket",
+                    _labels(names, labels + (_number(bound),)),
+                    cumulated,
+                )
+            label_text = _labels(self.labelnames, labels)
+            yield f"{self.name}_sum", label_text, counts[-1]
+            yield f"{self.name}_count", label_text, cumulated
+
+
+class MetricsRegistry:
+    """Metrics rendered together in the Prometheus text format.
+
+    Counters and histograms of a previous export can be loaded with
+    `load_previous`, so that short CLI runs add up in one textfile.
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, _Metric] = {}
+        self._previous: Dict[str, Dict[Tuple[str, str], float]] = {}
+
+    def _add(self, metric: _Metric) -> _Metric:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help, labelnames=()) -> Counter:
+        return self._add(Counter(name, help, labelnames))
+
+    def gauge(self, name, help, labelnames=()) -> Gauge:
+        return self._add(Gauge(name, help, labelnames))
+
+    def histogram(self, name, help, labelnames=(), **kw) -> Histogram:
+        return self._add(Histogram(name, help, labelnames, **kw))
+
+    def load_previous(self, text: str) -> None:
+        """Keep the counter and histogram samples of a previous export."""
+        self._previous = {}
+        family = None
+        for line in text.splitlines():
+            if line.startswith("# TYPE "):
+                _, _, name, kind = line.split(maxsplit=3)
+                family = name if kind in ("counter", "histogram") else None
+                continue
+            match = _SAMPLE_LINE.match(line)
+            if family is None or match is None:
+                continue
+            sample, labels, value = match.groups()
+            self._previous.setdefault(family, {})[(sample, labels or "")] = (
+                float(value)
+            )
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            samples = {
+                (sample, labels): value
+                for sample, labels, value in metric.samples()
+            }
+            for key, value in self._previous.get(metric.name, {}).items():
+                samples[key] = samples.get(key, 0) + value
+            for (sample, labels), value in samples.items():
+                lines.append(f"{sample}{labels} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class TaskMetrics:
+    """Metrics of the task manager, fed by `task_events` and `timed`."""
+
+    def __init__(self, registry: MetricsRegistry = None):
+        self.registry = registry or MetricsRegistry()
+        self.mutations = self.registry.counter(
+            "task_manager_mutations_total",
+            "Task mutations by type.",
+            ("action",),
+        )
+        self.errors = self.registry.counter(
+            "task_manager_errors_total",
+            "Task errors by exception type.",
+            ("type",),
+        )
+        self.latency = self.registry.histogram(
+            "task_manager_phase_duration_seconds",
+            "Duration of the load, save, query and display calls.",
+            ("phase",),
+        )
+        self.tasks = self.registry.gauge(
+            "task_manager_tasks",
+            "Tasks in the dataset by status.",
+            ("status",),
+        )
+        for action in MUTATIONS:
+            self.mutations.inc(action, amount=0)
+        for error in ERRORS:
+            self.errors.inc(error, amount=0)
+        subscribe(self.on_event)
+        timings.set_observer(self.on_phase)
+
+    def on_event(self, action: str, task: Dict, previous: Dict) -> None:
+        self.mutations.inc(action)
+
+    def on_phase(self, phase: str, seconds: float) -> None:
+        self.latency.observe(phase, value=seconds)
+
+    def record_error(self, error: BaseException) -> None:
+        self.errors.inc(type(error).__name__)
+
+    def render(self, tasks_list: List[Dict] = None) -> str:
+        """Prometheus text, with the status gauges of `tasks_list`."""
+        if tasks_list is not None:
+            counts = _Tally(task.get("status") for task in list(tasks_list))
+            for status in STATUSES + tuple(set(counts) - set(STATUSES)):
+                self.tasks.set(str(status), value=counts.get(status, 0))
+        return self.registry.render()
+
+    def close(self) -> None:
+        unsubscribe(self.on_event)
+        timings.set_observer(None)
+
+
+_metrics: Optional[TaskMetrics] = None
+
+
+def enable() -> TaskMetrics:
+    """Start collecting metrics in this process (once)."""
+    global _metrics
+    if _metrics is None:
+        _metrics = TaskMetrics()
+    return _metrics
+
+
+def disable() -> None:
+    global _metrics
+    if _metrics is not None:
+        _metrics.close()
+        _metrics = None
+
+
+def current() -> Optional[TaskMetrics]:
+    return _metrics
+
+
+def record_error(error: BaseException) -> None:
+    """Count an error if metrics are being collected."""
+    if _metrics is not None:
+        _metrics.record_error(error)
+
+
+def write_textfile(path: str, tasks_list: List[Dict] = None) -> None:
+    """Add the metrics of this run to a textfile, atomically.
+
+    A lock file serializes the CLI runs updating the same textfile.
+    """
+    import fcntl
+
+    metrics = enable()
+    with open(f"{path}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                metrics.registry.load_previous(f.read())
+        tmp_file = f"{path}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(metrics.render(tasks_list))
+        os.replace(tmp_file, path)
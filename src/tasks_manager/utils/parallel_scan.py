@@ -0,0 +1,113 @@
+"""Module to filter and sort large task lists with a process pool."""
+
+import heapq
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+from src.tasks_manager.utils.query_utils import sort_key, task_matcher
+
+# Below this many tasks per shard, starting processes costs more than it saves
+MIN_SHARD_SIZE = 50_000
+
+# Shards inherited by forked workers, so that only the filters are sent
+_shards: List[List[Dict]] = []
+
+Row = Tuple[object, int]
+
+
+def _scan(
+    tasks: List[Dict],
+    offset: int,
+    filters: Dict,
+    sort_by: Optional[str],
+    ascending: bool,
+) -> List[Row]:
+    """Return (sort key, position) rows of the matching tasks of a shard."""
+    matches = task_matcher(**filters)
+    key = sort_key(sort_by) if sort_by else (lambda task: None)
+    rows = [
+        (key(task), offset + i)
+        for i, task in enumerate(tasks)
+        if matches(task)
+    ]
+    if sort_by:
+        rows.sort(key=itemgetter(0), reverse=not ascending)
+    return rows
+
+
+def _scan_inherited(shard_index, offset, filters, sort_by, ascending):
+    return _scan(_shards[shard_index], offset, filters, sort_by, ascending)
+
+
+def parallel_scan(
+    tasks_list: List[Dict],
+    status: str = None,
+    priority: str = None,
+    search: str = None,
+    tag: str = None,
+    sort_by: str = None,
+    ascending: bool = True,
+    workers: int = None,
+    min_shard_size: int = MIN_SHARD_SIZE,
+) -> List[Dict]:
+    """Filter and sort `tasks_list` over several processes.
+
+    The list is cut into contiguous shards scanned by a
+    `ProcessPoolExecutor`. Where processes are forked, workers inherit the
+    shards and receive only the filters; elsewhere each shard is pickled
+    once. Workers send back the sort key and position of the matches, and
+    the sorted partial results are combined with a k-way merge, giving the
+    same order as `sorted_task` (ties keep the original order).
+    """
+    filters = {
+        "status": status,
+        "priority": priority,
+        "search": search,
+        "tag": tag,
+    }
+    task_matcher(**filters)  # invalid filters fail before any process starts
+    if sort_by:
+        sort_key(sort_by)
+
+    workers = workers or os.cpu_count() or 1
+    count = min(workers, len(tasks_list) // max(min_shard_size, 1))
+    if count <= 1:
+        rows = _scan(tasks_list, 0, filters, sort_by, ascending)
+        return [tasks_list[position] for _, position in rows]
+
+    size = -(-len(tasks_list) // count)
+    offsets = range(0, len(tasks_list), size)
+    shards = [tasks_list[offset:offset + size] for offset in offsets]
+
+    global _shards
+    fork = "fork" in multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if fork else None)
+    try:
+        if fork:
+            _shards = shards
+        with ProcessPoolExecutor(len(shards), mp_context=context) as pool:
+            futures = [
+                pool.submit(
+                    _scan_inherited, i, offset, filters, sort_by, ascending
+                )
+                if fork
+                else pool.submit(
+                    _scan, shard, offset, filters, sort_by, ascending
+                )
+                for i, (offset, shard) in enumerate(zip(offsets, shards))
+            ]
+            partials = [future.result() for future in futures]
+    finally:
+        _shards = []
+
+    if sort_by:
+        merged = heapq.merge(
+            *partials, key=itemgetter(0), reverse=not ascending
+        )
+    else:
+        merged = chain.from_iterable(partials)
+    return [tasks_list[position] for _, position in merged]
@@ -4,6 +4,8 @@ from typing import List, Dict
 from enum import Enum
 from src.classes.errors import TaskValidationError
 from src.tasks_manager.utils.query_utils import filter_by_id
+from src.tasks_manager.utils.task_events import emit
+from src.tasks_manager.utils.timings import timed
 
 
 class Priority(Enum):
@@ -15,29 +17,106 @@ class Priority(Enum):
 
 DEFAULT_PRIORITY = Priority.NORMAL.name
 
+# Priority names from highest to lowest, used as counting-sort buckets
+PRIORITY_ORDER = [
+    priority.name
+    for priority in sorted(Priority, key=lambda p: p.value, reverse=True)
+]
+
+
+class PriorityIndex:
+    """Per-priority buckets of tasks, kept up to date by `task_events`.
+
+    Tasks of a bucket keep the order in which they entered it.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, Dict[int, Dict]] = {
+            name: {} for name in PRIORITY_ORDER
+        }
+        self._bucket_of: Dict[int, str] = {}
+
+    @classmethod
+    def from_tasks(cls, tasks_list: List[Dict]) -> "PriorityIndex":
+        """Build the buckets of a task list."""
+        index = cls()
+        for task in tasks_list:
+            index.update(task)
+        return index
+
+    def apply(self, action: str, task: Dict, previous: Dict) -> None:
+        """Follow a task mutation notified through `task_events`."""
+        if action == "delete":
+            self.discard(task["id"])
+        elif action in ("create", "priority"):
+            self.update(task)
+
+    def update(self, task: Dict) -> None:
+        """Put a task in the bucket of its current priority."""
+        priority = get_task_priority(task)
+        current = self._bucket_of.get(task["id"])
+        if current == priority:
+            self._buckets[priority][task["id"]] = task
+            return
+        if current is not None:
+            del self._buckets[current][task["id"]]
+        self._buckets[priority][task["id"]] = task
+        self._bucket_of[task["id"]] = priority
+
+    def discard(self, task_id: int) -> None:
+        """Remove a task from its bucket."""
+        current = self._bucket_of.pop(task_id, None)
+        if current is not None:
+            del self._buckets[current][task_id]
+
+    def tasks(self, priority: str) -> List[Dict]:
+        """Return the tasks of one priority."""
+        return list(self._buckets[priority].values())
+
+    def sorted_tasks(self) -> List[Dict]:
+        """Return all tasks from highest to lowest priority."""
+        result = []
+        for name in PRIORITY_ORDER:
+            result.extend(self._buckets[name].values())
+        return result
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of tasks per priority."""
+        return {name: len(self._buckets[name]) for name in PRIORITY_ORDER}
+
 
 def task_priority(
-    task_list, task_id: int, action: str, priority: str = None
+    task_list,
+    task_id: int,
+    action: str,
+    priority: str = None,
+    index: PriorityIndex = None,
 ) -> str:
-    """Manage the priority of a task in the task list."""
-    task = filter_by_id(tasks_list=task_list, task_id=task_id)
-    if action == "set":
-        return set_task_priority(task, priority)
-    elif action == "get":
-        return get_task_priority(task)
-    elif action == "sort":
-        return sort_tasks_by_priority(task_list)
+    """Manage the priority of a task in the task list.
+
+    `task_id` is only needed by the 'set' and 'get' actions. When given,
+    `index` serves 'sort' and 'filter' from its buckets.
+    """
+    if action == "sort":
+        return sort_tasks_by_priority(task_list, index=index)
     elif action == "filter":
         if not priority:
             raise TaskValidationError(
                 "Priority must be provided for filtering."
             )
-        return filter_tasks_by_priority(task_list, priority)
-    else:
+        return filter_tasks_by_priority(task_list, priority, index=index)
+    elif action not in ("set", "get"):
         raise TaskValidationError(
             "Invalid action. Allowed actions: set, get, sort, filter."
         )
 
+    task = filter_by_id(tasks_list=task_list, task_id=task_id)
+    if action == "set":
+        if not priority:
+            raise TaskValidationError("Priority must be provided for set.")
+        return set_task_priority(task, priority)
+    return get_task_priority(task)
+
 
 def set_task_priority(task: Dict, priority: str) -> Dict:
     """Assigns a priority to a task."""
@@ -46,7 +125,9 @@ def set_task_priority(task: Dict, priority: str) -> Dict:
         raise TaskValidationError(
             "Invalid priority. Allowed values: LOW, NORMAL, HIGH, CRITICAL"
         )
+    previous = task.get("priority")
     task["priority"] = priority
+    emit("priority", task, {"priority": previous})
     return task
 
 
@@ -55,20 +136,41 @@ def get_task_priority(task: Dict) -> str:
     return task.get("priority", DEFAULT_PRIORITY)
 
 
-def sort_tasks_by_priority(tasks: List[Dict]) -> List[Dict]:
-    """Sorts tasks by priority from highest to lowest."""
+@timed("query")
+def sort_tasks_by_priority(
+    tasks: List[Dict], index: PriorityIndex = None
+) -> List[Dict]:
+    """Sorts tasks by priority from highest to lowest.
+
+    Counting sort over the priority buckets: stable and O(n), or a plain
+    concatenation of the buckets when an index is given.
+    """
+    if index is not None:
+        return index.sorted_tasks()
 
-    def get_priority_value(task: Dict) -> int:
-        return Priority[get_task_priority(task)].value
+    buckets = {name: [] for name in PRIORITY_ORDER}
+    for task in tasks:
+        buckets[task.get("priority", DEFAULT_PRIORITY)].append(task)
 
-    return sorted(tasks, key=get_priority_value, reverse=True)
+    result = []
+    for name in PRIORITY_ORDER:
+        result.extend(buckets[name])
+    return result
 
 
-def filter_tasks_by_priority(tasks: List[Dict], priority: str) -> List[Dict]:
+def filter_tasks_by_priority(
+    tasks: List[Dict], priority: str, index: PriorityIndex = None
+) -> List[Dict]:
     """Returns only tasks that match a given priority."""
     priority = priority.upper()
     if priority not in Priority.__members__:
         raise TaskValidationError(
             "Invalid priority. Allowed values: LOW, NORMAL, HIGH, CRITICAL"
         )
-    return [task for task in tasks if get_task_priority(task) == priority]
+    if index is not None:
+        return index.tasks(priority)
+    return [
+        task
+        for task in tasks
+        if task.get("priority", DEFAULT_PRIORITY) == priority
+    ]
@@ -1,29 +1,30 @@
 """Module to query tasks in Task Manager application."""
 
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
 
 from src.classes.errors import (
     TaskNotFoundError,
+    TaskValidationError,
 )
+from src.tasks_manager.utils.timings import timed
 
 VALID_STATUSES = {"TODO", "ONGOING", "DONE"}
+VALID_PRIORITIES = {"LOW", "NORMAL", "HIGH", "CRITICAL"}
+DEFAULT_PRIORITY = "NORMAL"
 
 
 def get_tasks(
     page: int = 1, size: int = 20, tasks_list: List[Dict] = None
 ) -> List[Dict]:
-    """Récupère la liste des tâches"""
+    """Récupère une page de tâches avec le total de tâches et de pages
+
+    Une page vide est renvoyée si la page demandée n'existe pas.
+    """
     # tasks = _load_tasks(data_file=data_file)
     total_tasks = len(tasks_list)
     total_pages = (total_tasks + size - 1) // size if size else 1
 
-    if not tasks_list:
-        print("Total de tâches: {}".format(total_tasks))
-        print("Total de pages: {}".format(total_pages))
-        return [], total_tasks, total_pages
-
-    if page > total_pages:
-        print(f"Page {page} n'existe pas. Total de pages: {total_pages}")
+    if not tasks_list or page > total_pages:
         return [], total_tasks, total_pages
     if page < 1:
         raise ValueError("Invalid page size")
@@ -33,6 +34,7 @@ def get_tasks(
     return tasks_list[start:end], total_tasks, total_pages
 
 
+@timed("query")
 def filter_tasks_by_status(
     status: str,
     tasks_list: List[Dict],
@@ -54,6 +56,7 @@ def filter_tasks_by_status(
     return filtered_tasks
 
 
+@timed("query")
 def filter_by_id(task_id: int, tasks_list: List[Dict]) -> Dict:
     """Récupère une tâche par son ID"""
     for task in tasks_list:
@@ -62,6 +65,7 @@ def filter_by_id(task_id: int, tasks_list: List[Dict]) -> Dict:
     raise TaskNotFoundError(f"Tâche avec l'ID {task_id} non trouvée.")
 
 
+@timed("query")
 def search_tasks(keyword, tasks_list) -> List[Dict]:
     keyword = keyword.strip().lower()
     if keyword:
@@ -77,18 +81,62 @@ def search_tasks(keyword, tasks_list) -> List[Dict]:
     return filtered
 
 
-def sorted_task(tasks_list, sort_by="created_at", ascending=True):
+def sort_key(sort_by: str = "created_at") -> Callable[[Dict], object]:
+    """Return the key function used to sort tasks by `sort_by`."""
     if sort_by not in {"title", "created_at", "status"}:
         raise ValueError("Invalid sort criteria.")
     if sort_by == "status":
         status_order = {"DONE": 0, "ONGOING": 1, "TODO": 2}
-        return sorted(
-            tasks_list,
-            key=lambda t: status_order.get(t["status"], 99),
-            reverse=not ascending,
-        )
+        return lambda t: status_order.get(t["status"], 99)
+    return lambda t: t[sort_by]
+
+
+@timed("query")
+def sorted_task(tasks_list, sort_by="created_at", ascending=True):
     return sorted(
         tasks_list,
-        key=lambda t: t[sort_by],
+        key=sort_key(sort_by),
         reverse=not ascending,
     )
+
+
+def task_matcher(
+    status: str = None,
+    priority: str = None,
+    search: str = None,
+    tag: str = None,
+) -> Callable[[Dict], bool]:
+    """Build a predicate selecting tasks for bulk operations."""
+    if status is not None:
+        status = status.upper()
+        if status not in VALID_STATUSES:
+            raise TaskValidationError(
+                "Statut invalide. Valeurs autorisées : TODO, ONGOING, DONE"
+            )
+    if priority is not None:
+        priority = priority.upper()
+        if priority not in VALID_PRIORITIES:
+            raise TaskValidationError(
+                "Invalid priority. Allowed values: LOW, NORMAL, HIGH, CRITICAL"
+            )
+    keyword = search.strip().lower() if search else ""
+    tag = tag.strip() if tag else None
+
+    def matches(task: Dict) -> bool:
+        if status is not None and task.get("status") != status:
+            return False
+        if (
+            priority is not None
+            and task.get("priority", DEFAULT_PRIORITY) != priority
+        ):
+            return False
+        if tag is not None and tag not in task.get("tags", []):
+            return False
+        if keyword and not (
+            keyword in task.get("title", "").lower()
+            or keyword in task.get("description", "").lower()
+        ):
+            return False
+        return True
+
+    return matches
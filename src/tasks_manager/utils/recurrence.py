@@ -0,0 +1,264 @@
+"""Module to manage recurring tasks and expand their occurrences lazily."""
+
+import calendar
+import heapq
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.classes.errors import TaskNotFoundError, TaskValidationError
+from src.tasks_manager.utils.data_manager import _create_task
+from src.tasks_manager.utils.query_utils import filter_by_id
+from src.tasks_manager.utils.task_deadline import parse_deadline
+from src.tasks_manager.utils.task_events import emit
+
+FREQUENCIES = ("daily", "weekly", "monthly")
+
+# Fields copied from a template to its occurrences
+INHERITED_FIELDS = ("title", "description", "created_at", "priority", "tags")
+
+
+def set_recurrence(
+    tasks_list: List[Dict],
+    task_id: int,
+    freq: str,
+    interval: int = 1,
+    start: str = None,
+    until: str = None,
+    count: int = None,
+) -> Tuple[Dict, List[Dict]]:
+    """Turns a task into a recurring template.
+
+    :param freq: 'daily', 'weekly' or 'monthly'; every N days is 'daily'
+        with an interval of N.
+    :param start: First occurrence, defaults to the task deadline or today.
+    :param until: Last possible occurrence date, included.
+    :param count: Maximum number of occurrences.
+    :return: The template and the tasks list.
+    """
+    if freq not in FREQUENCIES:
+        raise TaskValidationError(
+            "Invalid frequency. Allowed values: daily, weekly, monthly"
+        )
+    if interval < 1:
+        raise TaskValidationError("The interval must be at least 1.")
+    if count is not None and count < 1:
+        raise TaskValidationError("The count must be at least 1.")
+
+    task = filter_by_id(task_id, tasks_list)
+    start = start or task.get("deadline") or date.today().isoformat()
+    if until is not None and parse_deadline(until) < parse_deadline(start):
+        raise TaskValidationError("'until' must not precede the start date.")
+
+    rule = {"freq": freq, "interval": interval, "start": start}
+    if until is not None:
+        rule["until"] = until
+    if count is not None:
+        rule["count"] = count
+
+    previous = {
+        "recurrence": task.get("recurrence"),
+        "exceptions": task.get("exceptions"),
+    }
+    task["recurrence"] = rule
+    task.setdefault("exceptions", [])
+    emit("recurrence", task, previous)
+    return task, tasks_list
+
+
+def clear_recurrence(
+    tasks_list: List[Dict], task_id: int
+) -> Tuple[Dict, List[Dict]]:
+    """Stops a template from recurring; touched occurrences are kept."""
+    task = filter_by_id(task_id, tasks_list)
+    if "recurrence" not in task:
+        raise TaskValidationError(f"Task {task_id} is not recurring.")
+    previous = {
+        "recurrence": task.pop("recurrence"),
+        "exceptions": task.pop("exceptions", None),
+    }
+    emit("recurrence", task, previous)
+    return task, tasks_list
+
+
+def occurrence_dates(
+    rule: Dict, window_start: date, window_end: date
+) -> Iterator[date]:
+    """Yields the dates of a rule between two dates included.
+
+    Jumps straight to the first occurrence of the window, so the cost only
+    depends on the number of occurrences yielded.
+    """
+    start = parse_deadline(rule["start"])
+    until = parse_deadline(rule["until"]) if "until" in rule else None
+    count = rule.get("count")
+    interval = rule.get("interval", 1)
+    if until is not None and until < window_end:
+        window_end = until
+
+    if rule["freq"] == "monthly":
+        months = (
+            (window_start.year - start.year) * 12
+            + window_start.month
+            - start.month
+        )
+        k = max(0, months // interval)
+
+        def nth(k):
+            return _add_months(start, k * interval)
+
+    else:
+        step = interval * (7 if rule["freq"] == "weekly" else 1)
+        k = max(0, -(-(window_start - start).days // step))
+
+        def nth(k):
+            return start + timedelta(days=step * k)
+
+    while count is None or k < count:
+        day = nth(k)
+        if day > window_end:
+            return
+        if day >= window_start:
+            yield day
+        k += 1
+
+
+def _add_months(day: date, months: int) -> date:
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    last_day = calendar.monthrange(year, month)[1]
+    return date(year, month, min(day.day, last_day))
+
+
+def iter_occurrences(
+    template: Dict, window_start: date, window_end: date
+) -> Iterator[Dict]:
+    """Yields the untouched occurrences of a template within a window.
+
+    Occurrences are virtual tasks identified by '<template id>@<date>';
+    touched ones exist as concrete tasks and are skipped here.
+    """
+    exceptions = set(template.get("exceptions", ()))
+    for day in occurrence_dates(
+        template["recurrence"], window_start, window_end
+    ):
+        deadline = day.isoformat()
+        if deadline in exceptions:
+            continue
+        occurrence = {
+            field: template[field]
+            for field in INHERITED_FIELDS
+            if field in template
+        }
+        occurrence.update(
+            {
+                "id": f"{template['id']}@{deadline}",
+                "status": "TODO",
+                "deadline": deadline,
+                "occurrence_of": template["id"],
+            }
+        )
+        yield occurrence
+
+
+class RecurrenceIndex:
+    """Recurring templates of a task list, kept up to date by events."""
+
+    def __init__(self):
+        self._templates: Dict[int, Dict] = {}
+
+    @classmethod
+    def from_tasks(cls, tasks_list: List[Dict]) -> "RecurrenceIndex":
+        """Collect the templates of a task list."""
+        index = cls()
+        for task in tasks_list:
+            if task.get("recurrence"):
+                index._templates[task["id"]] = task
+        return index
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def apply(self, action: str, task: Dict, previous: Dict) -> None:
+        """Follow a task mutation notified through `task_events`."""
+        if action == "delete" or not task.get("recurrence"):
+            self._templates.pop(task["id"], None)
+        elif action in ("create", "recurrence"):
+            self._templates[task["id"]] = task
+
+    def expand(self, window_start: date, window_end: date) -> Iterator[Dict]:
+        """Yields the occurrences of every template, ordered by date."""
+        return heapq.merge(
+            *(
+                iter_occurrences(template, window_start, window_end)
+                for template in self._templates.values()
+            ),
+            key=lambda occurrence: occurrence["deadline"],
+        )
+
+
+def parse_occurrence_id(occurrence_id: str) -> Tuple[int, str]:
+    """Splits an occurrence ID '<template id>@<YYYY-MM-DD>'."""
+    template_id, _, deadline = occurrence_id.partition("@")
+    try:
+        template_id = int(template_id)
+        parse_deadline(deadline)
+    except ValueError:
+        raise TaskValidationError(
+            f"Invalid occurrence '{occurrence_id}'. "
+            "Expected '<task id>@<YYYY-MM-DD>'."
+        )
+    return template_id, deadline
+
+
+def materialize_occurrence(
+    tasks_list: List[Dict], template_id: int, deadline: str
+) -> Tuple[Dict, List[Dict]]:
+    """Persists an occurrence as a concrete task before it is touched.
+
+    Returns the concrete task, which already exists if the occurrence was
+    touched before.
+    """
+    template = filter_by_id(template_id, tasks_list)
+    if not template.get("recurrence"):
+        raise TaskValidationError(f"Task {template_id} is not recurring.")
+
+    if deadline in template.get("exceptions", ()):
+        existing = _find_occurrence(tasks_list, template_id, deadline)
+        if existing is not None:
+            return existing, tasks_list
+
+    day = parse_deadline(deadline)
+    if next(occurrence_dates(template["recurrence"], day, day), None) is None:
+        raise TaskNotFoundError(
+            f"Task {template_id} has no occurrence on {deadline}."
+        )
+
+    task, tasks_list = _create_task(
+        template["title"], template.get("description", ""), tasks_list
+    )
+    task["occurrence_of"] = template_id
+    if "priority" in template:
+        task["priority"] = template["priority"]
+        emit("priority", task, {"priority": None})
+    if "tags" in template:
+        task["tags"] = list(template["tags"])
+        emit("tags", task, {"tags": None})
+    task["deadline"] = deadline
+    emit("deadline", task, {"deadline": None})
+
+    previous = template.get("exceptions")
+    template["exceptions"] = sorted(set(previous or ()) | {deadline})
+    emit("recurrence", template, {"exceptions": previous})
+    return task, tasks_list
+
+
+def _find_occurrence(
+    tasks_list: List[Dict], template_id: int, deadline: str
+) -> Optional[Dict]:
+    for task in tasks_list:
+        if (
+            task.get("occurrence_of") == template_id
+            and task.get("deadline") == deadline
+        ):
+            return task
+    return None
@@ -0,0 +1,208 @@
+"""Module to send deadline reminders from a timer heap."""
+
+import heapq
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.classes.errors import TaskValidationError
+from src.tasks_manager.utils.task_deadline import parse_deadline
+
+ACTIONABLE_STATUSES = {"TODO", "ONGOING"}
+
+
+class StdoutSink:
+    """Prints reminders on the standard output."""
+
+    def send(self, reminder: Dict) -> None:
+        print(reminder["message"], flush=True)
+
+
+class FileSink:
+    """Appends reminders to a file as JSON lines."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def send(self, reminder: Dict) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(reminder, ensure_ascii=False) + "\n")
+
+
+class CommandSink:
+    """Runs a local command for each reminder.
+
+    The reminder is passed as JSON on stdin and as TASK_ID, TASK_TITLE and
+    TASK_DEADLINE environment variables.
+    """
+
+    def __init__(self, command: str):
+        self.argv = shlex.split(command)
+
+    def send(self, reminder: Dict) -> None:
+        env = dict(
+            os.environ,
+            TASK_ID=str(reminder["task_id"]),
+            TASK_TITLE=reminder["title"],
+            TASK_DEADLINE=reminder["deadline"],
+        )
+        subprocess.run(
+            self.argv,
+            input=json.dumps(reminder, ensure_ascii=False),
+            text=True,
+            env=env,
+            check=False,
+        )
+
+
+def make_sink(spec: str):
+    """Builds a sink from 'stdout', 'file:<path>' or 'command:<command>'."""
+    kind, _, argument = spec.partition(":")
+    if kind == "stdout" and not argument:
+        return StdoutSink()
+    if kind == "file" and argument:
+        return FileSink(argument)
+    if kind == "command" and argument:
+        return CommandSink(argument)
+    raise TaskValidationError(
+        "Invalid sink. Use 'stdout', 'file:<path>' or 'command:<command>'."
+    )
+
+
+class ReminderScheduler:
+    """Min-heap of upcoming reminder times, one per task deadline.
+
+    `sync` diffs a freshly loaded task list against the last known state
+    and only pushes or invalidates the entries of changed tasks.
+    """
+
+    def __init__(
+        self, lead: timedelta = timedelta(hours=24), at: str = "09:00"
+    ):
+        self.lead = lead
+        try:
+            hours, minutes = (int(part) for part in at.split(":"))
+            self.at = timedelta(hours=hours, minutes=minutes)
+        except ValueError:
+            raise TaskValidationError("The time must be in 'HH:MM' format.")
+        self._heap: List[list] = []
+        self._entries: Dict[int, list] = {}
+        self._known: Dict[int, Tuple] = {}
+        self._tasks: Dict[int, Dict] = {}
+        self._sent = set()
+        self._counter = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sync(self, tasks_list: List[Dict], now: float = None) -> int:
+        """Apply the changes of a task list; return the number of changes."""
+        now = time.time() if now is None else now
+        seen = set()
+        changes = 0
+        for task in tasks_list:
+            seen.add(task["id"])
+            key = (task.get("deadline"), task.get("status"), task["title"])
+            if self._known.get(task["id"]) != key:
+                self._known[task["id"]] = key
+                self._schedule(task, now)
+                changes += 1
+        for task_id in list(self._known):
+            if task_id not in seen:
+                del self._known[task_id]
+                self._invalidate(task_id)
+                self._tasks.pop(task_id, None)
+                changes += 1
+        return changes
+
+    def _schedule(self, task: Dict, now: float) -> None:
+        self._invalidate(task["id"])
+        self._tasks[task["id"]] = task
+        if task.get("status") not in ACTIONABLE_STATUSES:
+            return
+        try:
+            day = parse_deadline(task.get("deadline"))
+        except ValueError:
+            return
+        due = datetime(day.year, day.month, day.day) + self.at
+        if due.timestamp() < now:
+            return
+        if (task["id"], task["deadline"]) in self._sent:
+            return
+        self._counter += 1
+        entry = [(due - self.lead).timestamp(), self._counter, task["id"]]
+        self._entries[task["id"]] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _invalidate(self, task_id: int) -> None:
+        entry = self._entries.pop(task_id, None)
+        if entry is not None:
+            entry[-1] = None
+
+    def next_time(self) -> Optional[float]:
+        """Return the time of the next reminder, if any."""
+        while self._heap and self._heap[0][-1] is None:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> List[Dict]:
+        """Pop the reminders whose time has come."""
+        reminders = []
+        while self.next_time() is not None and self._heap[0][0] <= now:
+            fire_at, _, task_id = heapq.heappop(self._heap)
+            del self._entries[task_id]
+            task = self._tasks[task_id]
+            self._sent.add((task_id, task["deadline"]))
+            reminders.append(
+                {
+                    "task_id": task_id,
+                    "title": task["title"],
+                    "deadline": task["deadline"],
+                    "fire_at": datetime.fromtimestamp(fire_at).isoformat(
+                        timespec="seconds"
+                    ),
+                    "message": (
+                        f"Rappel : la tâche {task_id} '{task['title']}' "
+                        f"arrive à échéance le {task['deadline']}"
+                    ),
+                }
+            )
+        return reminders
+
+
+def run_reminders(
+    scheduler: ReminderScheduler,
+    load: Callable[[], List[Dict]],
+    watcher,
+    sink,
+    clock: Callable[[], float] = time.time,
+    sleep: Callable[[float], None] = time.sleep,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> None:
+    """Send reminders until `should_stop` returns True.
+
+    Sleeps until the next reminder or the next poll of the data file,
+    whichever comes first; the file is only reloaded when it changed.
+    """
+    while not should_stop():
+        now = clock()
+        for reminder in scheduler.pop_due(now):
+            sink.send(reminder)
+
+        next_time = scheduler.next_time()
+        wait = watcher.interval
+        if next_time is not None:
+            wait = min(wait, max(next_time - now, 0.0))
+        sleep(wait)
+
+        if watcher.changed():
+            try:
+                scheduler.sync(load(), clock())
+            except ValueError as e:
+                # The file may be read while being rewritten
+                print(f"Rechargement ignoré : {e}", file=sys.stderr)
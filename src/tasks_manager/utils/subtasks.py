@@ -0,0 +1,266 @@
+"""Module to organize tasks in a hierarchy of subtasks.
+
+A task names its parent task in its `parent` field. `SubtaskTree` gives
+every task a materialized path, the tuple of the IDs from its root task
+down to it, and keeps the paths sorted: the subtree of a task is the range
+of paths starting with its own, found by bisection. Each task having
+subtasks also holds rollup counters of its subtree (tasks, done tasks,
+tasks per priority), updated along the path of a task when its status or
+priority changes.
+"""
+
+import bisect
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.classes.errors import TaskNotFoundError, TaskValidationError
+from src.tasks_manager.utils.priority_manager import (
+    DEFAULT_PRIORITY,
+    PRIORITY_ORDER,
+    Priority,
+)
+from src.tasks_manager.utils.task_events import emit
+
+Path = Tuple[int, ...]
+DONE_STATUS = "DONE"
+
+
+def _counts(task: Dict) -> List[int]:
+    """Rollup counters of a single task: [tasks, done, LOW ... CRITICAL]."""
+    counts = [1, int(task.get("status") == DONE_STATUS)] + [0] * len(Priority)
+    counts[1 + Priority[task.get("priority") or DEFAULT_PRIORITY].value] = 1
+    return counts
+
+
+class SubtaskTree:
+    """Sorted materialized paths and subtree rollups of the tasks.
+
+    A task whose parent is unknown is a root until a task of that ID is
+    created.
+    """
+
+    def __init__(self):
+        self.tasks: Dict[int, Dict] = {}
+        self.paths: Dict[int, Path] = {}
+        self._sorted: List[Path] = []
+        self._rollups: Dict[int, List[int]] = {}
+        self._waiting: Dict[int, Set[int]] = {}
+
+    @classmethod
+    def from_tasks(cls, tasks_list: List[Dict]) -> "SubtaskTree":
+        """Build the paths and rollups of a task list."""
+        tree = cls()
+        for task in tasks_list:
+            tree.tasks[task["id"]] = task
+        for task_id in tree.tasks:
+            tree._resolve(task_id)
+        tree._sorted = sorted(tree.paths.values())
+        # les sous-arbres les plus profonds d'abord : chaque rollup est
+        # complet quand il est ajouté à celui du parent
+        for path in sorted(tree._sorted, key=len, reverse=True):
+            if len(path) == 1:
+                break
+            task_id, parent_id = path[-1], path[-2]
+            counts = tree._rollups.get(task_id) or _counts(tree.tasks[task_id])
+            rollup = tree._rollups.get(parent_id)
+            if rollup is None:
+                rollup = tree._rollups[parent_id] = _counts(
+                    tree.tasks[parent_id]
+                )
+            for i, value in enumerate(counts):
+                rollup[i] += value
+        return tree
+
+    def _resolve(self, task_id: int) -> None:
+        """Compute the path of a task and of its unresolved ancestors."""
+        chain, seen = [], set()
+        node, base = task_id, ()
+        while node not in self.paths:
+            chain.append(node)
+            seen.add(node)
+            parent_id = self.tasks[node].get("parent")
+            if parent_id is None:
+                break
+            if parent_id not in self.tasks:
+                self._waiting.setdefault(parent_id, set()).add(node)
+                break
+            if parent_id in seen:
+                break  # cycle écrit hors de l'outil : la tâche devient racine
+            node = parent_id
+        else:
+            base = self.paths[node]
+        for node in reversed(chain):
+            base = base + (node,)
+            self.paths[node] = base
+
+    # --- Queries ---
+
+    def _range(self, task_id: int) -> Tuple[int, int]:
+        """Slice of `_sorted` holding the subtree of a task."""
+        path = self.paths.get(task_id)
+        if path is None:
+            raise TaskNotFoundError(f"Tâche avec l'ID {task_id} non trouvée.")
+        end = path[:-1] + (path[-1] + 1,)
+        return (
+            bisect.bisect_left(self._sorted, path),
+            bisect.bisect_left(self._sorted, end),
+        )
+
+    def subtree(self, task_id: int) -> List[Dict]:
+        """A task and its descendants, depth first (siblings by ID)."""
+        start, end = self._range(task_id)
+        return [self.tasks[path[-1]] for path in self._sorted[start:end]]
+
+    def descendants(self, task_id: int, open_only: bool = False):
+        """Descendants of a task, only the unfinished ones if `open_only`."""
+        tasks = self.subtree(task_id)[1:]
+        if open_only:
+            tasks = [t for t in tasks if t.get("status") != DONE_STATUS]
+        return tasks
+
+    def depth(self, task_id: int) -> int:
+        return len(self.paths[task_id]) - 1
+
+    def rollup(self, task_id: int) -> Dict:
+        """Size, progress and highest priority of the subtree of a task."""
+        if task_id not in self.paths:
+            raise TaskNotFoundError(f"Tâche avec l'ID {task_id} non trouvée.")
+        counts = self._rollups.get(task_id) or _counts(self.tasks[task_id])
+        return {
+            "tasks": counts[0],
+            "done": counts[1],
+            "percent_done": round(100 * counts[1] / counts[0], 1),
+            "max_priority": next(
+                name
+                for name in PRIORITY_ORDER
+                if counts[1 + Priority[name].value]
+            ),
+        }
+
+    # --- Updates ---
+
+    def _add_to_ancestors(self, path: Path, counts: List[int], sign: int):
+        for ancestor in path[:-1]:
+            rollup = self._rollups.get(ancestor)
+            if rollup is None:
+                rollup = self._rollups[ancestor] = _counts(
+                    self.tasks[ancestor]
+                )
+            for i, value in enumerate(counts):
+                rollup[i] += sign * value
+            if rollup[0] == 1:
+                del self._rollups[ancestor]  # plus de sous-tâches
+
+    def _move(self, task_id: int, parent_id: Optional[int]) -> None:
+        """Move the subtree of a task under `parent_id` (None: a root)."""
+        start, end = self._range(task_id)
+        block = self._sorted[start:end]
+        old = self.paths[task_id]
+        counts = self._rollups.get(task_id) or _counts(self.tasks[task_id])
+        self._add_to_ancestors(old, counts, -1)
+        del self._sorted[start:end]
+
+        base = () if parent_id is None else self.paths[parent_id]
+        prefix = base + (task_id,)
+        moved = [prefix + path[len(old):] for path in block]
+        for path in moved:
+            self.paths[path[-1]] = path
+        # les chemins déplacés gardent leur ordre et restent contigus
+        position = bisect.bisect_left(self._sorted, prefix)
+        self._sorted[position:position] = moved
+        self._add_to_ancestors(prefix, counts, 1)
+
+    def _attach(self, task: Dict) -> None:
+        """Move a task under the parent named by its `parent` field."""
+        task_id, parent_id = task["id"], task.get("parent")
+        if parent_id is not None and parent_id not in self.paths:
+            self._waiting.setdefault(parent_id, set()).add(task_id)
+            parent_id = None
+        elif parent_id is not None and task_id in self.paths[parent_id]:
+            parent_id = None  # cycle : la tâche reste racine
+        path = self.paths[task_id]
+        if (path[-2] if len(path) > 1 else None) != parent_id:
+            self._move(task_id, parent_id)
+
+    def _insert(self, task: Dict) -> None:
+        task_id = task["id"]
+        self.tasks[task_id] = task
+        self.paths[task_id] = path = (task_id,)
+        bisect.insort(self._sorted, path)
+        self._attach(task)
+        for child_id in self._waiting.pop(task_id, ()):
+            child = self.tasks.get(child_id)
+            if child is not None and child.get("parent") == task_id:
+                self._attach(child)
+
+    def discard(self, task_id: int) -> None:
+        """Remove a task; its subtasks become roots."""
+        if task_id not in self.paths:
+            return
+        path = self.paths[task_id]
+        children = [
+            child[-1]
+            for child in self._sorted[slice(*self._range(task_id))]
+            if len(child) == len(path) + 1
+        ]
+        for child_id in children:
+            self._move(child_id, None)
+            if self.tasks[child_id].get("parent") == task_id:
+                self._waiting.setdefault(task_id, set()).add(child_id)
+        self._add_to_ancestors(path, _counts(self.tasks[task_id]), -1)
+        del self._sorted[bisect.bisect_left(self._sorted, path)]
+        del self.paths[task_id]
+        del self.tasks[task_id]
+        self._rollups.pop(task_id, None)
+
+    def apply(self, action: str, task: Dict, previous: Dict) -> None:
+        """Follow a task mutation notified through `task_events`."""
+        task_id = task["id"]
+        if action == "delete":
+            self.discard(task_id)
+        elif action == "create":
+            self.discard(task_id)
+            self._insert(task)
+        elif task_id not in self.paths:
+            return
+        elif action == "parent":
+            self._attach(task)
+        elif action in ("status", "priority"):
+            self.tasks[task_id] = task
+            before = _counts({**task, **previous})
+            delta = [new - old for new, old in zip(_counts(task), before)]
+            if any(delta):
+                for ancestor in self.paths[task_id]:
+                    rollup = self._rollups.get(ancestor)
+                    if rollup is not None:
+                        for i, value in enumerate(delta):
+                            rollup[i] += value
+
+
+def set_parent(
+    tasks_list: List[Dict],
+    task_id: int,
+    parent_id: Optional[int],
+    tree: SubtaskTree = None,
+) -> Dict:
+    """Make a task a subtask of `parent_id` (None: a top-level task).
+
+    Raises TaskValidationError if the parent is the task or one of its
+    subtasks.
+    """
+    tree = tree or SubtaskTree.from_tasks(tasks_list)
+    for tid in (task_id, parent_id):
+        if tid is not None and tid not in tree.paths:
+            raise TaskNotFoundError(f"Tâche avec l'ID {tid} non trouvée.")
+    if parent_id is not None and task_id in tree.paths[parent_id]:
+        raise TaskValidationError(
+            f"La tâche {parent_id} ne peut pas être le parent de la tâche "
+            f"{task_id} : elle en fait partie."
+        )
+    task = tree.tasks[task_id]
+    previous = {"parent": task.get("parent")}
+    if parent_id is None:
+        task.pop("parent", None)
+    else:
+        task["parent"] = parent_id
+    emit("parent", task, previous)
+    return task
@@ -0,0 +1,276 @@
+"""Module to intern tags as small integer IDs and index them as bitsets."""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class TagDictionary:
+    """Bidirectional mapping between tag names and small integer IDs."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self._names: List[Optional[str]] = []
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._ids
+
+    def intern(self, tag: str) -> int:
+        """Return the ID of a tag, allocating one if needed."""
+        tag_id = self._ids.get(tag)
+        if tag_id is None:
+            tag_id = len(self._names)
+            self._ids[tag] = tag_id
+            self._names.append(tag)
+        return tag_id
+
+    def id_of(self, tag: str) -> Optional[int]:
+        """Return the ID of a tag, or None if it was never interned."""
+        return self._ids.get(tag)
+
+    def name_of(self, tag_id: int) -> str:
+        """Return the tag name of an ID."""
+        return self._names[tag_id]
+
+    def rename(self, old: str, new: str) -> int:
+        """Give a new name to an existing tag ID and return the ID."""
+        tag_id = self._ids.pop(old)
+        self._ids[new] = tag_id
+        self._names[tag_id] = new
+        return tag_id
+
+    def discard(self, tag: str) -> None:
+        """Forget a tag; its ID is never reused."""
+        tag_id = self._ids.pop(tag, None)
+        if tag_id is not None:
+            self._names[tag_id] = None
+
+    def mask(self, tags: Iterable[str]) -> int:
+        """Return the bitmask of tags, interning unknown ones."""
+        mask = 0
+        for tag in tags:
+            mask |= 1 << self.intern(tag)
+        return mask
+
+    def lookup_mask(self, tags: Iterable[str]) -> int:
+        """Return the bitmask of tags, ignoring unknown ones."""
+        mask = 0
+        for tag in tags:
+            tag_id = self._ids.get(tag)
+            if tag_id is not None:
+                mask |= 1 << tag_id
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """Return the sorted tag names set in a bitmask."""
+        return sorted(self._names[tag_id] for tag_id in _bits(mask))
+
+    def to_list(self) -> List[Optional[str]]:
+        """Return the names indexed by ID, for serialization."""
+        return list(self._names)
+
+    @classmethod
+    def from_list(cls, names: List[Optional[str]]) -> "TagDictionary":
+        """Rebuild a dictionary serialized with `to_list`."""
+        dictionary = cls()
+        dictionary._names = list(names)
+        dictionary._ids = {
+            name: tag_id
+            for tag_id, name in enumerate(names)
+            if name is not None
+        }
+        return dictionary
+
+
+class TagIndex:
+    """Tag membership of tasks stored as integer bitsets.
+
+    Each task gets a slot and a row mask of its tag IDs; each tag ID gets a
+    column bitmap of the slots carrying it. Filtering and co-occurrence
+    statistics become bitwise operations on these integers.
+    """
+
+    def __init__(self, dictionary: TagDictionary = None):
+        self.dictionary = dictionary or TagDictionary()
+        self._slots: List[Optional[Dict]] = []
+        self._slot_of: Dict[int, int] = {}
+        self._rows: Dict[int, int] = {}
+        self._columns: Dict[int, int] = {}
+
+    @classmethod
+    def from_tasks(
+        cls, tasks_list: List[Dict], dictionary: TagDictionary = None
+    ) -> "TagIndex":
+        """Build the index of a task list."""
+        index = cls(dictionary)
+        for task in tasks_list:
+            index.update(task)
+        return index
+
+    def apply(self, action: str, task: Dict, previous: Dict) -> None:
+        """Follow a task mutation notified through `task_events`."""
+        if action == "delete":
+            self.discard(task["id"])
+        elif action in ("create", "tags"):
+            self.update(task)
+
+    def update(self, task: Dict) -> None:
+        """Index a new task or re-index the tags of an existing one."""
+        slot = self._slot_of.get(task["id"])
+        if slot is None:
+            slot = len(self._slots)
+            self._slots.append(task)
+            self._slot_of[task["id"]] = slot
+        else:
+            self._slots[slot] = task
+        bit = 1 << slot
+        old_mask = self._rows.get(task["id"], 0)
+        new_mask = self.dictionary.mask(task.get("tags", ()))
+        for tag_id in _bits(old_mask & ~new_mask):
+            self._columns[tag_id] &= ~bit
+        for tag_id in _bits(new_mask & ~old_mask):
+            self._columns[tag_id] = self._columns.get(tag_id, 0) | bit
+        self._rows[task["id"]] = new_mask
+
+    def discard(self, task_id: int) -> None:
+        """Remove a task from the index."""
+        slot = self._slot_of.pop(task_id, None)
+        if slot is None:
+            return
+        bit = 1 << slot
+        for tag_id in _bits(self._rows.pop(task_id, 0)):
+            self._columns[tag_id] &= ~bit
+        self._slots[slot] = None
+
+    def task_mask(self, task_id: int) -> int:
+        """Return the tag bitmask of a task."""
+        return self._rows.get(task_id, 0)
+
+    def tasks_with_any(self, tags: Iterable[str]) -> List[Dict]:
+        """Return the tasks carrying at least one of the tags."""
+        slots = 0
+        for tag_id in _bits(self.dictionary.lookup_mask(tags)):
+            slots |= self._columns.get(tag_id, 0)
+        return [self._slots[slot] for slot in _bits(slots)]
+
+    def tasks_with_all(self, tags: Iterable[str]) -> List[Dict]:
+        """Return the tasks carrying every one of the tags."""
+        tags = list(tags)
+        mask = self.dictionary.lookup_mask(tags)
+        if not tags or bin(mask).count("1") != len(set(tags)):
+            return []
+        slots = -1
+        for tag_id in _bits(mask):
+            slots &= self._columns.get(tag_id, 0)
+        return [self._slots[slot] for slot in _bits(slots)]
+
+    def usage(self) -> Dict[str, int]:
+        """Return every used tag with the number of tasks carrying it."""
+        counts = {}
+        for tag_id, column in self._columns.items():
+            if column:
+                counts[self.dictionary.name_of(tag_id)] = column.bit_count()
+        return dict(sorted(counts.items()))
+
+    def cooccurrence(self, tag: str = None) -> Dict[Tuple[str, str], int]:
+        """Return how many tasks share each pair of tags.
+
+        When `tag` is given only the pairs including it are returned.
+        """
+        columns = [
+            (self.dictionary.name_of(tag_id), column)
+            for tag_id, column in self._columns.items()
+            if column
+        ]
+        columns.sort()
+        pairs = {}
+        for i, (name_a, column_a) in enumerate(columns):
+            for name_b, column_b in columns[i + 1:]:
+                if tag is not None and tag not in (name_a, name_b):
+                    continue
+                count = (column_a & column_b).bit_count()
+                if count:
+                    pairs[(name_a, name_b)] = count
+        return pairs
+
+    def rename(self, old: str, new: str) -> List[Tuple[Dict, List[str]]]:
+        """Rename a tag at the index level.
+
+        The tag keeps its ID, so only the tasks carrying it are touched. If
+        `new` already exists both tags are merged under its ID. Returns the
+        updated tasks with their previous tags.
+        """
+        old_id = self.dictionary.id_of(old)
+        if old_id is None or old == new:
+            return []
+        column = self._columns.pop(old_id, 0)
+        new_id = self.dictionary.id_of(new)
+        if new_id is None:
+            self.dictionary.rename(old, new)
+            self._columns[old_id] = column
+        else:
+            self.dictionary.discard(old)
+            self._columns[new_id] = self._columns.get(new_id, 0) | column
+            old_bit, new_bit = 1 << old_id, 1 << new_id
+            for slot in _bits(column):
+                task_id = self._slots[slot]["id"]
+                self._rows[task_id] = self._rows[task_id] & ~old_bit | new_bit
+
+        updated = []
+        for slot in _bits(column):
+            task = self._slots[slot]
+            previous = task.get("tags")
+            task["tags"] = sorted({new}.union(previous or []) - {old})
+            updated.append((task, previous))
+        return updated
+
+
+# Positions of the bits set in each byte value
+_BYTE_BITS = [
+    tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)
+]
+_SPARSE_BITS = 64
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Yield the positions of the bits set in a mask, lowest first.
+
+    Clearing the lowest bit copies the whole mask, so only sparse masks
+    are walked bit by bit; denser ones are converted to bytes once and
+    decoded with a per-byte table, in O(size of the mask).
+    """
+    if bin(mask).count("1") < _SPARSE_BITS:
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+        return
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for offset, byte in enumerate(data):
+        if byte:
+            base = offset * 8
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+
+def encode_tags(tasks_list: List[Dict]) -> Tuple[List[str], List[Dict]]:
+    """Return a tag dictionary and copies of the tasks with tag IDs."""
+    dictionary = TagDictionary()
+    encoded = []
+    for task in tasks_list:
+        if "tags" in task:
+            task = dict(task)
+            task["tags"] = [dictionary.intern(tag) for tag in task["tags"]]
+        encoded.append(task)
+    return dictionary.to_list(), encoded
+
+
+def decode_tags(names: List[str], tasks_list: List[Dict]) -> List[Dict]:
+    """Replace tag IDs by their (shared) names in tasks read from disk."""
+    for task in tasks_list:
+        if "tags" in task:
+            task["tags"] = [names[tag_id] for tag_id in task["tags"]]
+    return tasks_list
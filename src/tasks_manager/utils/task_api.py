@@ -0,0 +1,398 @@
+"""Module to serve the tasks as a local HTTP JSON API with asyncio."""
+
+import asyncio
+import json
+import re
+import warnings
+from http import HTTPStatus
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.classes.errors import TaskNotFoundError, TaskValidationError
+from src.tasks_manager.utils import metrics
+from src.tasks_manager.utils.data_manager import (
+    VALID_STATUSES,
+    _change_task_status,
+    _create_task,
+    _delete_task,
+    _modify_task,
+)
+from src.tasks_manager.utils.priority_manager import set_task_priority
+from src.tasks_manager.utils.query_utils import (
+    VALID_PRIORITIES,
+    filter_by_id,
+    sorted_task,
+    task_matcher,
+)
+from src.tasks_manager.utils.tag_dictionary import TagIndex
+from src.tasks_manager.utils.task_deadline import (
+    DeadlineIndex,
+    DeadlineTask,
+    parse_deadline,
+    query_deadlines,
+    schedule_deadlines,
+)
+from src.tasks_manager.utils.task_events import cached_index
+from src.tasks_manager.utils.task_queue import UrgencyQueue
+from src.tasks_manager.utils.task_store import TaskStore
+from src.tasks_manager.utils.task_tags import tags_manager, _validate_tag
+
+MAX_BODY_SIZE = 1 << 20
+TEXT_LIMITS = {"title": 100, "description": 500}
+
+
+def _check_fields(data: Dict, types: Dict[str, tuple]) -> None:
+    """Reject body fields of the wrong JSON type and invalid texts.
+
+    Run before any change, so that a request is applied whole or not at
+    all instead of failing halfway on a bad value.
+    """
+    for field, kinds in types.items():
+        if field in data and not isinstance(data[field], kinds):
+            raise TaskValidationError(f"'{field}' has an invalid type.")
+    if "title" in data and not data["title"].strip():
+        raise TaskValidationError("Title is required")
+    for field, limit in TEXT_LIMITS.items():
+        if len(data.get(field, "").strip()) > limit:
+            raise TaskValidationError(
+                f"'{field}' cannot exceed {limit} characters."
+            )
+
+
+class GroupCommit:
+    """Shares one `sync` call between the writes waiting for durability.
+
+    Writers await `commit()` after mutating; while a sync runs in a worker
+    thread, new writers queue up and are all acknowledged by the next one.
+    """
+
+    def __init__(self, sync: Callable[[], None]):
+        self.sync = sync
+        self.writes = 0
+        self.commits = 0
+        self._pending: List[asyncio.Future] = []
+        self._running = False
+
+    async def commit(self) -> None:
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._pending.append(waiter)
+        self.writes += 1
+        if not self._running:
+            self._running = True
+            loop.create_task(self._run())
+        await waiter
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                try:
+                    await loop.run_in_executor(None, self.sync)
+                except OSError as e:
+                    for waiter in batch:
+                        waiter.set_exception(e)
+                    continue
+                self.commits += 1
+                for waiter in batch:
+                    waiter.set_result(None)
+        finally:
+            self._running = False
+
+
+class TaskAPI:
+    """Routes the JSON API requests to the task utilities.
+
+    Every handler returns an HTTP status and a JSON-serializable payload.
+    """
+
+    def __init__(self, store: TaskStore, committer: GroupCommit = None):
+        self.store = store
+        self.committer = committer
+        self.routes = [
+            ("GET", r"/tasks", self.list_tasks),
+            ("POST", r"/tasks", self.create_task),
+            ("GET", r"/tasks/(\d+)", self.get_task),
+            ("PATCH", r"/tasks/(\d+)", self.update_task),
+            ("DELETE", r"/tasks/(\d+)", self.delete_task),
+            ("GET", r"/tags", self.tag_usage),
+            ("GET", r"/next", self.next_tasks),
+            ("GET", r"/stats", self.stats),
+            ("GET", r"/metrics", self.export_metrics),
+        ]
+
+    @property
+    def tasks_list(self) -> List[Dict]:
+        return self.store.obj["tasks_list"]
+
+    async def handle(
+        self, method: str, target: str, body: bytes
+    ) -> Tuple[int, Dict]:
+        """Run the handler of a request, mapping errors to HTTP statuses."""
+        url = urlsplit(target)
+        allowed = False
+        for route_method, pattern, handler in self.routes:
+            match = re.fullmatch(pattern, url.path)
+            if match is None:
+                continue
+            allowed = True
+            if route_method != method:
+                continue
+            try:
+                params = {
+                    key: values[-1]
+                    for key, values in parse_qs(url.query).items()
+                }
+                data = json.loads(body) if body else {}
+                if not isinstance(data, dict):
+                    raise TaskValidationError("The body must be an object.")
+                args = [int(group) for group in match.groups()]
+                status, payload = handler(*args, params=params, data=data)
+                if method != "GET" and self.committer is not None:
+                    await self.committer.commit()
+                return status, payload
+            except TaskNotFoundError as e:
+                metrics.record_error(e)
+                return HTTPStatus.NOT_FOUND, {"error": str(e)}
+            except (TaskValidationError, ValueError, KeyError) as e:
+                metrics.record_error(e)
+                return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        if allowed:
+            return HTTPStatus.METHOD_NOT_ALLOWED, {
+                "error": "Method not allowed"
+            }
+        return HTTPStatus.NOT_FOUND, {"error": f"Unknown path {url.path}"}
+
+    # --- Handlers ---
+
+    def list_tasks(self, params: Dict, data: Dict):
+        tasks = self.tasks_list
+        due_within = params.get("due_within")
+        if params.get("overdue") or due_within is not None:
+            tasks = query_deadlines(
+                tasks,
+                overdue=bool(params.get("overdue")),
+                due_within=None if due_within is None else int(due_within),
+                index=cached_index(
+                    self.store.obj, "deadline_index", DeadlineIndex.from_tasks
+                ),
+            )
+        matches = task_matcher(
+            status=params.get("status"),
+            priority=params.get("priority"),
+            search=params.get("search"),
+            tag=params.get("tag"),
+        )
+        tasks = [task for task in tasks if matches(task)]
+        if "sort_by" in params:
+            tasks = sorted_task(
+                tasks,
+                sort_by=params["sort_by"],
+                ascending=params.get("order", "asc") != "desc",
+            )
+
+        page, size = int(params.get("page", 1)), int(params.get("size", 50))
+        if page < 1 or size < 1:
+            raise ValueError("'page' and 'size' must be positive.")
+        start = (page - 1) * size
+        return HTTPStatus.OK, {
+            "tasks": tasks[start:start + size],
+            "page": page,
+            "total_pages": (len(tasks) + size - 1) // size,
+            "total_tasks": len(tasks),
+        }
+
+    def get_task(self, task_id: int, params: Dict, data: Dict):
+        return HTTPStatus.OK, filter_by_id(task_id, self.tasks_list)
+
+    def create_task(self, params: Dict, data: Dict):
+        _check_fields(data, {"title": (str,), "description": (str,)})
+        task, _ = _create_task(
+            data.get("title", ""), data.get("description", ""), self.tasks_list
+        )
+        return HTTPStatus.CREATED, task
+
+    def update_task(self, task_id: int, params: Dict, data: Dict):
+        """Apply the fields of the body, checked before any change."""
+        task = filter_by_id(task_id, self.tasks_list)
+        unknown = set(data) - {
+            "title",
+            "description",
+            "status",
+            "priority",
+            "deadline",
+            "tags",
+        }
+        if unknown:
+            raise TaskValidationError(
+                f"Unknown fields: {', '.join(sorted(unknown))}"
+            )
+        _check_fields(
+            data,
+            {
+                "title": (str,),
+                "description": (str,),
+                "status": (str,),
+                "priority": (str,),
+                "deadline": (str, type(None)),
+                "tags": (dict,),
+            },
+        )
+        if "status" in data and data["status"] not in VALID_STATUSES:
+            raise TaskValidationError(
+                "Statut invalide. Valeurs autorisées : TODO, ONGOING, DONE"
+            )
+        if "priority" in data and data["priority"].upper() not in (
+            VALID_PRIORITIES
+        ):
+            raise TaskValidationError(
+                "Invalid priority. Allowed values: LOW, NORMAL, HIGH, CRITICAL"
+            )
+        if data.get("deadline") is not None:
+            parse_deadline(data["deadline"])
+        tags = data.get("tags", {})
+        if set(tags) - {"add", "remove"} or not all(
+            isinstance(values, list)
+            and all(isinstance(tag, str) for tag in values)
+            for values in tags.values()
+        ):
+            raise TaskValidationError(
+                "'tags' must be an object with 'add' and/or 'remove' lists."
+            )
+        for tag in tags.get("add", []) + tags.get("remove", []):
+            _validate_tag(tag)
+
+        if "title" in data or "description" in data:
+            _modify_task(
+                self.tasks_list,
+                task_id,
+                title=data.get("title"),
+                description=data.get("description"),
+            )
+        if tags.get("add"):
+            tags_manager(self.tasks_list, task_id, "add", tags["add"])
+        if tags.get("remove"):
+            tags_manager(self.tasks_list, task_id, "remove", tags["remove"])
+        if "priority" in data:
+            set_task_priority(task, data["priority"])
+        if "status" in data:
+            _change_task_status(self.tasks_list, task_id, data["status"])
+        if "deadline" in data:
+            if data["deadline"] is None:
+                if task.get("deadline"):
+                    DeadlineTask(
+                        self.tasks_list, task_id
+                    ).remove_deadline_from_task()
+            else:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", UserWarning)
+                    schedule_deadlines(
+                        self.tasks_list,
+                        assignments={task_id: data["deadline"]},
+                    )
+        return HTTPStatus.OK, task
+
+    def delete_task(self, task_id: int, params: Dict, data: Dict):
+        self.store.obj["tasks_list"] = _delete_task(
+            task_id,
+            self.tasks_list,
+            dependencies=self.store.obj.get("dependency_graph"),
+        )
+        return HTTPStatus.OK, {"deleted": task_id}
+
+    def tag_usage(self, params: Dict, data: Dict):
+        index = cached_index(self.store.obj, "tag_index", TagIndex.from_tasks)
+        return HTTPStatus.OK, index.usage()
+
+    def next_tasks(self, params: Dict, data: Dict):
+        queue = cached_index(
+            self.store.obj, "urgency_queue", UrgencyQueue.from_tasks
+        )
+        return HTTPStatus.OK, {"tasks": queue.top(int(params.get("k", 5)))}
+
+    def stats(self, params: Dict, data: Dict):
+        stats = {"tasks": len(self.tasks_list)}
+        if self.committer is not None:
+            stats["writes"] = self.committer.writes
+            stats["commits"] = self.committer.commits
+        stats.update(self.store.write_stats())
+        return HTTPStatus.OK, stats
+
+    def export_metrics(self, params: Dict, data: Dict):
+        """Prometheus text format, sent as is instead of JSON."""
+        return HTTPStatus.OK, metrics.enable().render(self.tasks_list)
+
+
+def _response(status: int, payload, keep_alive: bool) -> bytes:
+    if isinstance(payload, str):
+        body = payload.encode("utf-8")
+        content_type = metrics.CONTENT_TYPE
+    else:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        content_type = "application/json; charset=utf-8"
+    status = HTTPStatus(status)
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+async def _serve_connection(api: TaskAPI, reader, writer) -> None:
+    """Serve the HTTP/1.1 requests of one connection, with keep-alive."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            try:
+                method, target, version = (
+                    request_line.decode("latin-1").split()
+                )
+            except ValueError:
+                writer.write(
+                    _response(400, {"error": "Bad request line"}, False)
+                )
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            length = int(headers.get("content-length") or 0)
+            if length > MAX_BODY_SIZE:
+                writer.write(
+                    _response(413, {"error": "Body too large"}, False)
+                )
+                break
+            body = await reader.readexactly(length) if length else b""
+            keep_alive = (
+                version == "HTTP/1.1"
+                and headers.get("connection", "").lower() != "close"
+            )
+            status, payload = await api.handle(method, target, body)
+            writer.write(_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_api(
+    api: TaskAPI, host: str = "127.0.0.1", port: int = 8765
+) -> asyncio.AbstractServer:
+    """Start listening; the caller runs the loop and closes the server."""
+    return await asyncio.start_server(
+        lambda reader, writer: _serve_connection(api, reader, writer),
+        host,
+        port,
+    )
@@ -0,0 +1,75 @@
+"""Module to forward CLI commands to a running task server.
+
+Kept free of click and of the task modules so that forwarding a command
+costs little more than the interpreter startup.
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import Dict, List, Optional
+
+DEFAULT_SOCKET = ".tasks.sock"
+
+# Commands that never run inside the server
+LOCAL_COMMANDS = {"serve", "reminders", "shell", "api"}
+
+# Root options followed by a value
+ROOT_VALUE_OPTIONS = {"--storage", "--profile-file"}
+
+# Options keeping a command running, which would block the server, or
+# measuring the memory of the process itself
+LOCAL_OPTIONS = {"--watch", "--memory-report"}
+
+
+def socket_path() -> str:
+    """Path of the server socket, overridable with TASK_MANAGER_SOCKET."""
+    return os.environ.get("TASK_MANAGER_SOCKET", DEFAULT_SOCKET)
+
+
+def command_name(argv: List[str]) -> Optional[str]:
+    """Return the subcommand of a command line, skipping root options."""
+    i = 0
+    while i < len(argv) and argv[i].startswith("-"):
+        i += 2 if argv[i] in ROOT_VALUE_OPTIONS else 1
+    return argv[i] if i < len(argv) else None
+
+
+def runs_locally(argv: List[str]) -> bool:
+    """Return True if a command line must not be run by the server."""
+    return command_name(argv) in LOCAL_COMMANDS or any(
+        arg in LOCAL_OPTIONS for arg in argv
+    )
+
+
+def request(path: str, args: List[str], isatty: bool = False) -> Dict:
+    """Send a command line to the server and return its response.
+
+    The response holds the exit code and the captured stdout and stderr.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        payload = {"args": args, "isatty": isatty}
+        client.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile("r", encoding="utf-8") as reader:
+            return json.loads(reader.readline())
+
+
+def forward(argv: List[str], path: str = None) -> Optional[int]:
+    """Run a command on the server if one is listening.
+
+    Returns the exit code, or None when the command must run locally.
+    """
+    path = path or socket_path()
+    if runs_locally(argv) or not os.path.exists(path):
+        return None
+    try:
+        response = request(path, argv, sys.stdout.isatty())
+    except (ConnectionRefusedError, FileNotFoundError):
+        # Socket left behind by a server that is no longer running
+        return None
+    sys.stdout.write(response["output"])
+    sys.stderr.write(response["error"])
+    return response["exit_code"]
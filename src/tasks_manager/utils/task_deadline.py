@@ -1,6 +1,205 @@
-from datetime import datetime
+from bisect import bisect_left, bisect_right, insort
+import csv
+import heapq
+from datetime import date, timedelta
+import json
 import warnings
-from src.classes.errors import TaskNotFoundError
+from typing import Callable, Dict, List, Optional, Tuple
+from src.classes.errors import TaskNotFoundError, TaskValidationError
+from src.tasks_manager.utils.task_events import emit
+from src.tasks_manager.utils.timings import timed
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def parse_deadline(deadline: str) -> date:
+    """Parses a 'YYYY-MM-DD' deadline into a date."""
+    # date.fromisoformat is much faster than strptime but also accepts
+    # other ISO 8601 forms, hence the shape check.
+    if (
+        isinstance(deadline, str)
+        and len(deadline) == 10
+        and deadline[4] == deadline[7] == "-"
+    ):
+        try:
+            return date.fromisoformat(deadline)
+        except ValueError:
+            pass
+    raise ValueError("Deadline must be in 'YYYY-MM-DD' format.")
+
+
+def epoch_day(day: date) -> int:
+    """Returns the number of days since 1970-01-01."""
+    return day.toordinal() - EPOCH_ORDINAL
+
+
+class DeadlineIndex:
+    """Sorted (epoch_day, id) pairs of the tasks having a deadline.
+
+    Range queries are two bisections plus a slice: O(log n + k). The index
+    follows create, delete and deadline events from `task_events`.
+    """
+
+    def __init__(self):
+        self._keys: List[tuple] = []
+        self._day_of: Dict[int, int] = {}
+        self._tasks: Dict[int, Dict] = {}
+
+    @classmethod
+    def from_tasks(cls, tasks_list: List[Dict]) -> "DeadlineIndex":
+        """Build the index of a task list."""
+        index = cls()
+        for task in tasks_list:
+            day = _task_epoch_day(task)
+            if day is not None:
+                index._keys.append((day, task["id"]))
+                index._day_of[task["id"]] = day
+                index._tasks[task["id"]] = task
+        index._keys.sort()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def apply(self, action: str, task: Dict, previous: Dict) -> None:
+        """Follow a task mutation notified through `task_events`."""
+        if action == "delete":
+            self.discard(task["id"])
+        elif action in ("create", "deadline"):
+            self.update(task)
+
+    def update(self, task: Dict) -> None:
+        """Index the current deadline of a task."""
+        self.discard(task["id"])
+        day = _task_epoch_day(task)
+        if day is not None:
+            insort(self._keys, (day, task["id"]))
+            self._day_of[task["id"]] = day
+            self._tasks[task["id"]] = task
+
+    def discard(self, task_id: int) -> None:
+        """Remove a task from the index."""
+        day = self._day_of.pop(task_id, None)
+        if day is not None:
+            del self._keys[bisect_left(self._keys, (day, task_id))]
+            del self._tasks[task_id]
+
+    def between(self, start: date, end: date) -> List[Dict]:
+        """Return the tasks due from `start` to `end` included."""
+        return self._range(epoch_day(start), epoch_day(end) + 1)
+
+    def before(self, day: date) -> List[Dict]:
+        """Return the tasks due strictly before `day`."""
+        return self._range(None, epoch_day(day))
+
+    def _range(self, start: Optional[int], stop: int) -> List[Dict]:
+        low = 0 if start is None else bisect_left(self._keys, (start,))
+        high = bisect_right(self._keys, (stop,), lo=low)
+        return [self._tasks[task_id] for _, task_id in self._keys[low:high]]
+
+
+def _task_epoch_day(task: Dict) -> Optional[int]:
+    try:
+        return epoch_day(parse_deadline(task.get("deadline")))
+    except ValueError:
+        return None
+
+
+def overdue_tasks(
+    tasks_list: List[Dict], today: date = None, index: DeadlineIndex = None
+) -> List[Dict]:
+    """Returns the unfinished tasks whose deadline has passed."""
+    today = today or date.today()
+    index = index or DeadlineIndex.from_tasks(tasks_list)
+    return [task for task in index.before(today) if task["status"] != "DONE"]
+
+
+def tasks_due_within(
+    tasks_list: List[Dict],
+    days: int,
+    today: date = None,
+    index: DeadlineIndex = None,
+    occurrences=None,
+) -> List[Dict]:
+    """Returns the tasks due between today and `days` days from now."""
+    if days < 0:
+        raise TaskValidationError("The number of days must be positive.")
+    today = today or date.today()
+    return _window(
+        tasks_list, today, today + timedelta(days=days), index, occurrences
+    )
+
+
+def tasks_due_between(
+    tasks_list: List[Dict],
+    start: str,
+    end: str,
+    index: DeadlineIndex = None,
+    occurrences=None,
+) -> List[Dict]:
+    """Returns the tasks due between two 'YYYY-MM-DD' dates included."""
+    start_day, end_day = parse_deadline(start), parse_deadline(end)
+    if end_day < start_day:
+        raise TaskValidationError("The end date must follow the start date.")
+    return _window(tasks_list, start_day, end_day, index, occurrences)
+
+
+def _window(tasks_list, start, end, index=None, occurrences=None):
+    """Returns the tasks due in a window, merged with the occurrences of
+    recurring tasks when a `RecurrenceIndex` is given.
+
+    A recurring template is then listed through its occurrences only, its
+    own deadline being one of them."""
+    index = index or DeadlineIndex.from_tasks(tasks_list)
+    tasks = index.between(start, end)
+    if occurrences is None or not len(occurrences):
+        return tasks
+    return list(
+        heapq.merge(
+            (task for task in tasks if not task.get("recurrence")),
+            occurrences.expand(start, end),
+            key=lambda task: task["deadline"],
+        )
+    )
+
+
+@timed("query")
+def query_deadlines(
+    tasks_list: List[Dict],
+    overdue: bool = False,
+    due_within: int = None,
+    due_between: tuple = None,
+    index: DeadlineIndex = None,
+    today: date = None,
+    occurrences=None,
+) -> Optional[List[Dict]]:
+    """Runs the deadline query selected by the CLI options, if any.
+
+    Returns None when no query is requested, tasks sorted by deadline
+    otherwise. Window queries include the occurrences of recurring tasks
+    when `occurrences` is given.
+    """
+    requested = sum([bool(overdue), due_within is not None, bool(due_between)])
+    if requested > 1:
+        raise TaskValidationError(
+            "Only one of --overdue, --due-within and --due-between "
+            "can be used at a time."
+        )
+    if overdue:
+        return overdue_tasks(tasks_list, today=today, index=index)
+    if due_within is not None:
+        return tasks_due_within(
+            tasks_list,
+            due_within,
+            today=today,
+            index=index,
+            occurrences=occurrences,
+        )
+    if due_between:
+        return tasks_due_between(
+            tasks_list, *due_between, index=index, occurrences=occurrences
+        )
+    return None
 
 
 class DeadlineTask:
@@ -17,29 +216,14 @@ class DeadlineTask:
         if self.task is None:
             raise TaskNotFoundError(f"Task not found with ID {task_id}.")
 
-        # check if the deadline is in the correct format
-        if self.deadline:
-            try:
-                datetime.strptime(self.deadline, "%Y-%m-%d")
-            except ValueError:
-                raise ValueError("Deadline must be in 'YYYY-MM-DD' format.")
-
-        # check if the deadline is not in the past
+        # check the deadline format, then that it is not in the past
         if self.deadline:
-            deadline_date = datetime.strptime(self.deadline, "%Y-%m-%d")
-            if deadline_date < datetime.now():
+            if parse_deadline(self.deadline) < date.today():
                 warnings.warn(
                     "The deadline is in the past",
                     UserWarning,
                 )
 
-    def _update(self):
-        """Updates the task in the task list."""
-        for i, task in enumerate(self.task_list):
-            if task["id"] == self.task_id:
-                self.task_list[i] = self.task
-                break
-
     def add_deadline_to_task(self):
         """Adds a deadline to a task.
 
@@ -50,10 +234,10 @@ class DeadlineTask:
         Returns:
             dict: The updated task with the deadline added.
         """
+        previous = self.task.get("deadline")
         self.task["deadline"] = self.deadline
-        print(f"Adding deadline {self.deadline} to task {self.task}")
 
-        self._update()
+        emit("deadline", self.task, {"deadline": previous})
 
     def modify_task_deadline(self):
         """Modifies the deadline of a task.
@@ -66,10 +250,11 @@ class DeadlineTask:
             dict: The updated task with the modified deadline.
         """
         if "deadline" in self.task:
+            previous = self.task["deadline"]
             self.task["deadline"] = self.deadline
         else:
             raise KeyError("Task does not have a deadline to modify.")
-        self._update()
+        emit("deadline", self.task, {"deadline": previous})
 
     def remove_deadline_from_task(self):
         """Removes the deadline from a task.
@@ -81,7 +266,89 @@ class DeadlineTask:
             dict: The updated task without the deadline.
         """
         if "deadline" in self.task:
+            previous = self.task["deadline"]
             self.task["deadline"] = None
         else:
             raise KeyError("Task does not have a deadline to remove.")
-        self._update()
+        emit("deadline", self.task, {"deadline": previous})
+
+
+def schedule_deadlines(
+    tasks_list: List[Dict],
+    deadline: str = None,
+    select: Callable[[Dict], bool] = None,
+    assignments: Dict[int, str] = None,
+    today: date = None,
+) -> Tuple[List[Dict], List[int]]:
+    """Sets deadlines on many tasks in a single pass.
+
+    Either gives `deadline` to every task accepted by `select`, or applies
+    a per-task `assignments` mapping of task IDs to deadlines. Each
+    distinct date is parsed once, and deadlines in the past raise a single
+    aggregated warning.
+
+    :return: The updated tasks and the IDs of those with a past deadline.
+    """
+    if (deadline is None) == (assignments is None):
+        raise TaskValidationError(
+            "Provide either one deadline or a mapping of deadlines."
+        )
+    if assignments is None:
+        select = select or (lambda task: True)
+        parsed = {deadline: parse_deadline(deadline)}
+    else:
+        distinct_days = set(assignments.values())
+        parsed = {day: parse_deadline(day) for day in distinct_days}
+
+    # Resolve every task before mutating anything
+    updates = []
+    for task in tasks_list:
+        if assignments is None:
+            if select(task):
+                updates.append((task, deadline))
+        elif task["id"] in assignments:
+            updates.append((task, assignments[task["id"]]))
+
+    if assignments is not None and len(updates) != len(assignments):
+        found = {task["id"] for task, _ in updates}
+        missing = sorted(set(assignments) - found)
+        raise TaskNotFoundError(
+            f"Tasks not found with IDs {', '.join(map(str, missing))}."
+        )
+
+    today = today or date.today()
+    past = []
+    for task, new_deadline in updates:
+        previous = task.get("deadline")
+        task["deadline"] = new_deadline
+        emit("deadline", task, {"deadline": previous})
+        if parsed[new_deadline] < today:
+            past.append(task["id"])
+
+    if past:
+        warnings.warn(f"{len(past)} deadline(s) are in the past", UserWarning)
+    return [task for task, _ in updates], past
+
+
+def load_deadline_mapping(path: str) -> Dict[int, str]:
+    """Reads a mapping of task IDs to deadlines.
+
+    The file is either a JSON object (`{"12": "2025-07-07"}`) or a CSV
+    file of `id,deadline` rows.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    try:
+        if content.lstrip().startswith("{"):
+            mapping = json.loads(content)
+            return {int(task_id): day for task_id, day in mapping.items()}
+        return {
+            int(row[0]): row[1].strip()
+            for row in csv.reader(content.splitlines())
+            if row and row[0].strip().isdigit()
+        }
+    except (ValueError, IndexError, AttributeError):
+        raise TaskValidationError(
+            f"Invalid deadline mapping file '{path}'. Expected a JSON object "
+            "or 'id,deadline' CSV rows."
+        )
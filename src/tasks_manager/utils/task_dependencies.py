@@ -0,0 +1,302 @@
+"""Module to manage 'blocked by' dependencies between tasks.
+
+A task lists the IDs of the tasks blocking it in its `blocked_by` field.
+`DependencyGraph` indexes these edges both ways, keeps a topological order
+of the tasks up to date as edges are added (Pearce-Kelly: only the tasks
+between the two ends of an out-of-order edge are visited, which is also
+how a cycle is detected) and counts the open blockers of every task, so
+the unblocked tasks are known without scanning the graph.
+"""
+
+from typing import Dict, Iterable, List, Set
+
+from src.classes.errors import TaskNotFoundError, TaskValidationError
+from src.tasks_manager.utils.query_utils import filter_by_id
+from src.tasks_manager.utils.task_events import emit
+
+DONE_STATUS = "DONE"
+
+
+def _is_open(task: Dict) -> bool:
+    return task.get("status") != DONE_STATUS
+
+
+class DependencyGraph:
+    """Adjacency indexes, topological order and open-blocker counters.
+
+    `blockers` and `dependents` only hold the tasks having edges. A task
+    blocked by an unknown ID waits in `_waiting` until a task of that ID is
+    created.
+    `ready` holds the open tasks without any open blocker, in the order
+    they became unblocked, so `unblocked(k)` costs O(k).
+    """
+
+    def __init__(self):
+        self.tasks: Dict[int, Dict] = {}
+        self.blockers: Dict[int, Set[int]] = {}
+        self.dependents: Dict[int, Set[int]] = {}
+        self.open_blockers: Dict[int, int] = {}
+        self.ready: Dict[int, None] = {}
+        self._order: Dict[int, int] = {}
+        self._waiting: Dict[int, Set[int]] = {}
+        self._low = 0
+        self._high = 0
+
+    @classmethod
+    def from_tasks(cls, tasks_list: List[Dict]) -> "DependencyGraph":
+        """Build the graph of a task list."""
+        graph = cls()
+        for task in tasks_list:
+            graph._register(task)
+        for task in tasks_list:
+            for blocker_id in task.get("blocked_by", ()):
+                if blocker_id in graph.tasks:
+                    graph._link(blocker_id, task["id"])
+                else:
+                    graph._waiting.setdefault(blocker_id, set()).add(
+                        task["id"]
+                    )
+        graph._sort()
+        return graph
+
+    def _sort(self) -> None:
+        """Initial topological order (Kahn), ignoring the edges of cycles."""
+        pending = {tid: len(ids) for tid, ids in self.blockers.items()}
+        queue = [tid for tid in self.tasks if tid not in pending]
+        position = 0
+        while queue:
+            task_id = queue.pop()
+            self._order[task_id] = position
+            position += 1
+            for dependent in self.dependents.get(task_id, ()):
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    queue.append(dependent)
+        cyclic = [tid for tid in self.tasks if tid not in self._order]
+        for task_id in cyclic:
+            for blocker_id in list(self.blockers.get(task_id, ())):
+                if blocker_id not in self._order:
+                    self._unlink(blocker_id, task_id)
+        for task_id in cyclic:
+            self._order[task_id] = position
+            position += 1
+        self._low, self._high = 0, position
+
+    def __len__(self) -> int:
+        return len(self.ready)
+
+    # --- Counters ---
+
+    def _refresh(self, task_id: int) -> None:
+        if _is_open(self.tasks[task_id]) and not self.open_blockers[task_id]:
+            self.ready[task_id] = None
+        else:
+            self.ready.pop(task_id, None)
+
+    def _register(self, task: Dict) -> None:
+        task_id = task["id"]
+        self.tasks[task_id] = task
+        self.open_blockers.setdefault(task_id, 0)
+        self._refresh(task_id)
+
+    def _link(self, blocker_id: int, task_id: int) -> None:
+        self.blockers.setdefault(task_id, set()).add(blocker_id)
+        self.dependents.setdefault(blocker_id, set()).add(task_id)
+        if _is_open(self.tasks[blocker_id]):
+            self.open_blockers[task_id] += 1
+            self._refresh(task_id)
+
+    def _unlink(self, blocker_id: int, task_id: int) -> None:
+        for index, key, value in (
+            (self.blockers, task_id, blocker_id),
+            (self.dependents, blocker_id, task_id),
+        ):
+            index[key].discard(value)
+            if not index[key]:
+                del index[key]
+        if _is_open(self.tasks[blocker_id]):
+            self.open_blockers[task_id] -= 1
+            self._refresh(task_id)
+
+    def discard(self, task_id: int) -> None:
+        """Remove a task and its edges, in O(degree)."""
+        if task_id not in self.tasks:
+            return
+        for blocker_id in list(self.blockers.get(task_id, ())):
+            self._unlink(blocker_id, task_id)
+        for dependent in list(self.dependents.get(task_id, ())):
+            self._unlink(task_id, dependent)
+            if task_id in self.tasks[dependent].get("blocked_by", ()):
+                self._waiting.setdefault(task_id, set()).add(dependent)
+        del self.tasks[task_id]
+        del self.open_blockers[task_id]
+        self.ready.pop(task_id, None)
+        self._order.pop(task_id, None)
+
+    # --- Topological order ---
+
+    def _position(self, task_id: int, first: bool) -> int:
+        """Order of a task, placing an unordered one first or last."""
+        if task_id not in self._order:
+            if first:
+                self._low -= 1
+                self._order[task_id] = self._low
+            else:
+                self._order[task_id] = self._high
+                self._high += 1
+        return self._order[task_id]
+
+    def _reorder(self, blocker_id: int, task_id: int) -> bool:
+        """Make room for the edge blocker -> task in the topological order.
+
+        Returns False, leaving the order unchanged, if the edge would close
+        a cycle. Only the tasks ordered between the two ends are visited.
+        """
+        upper = self._position(blocker_id, first=True)
+        lower = self._position(task_id, first=False)
+        if upper < lower:
+            return True
+        # tâches qui dépendent de task_id, placées avant blocker_id
+        forward, stack = {task_id}, [task_id]
+        while stack:
+            for dependent in self.dependents.get(stack.pop(), ()):
+                if dependent == blocker_id:
+                    return False
+                if dependent in forward:
+                    continue
+                if self._order[dependent] < upper:
+                    forward.add(dependent)
+                    stack.append(dependent)
+        # tâches qui bloquent blocker_id, placées après task_id
+        backward, stack = {blocker_id}, [blocker_id]
+        while stack:
+            for blocker in self.blockers.get(stack.pop(), ()):
+                if blocker not in backward and self._order[blocker] > lower:
+                    backward.add(blocker)
+                    stack.append(blocker)
+        moved = sorted(backward, key=self._order.get)
+        moved += sorted(forward, key=self._order.get)
+        slots = sorted(self._order[tid] for tid in moved)
+        for tid, slot in zip(moved, slots):
+            self._order[tid] = slot
+        return True
+
+    def check(self, blocker_id: int, task_id: int) -> None:
+        """Raise if task_id cannot wait for blocker_id; reorder otherwise."""
+        if blocker_id == task_id:
+            raise TaskValidationError(
+                f"La tâche {task_id} ne peut pas dépendre d'elle-même."
+            )
+        if not self._reorder(blocker_id, task_id):
+            raise TaskValidationError(
+                f"Dépendance refusée : la tâche {blocker_id} dépend déjà "
+                f"(directement ou non) de la tâche {task_id}."
+            )
+
+    # --- Queries and events ---
+
+    def unblocked(self, count: int = None) -> List[Dict]:
+        """The first `count` open tasks without any open blocker."""
+        tasks = []
+        for task_id in self.ready:
+            if count is not None and len(tasks) >= count:
+                break
+            tasks.append(self.tasks[task_id])
+        return tasks
+
+    def _sync(self, task: Dict) -> None:
+        """Update the edges of a task from its `blocked_by` field."""
+        task_id = task["id"]
+        wanted = set()
+        for blocker_id in task.get("blocked_by", ()):
+            if blocker_id in self.tasks:
+                wanted.add(blocker_id)
+            else:
+                self._waiting.setdefault(blocker_id, set()).add(task_id)
+        current = set(self.blockers.get(task_id, ()))
+        for blocker_id in current - wanted:
+            self._unlink(blocker_id, task_id)
+        for blocker_id in wanted - current:
+            # une dépendance circulaire écrite hors de l'outil est ignorée
+            if blocker_id != task_id and self._reorder(blocker_id, task_id):
+                self._link(blocker_id, task_id)
+
+    def apply(self, action: str, task: Dict, previous: Dict) -> None:
+        """Follow a task mutation notified through `task_events`."""
+        task_id = task["id"]
+        if action == "delete":
+            self.discard(task_id)
+        elif action == "create":
+            self.discard(task_id)
+            self._register(task)
+            self._sync(task)
+            for waiting in self._waiting.pop(task_id, ()):
+                if waiting in self.tasks:
+                    self._sync(self.tasks[waiting])
+        elif task_id not in self.tasks:
+            return
+        elif action == "dependencies":
+            self._sync(task)
+        elif action == "status":
+            was_open = previous.get("status") != DONE_STATUS
+            self.tasks[task_id] = task
+            if was_open != _is_open(task):
+                step = 1 if _is_open(task) else -1
+                for dependent in self.dependents.get(task_id, ()):
+                    self.open_blockers[dependent] += step
+                    self._refresh(dependent)
+            self._refresh(task_id)
+
+
+def _set_blockers(task: Dict, blockers: List[int]) -> None:
+    previous = {"blocked_by": task.get("blocked_by")}
+    if blockers:
+        task["blocked_by"] = blockers
+    else:
+        task.pop("blocked_by", None)
+    emit("dependencies", task, previous)
+
+
+def add_dependencies(
+    tasks_list: List[Dict],
+    task_id: int,
+    blocker_ids: Iterable[int],
+    graph: DependencyGraph = None,
+) -> Dict:
+    """Mark a task as blocked by other tasks and return it.
+
+    Raises TaskValidationError if a dependency would create a cycle.
+    """
+    graph = graph or DependencyGraph.from_tasks(tasks_list)
+    task = graph.tasks.get(task_id) or filter_by_id(task_id, tasks_list)
+    current = list(task.get("blocked_by", ()))
+    added = []
+    for blocker_id in blocker_ids:
+        if blocker_id not in graph.tasks:
+            raise TaskNotFoundError(
+                f"Tâche avec l'ID {blocker_id} non trouvée."
+            )
+        if blocker_id in current or blocker_id in added:
+            continue
+        graph.check(blocker_id, task_id)
+        added.append(blocker_id)
+    if added:
+        _set_blockers(task, current + added)
+    return task
+
+
+def remove_dependencies(
+    tasks_list: List[Dict], task_id: int, blocker_ids: Iterable[int]
+) -> Dict:
+    """Remove blockers of a task and return it."""
+    task = filter_by_id(task_id, tasks_list)
+    current = task.get("blocked_by", [])
+    removed = set(blocker_ids)
+    missing = removed - set(current)
+    if missing:
+        raise TaskValidationError(
+            f"La tâche {task_id} n'est pas bloquée par : "
+            + ", ".join(str(tid) for tid in sorted(missing))
+        )
+    _set_blockers(task, [tid for tid in current if tid not in removed])
+    return task
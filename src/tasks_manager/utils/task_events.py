@@ -0,0 +1,82 @@
+"""Module to notify in-memory indexes of task mutations."""
+
+import weakref
+from typing import Callable, Dict, List
+
+Listener = Callable[[str, Dict, Dict], None]
+
+_listeners: List[Callable[[], Listener]] = []
+
+
+def subscribe(listener: Listener) -> None:
+    """Register a listener called after every task mutation.
+
+    The listener receives the action name, the task and a dict holding the
+    previous values of the changed fields, None for a field the task did
+    not have (undo then removes it again). Bound methods are held weakly so
+    that an index dropped by its owner stops receiving events.
+    """
+    if hasattr(listener, "__self__"):
+        _listeners.append(weakref.WeakMethod(listener))
+    else:
+        _listeners.append(lambda: listener)
+
+
+def unsubscribe(listener: Listener) -> None:
+    """Remove a listener previously registered with `subscribe`."""
+    _listeners[:] = [
+        ref for ref in _listeners if ref() not in (None, listener)
+    ]
+
+
+def emit(action: str, task: Dict, previous: Dict = None) -> None:
+    """Notify every listener that a task has been mutated."""
+    dead = False
+    for ref in list(_listeners):
+        listener = ref()
+        if listener is None:
+            dead = True
+            continue
+        listener(action, task, previous or {})
+    if dead:
+        _listeners[:] = [ref for ref in _listeners if ref() is not None]
+
+
+def replace_tasks(tasks_list: List[Dict], fresh: List[Dict]) -> int:
+    """Replace the tasks in place by `fresh`, notifying the changed ones.
+
+    A changed task is reported as a 'delete' of the old version and a
+    'create' of the new one, so indexes and the operation log follow (a
+    restore can be undone). Returns the number of changed records.
+    """
+    current = {task["id"]: task for task in tasks_list}
+    merged, created = [], []
+    for task in fresh:
+        old = current.pop(task["id"], None)
+        if old == task:
+            merged.append(old)
+            continue
+        if old is not None:
+            emit("delete", old)
+        merged.append(task)
+        created.append(task)
+    for old in current.values():
+        emit("delete", old)
+    tasks_list[:] = merged
+    for task in created:
+        emit("create", task)
+    return len(created) + len(current)
+
+
+def cached_index(obj: Dict, key: str, build: Callable[[List[Dict]], object]):
+    """Return the index stored under `key`, building it on first use.
+
+    The index is built from `obj["tasks_list"]` and subscribed through its
+    `apply` method so that it follows subsequent mutations.
+    """
+    index = obj.get(key)
+    if index is None:
+        index = build(obj["tasks_list"])
+        subscribe(index.apply)
+        obj[key] = index
+    return index
@@ -0,0 +1,379 @@
+"""Module to record task mutations in an operation log for undo and redo.
+
+Each CLI command forms one group of operations. A record holds the
+changed fields of a task before (`b`) and after (`f`) the mutation, so any
+group can be reverted or re-applied without the rest of the log. The undo
+and redo stacks and a per-task index of record offsets are snapshotted in
+a side file every `snapshot_every` records; opening the log only replays
+the records written since the last snapshot.
+"""
+
+import copy
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.classes.errors import TaskValidationError
+from src.tasks_manager.utils.task_events import emit, subscribe
+
+SNAPSHOT_EVERY = 1000
+
+# Clés des enregistrements : s numéro, g groupe, c commande (premier
+# enregistrement du groupe), t date, a action, i tâche, b avant, f après ;
+# u et r marquent l'annulation et le rétablissement d'un groupe
+Group = List  # [group, start offset, end offset, command, records]
+
+
+def oplog_path(data_file: str) -> str:
+    """Path of the operation log kept next to a data file."""
+    return f"{data_file}.oplog"
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class OperationLog:
+    """Undo/redo log of the mutations made by the commands.
+
+    `begin` opens a group, the mutations reported by `task_events` are
+    buffered, and `commit` appends them under a lock shared with the other
+    processes using the same data file.
+    """
+
+    def __init__(self, data_file: str, snapshot_every: int = SNAPSHOT_EVERY):
+        self.path = oplog_path(data_file)
+        self.index_path = f"{self.path}.idx"
+        self.snapshot_every = snapshot_every
+        self._loaded = False
+        self._pending: List[Dict] = []
+        self._command = None
+        self._shared = False
+        self._open = False
+        self._replaying = False
+        subscribe(self.record)
+
+    # --- State read from the index snapshot and the log ---
+
+    def _reset(self) -> None:
+        self.size = 0
+        self.seq = 0
+        self.tasks: Dict[int, List[int]] = {}
+        self.undo_stack: List[Group] = []
+        self.redo_stack: List[Group] = []
+        self.undone = set()
+        self.since_snapshot = 0
+
+    def _load(self) -> None:
+        """Read the index snapshot, then the records written after it."""
+        self._reset()
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = None
+        if state is not None and state["size"] <= size:
+            self.size = state["size"]
+            self.seq = state["seq"]
+            self.tasks = {int(k): v for k, v in state["tasks"].items()}
+            self.undo_stack = state["undo"]
+            self.redo_stack = state["redo"]
+            self.undone = set(state["undone"])
+        self._catch_up()
+        self._loaded = True
+
+    def _refresh(self) -> None:
+        """Catch up with the records other processes appended."""
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if not self._loaded or size < self.size:
+            self._load()
+        else:
+            self._catch_up()
+
+    def _catch_up(self) -> None:
+        """Index the records appended since `self.size`."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self.size)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # écriture interrompue
+                self._index(json.loads(line), self.size)
+                self.size += len(line)
+                self.since_snapshot += 1
+
+    def _index(self, entry: Dict, offset: int) -> None:
+        self.seq = entry["s"]
+        if "u" in entry:
+            self._move(self.undo_stack, self.redo_stack, entry["u"])
+            self.undone.add(entry["u"])
+        elif "r" in entry:
+            self._move(self.redo_stack, self.undo_stack, entry["r"])
+            self.undone.discard(entry["r"])
+        else:
+            self.tasks.setdefault(entry["i"], []).append(offset)
+            top = self.undo_stack[-1] if self.undo_stack else None
+            if top is None or top[0] != entry["g"]:
+                top = [entry["g"], offset, offset, entry.get("c"), 0]
+                self.undo_stack.append(top)
+                self.redo_stack = []
+            top[2] = offset
+            top[4] += 1
+
+    @staticmethod
+    def _move(source: List[Group], target: List[Group], group: int) -> None:
+        for i in range(len(source) - 1, -1, -1):
+            if source[i][0] == group:
+                target.append(source.pop(i))
+                return
+
+    def _write_index(self) -> None:
+        state = {
+            "size": self.size,
+            "seq": self.seq,
+            "tasks": self.tasks,
+            "undo": self.undo_stack,
+            "redo": self.redo_stack,
+            "undone": sorted(self.undone),
+        }
+        tmp_file = f"{self.index_path}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp_file, self.index_path)
+        self.since_snapshot = 0
+
+    def _locked(self):
+        import fcntl
+
+        lock = open(f"{self.path}.lock", "w")
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    # --- Recording ---
+
+    def begin(self, command: str = None, shared: bool = False) -> None:
+        """Start the group of a command.
+
+        A `shared` group belongs to a server or shell whose changes are
+        persisted even when the command does not save the data file.
+        """
+        self._pending = []
+        self._command = command
+        self._shared = shared
+        self._open = True
+
+    def record(self, action: str, task: Dict, previous: Dict) -> None:
+        """Buffer a mutation; subscribed to `task_events`."""
+        if not self._open or self._replaying:
+            return
+        entry = {"a": action, "i": task["id"]}
+        if action == "create":
+            entry["f"] = copy.deepcopy(task)
+        elif action == "delete":
+            entry["b"] = copy.deepcopy(task)
+        else:
+            entry["b"] = copy.deepcopy(previous)
+            entry["f"] = {
+                field: copy.deepcopy(task.get(field)) for field in previous
+            }
+        self._pending.append(entry)
+
+    def commit(self, saved: bool = True) -> int:
+        """Append the group if its changes were persisted; return its size.
+
+        Undo and redo markers are pending entries as well, so that they are
+        only logged once the data file holds their effect.
+        """
+        pending, self._pending = self._pending, []
+        self._open = False
+        if not pending or not (saved or self._shared):
+            return 0
+        with self._locked():
+            self._refresh()
+            group, now = self.seq + 1, _now()
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                for n, entry in enumerate(pending):
+                    head = {"s": self.seq + 1, "t": now}
+                    if "a" in entry:
+                        head["g"] = group
+                        if n == 0:
+                            head["c"] = self._command
+                    entry = {**head, **entry}
+                    data = json.dumps(entry, ensure_ascii=False) + "\n"
+                    data = data.encode("utf-8")
+                    f.write(data)
+                    self._index(entry, offset)
+                    offset += len(data)
+                    self.since_snapshot += 1
+            self.size = offset
+            if self.since_snapshot >= self.snapshot_every:
+                self._write_index()
+        return len(pending)
+
+    def discard(self) -> None:
+        """Drop the group of a command that failed before saving."""
+        self._pending = []
+        self._open = False
+
+    # --- Undo, redo and history ---
+
+    def _entries(self, group: Group) -> List[Dict]:
+        """Records of a group, read between its first and last offsets."""
+        entries = []
+        with open(self.path, "rb") as f:
+            f.seek(group[1])
+            while f.tell() <= group[2]:
+                entry = json.loads(f.readline())
+                if entry.get("g") == group[0]:
+                    entries.append(entry)
+        return entries
+
+    def _ensure_loaded(self) -> None:
+        with self._locked():
+            self._refresh()
+
+    def undo(self, tasks_list: List[Dict]) -> Optional[Tuple[Group, int]]:
+        """Revert the last group still applied; None if there is none."""
+        self._ensure_loaded()
+        pending_undos = {e["u"] for e in self._pending if "u" in e}
+        candidates = [g for g in self.undo_stack if g[0] not in pending_undos]
+        if not candidates:
+            return None
+        group = candidates[-1]
+        entries = self._entries(group)
+        self._apply(tasks_list, entries, undo=True)
+        self._pending.append({"u": group[0]})
+        return group, len(entries)
+
+    def redo(self, tasks_list: List[Dict]) -> Optional[Tuple[Group, int]]:
+        """Re-apply the last undone group; None if there is none."""
+        self._ensure_loaded()
+        pending_redos = {e["r"] for e in self._pending if "r" in e}
+        candidates = [g for g in self.redo_stack if g[0] not in pending_redos]
+        if not candidates:
+            return None
+        group = candidates[-1]
+        entries = self._entries(group)
+        self._apply(tasks_list, entries, undo=False)
+        self._pending.append({"r": group[0]})
+        return group, len(entries)
+
+    def history(
+        self, task_id: int, limit: int = None
+    ) -> Iterator[Tuple[Dict, bool]]:
+        """Records of a task, oldest first, with their undone status.
+
+        Only the offsets indexed for the task (the last `limit` ones) are
+        read.
+        """
+        self._ensure_loaded()
+        offsets = self.tasks.get(task_id, [])
+        if limit is not None:
+            offsets = offsets[-limit:]
+        if not offsets:
+            return
+        with open(self.path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                entry = json.loads(f.readline())
+                yield entry, entry["g"] in self.undone
+
+    def _apply(self, tasks_list: List[Dict], entries, undo: bool) -> None:
+        """Revert (`undo`) or re-apply records, all or nothing.
+
+        The records are first played on copies of the tasks involved, which
+        checks that no later change conflicts with them.
+        """
+        if undo:
+            entries = list(reversed(entries))
+        by_id = {task["id"]: task for task in tasks_list}
+        states = {
+            entry["i"]: copy.deepcopy(by_id.get(entry["i"]))
+            for entry in entries
+        }
+        for entry in entries:
+            states[entry["i"]] = _step(states[entry["i"]], entry, undo)
+
+        self._replaying = True
+        try:
+            for entry in entries:
+                task = by_id.get(entry["i"])
+                after = entry.get("b") if undo else entry.get("f")
+                if task is None:
+                    task = by_id[entry["i"]] = copy.deepcopy(after)
+                    _insert_by_id(tasks_list, task)
+                    emit("create", task)
+                elif entry["a"] in ("create", "delete"):
+                    del by_id[entry["i"]]
+                    position = next(
+                        i for i, other in enumerate(tasks_list)
+                        if other is task
+                    )
+                    del tasks_list[position]
+                    emit("delete", task)
+                else:
+                    previous = {field: task.get(field) for field in after}
+                    _set_fields(task, after)
+                    emit(entry["a"], task, previous)
+        finally:
+            self._replaying = False
+
+
+def _insert_by_id(tasks_list: List[Dict], task: Dict) -> None:
+    """Insert a task before the first task of a greater ID."""
+    position = next(
+        (
+            i
+            for i, other in enumerate(tasks_list)
+            if other["id"] > task["id"]
+        ),
+        len(tasks_list),
+    )
+    tasks_list.insert(position, task)
+
+
+def _set_fields(task: Dict, values: Dict) -> None:
+    for field, value in values.items():
+        if value is None:
+            task.pop(field, None)
+        else:
+            task[field] = copy.deepcopy(value)
+
+
+def _step(state: Optional[Dict], entry: Dict, undo: bool) -> Optional[Dict]:
+    """Play one record on a copy of its task, checking it still applies."""
+    expected, target = ("f", "b") if undo else ("b", "f")
+    action = entry["a"]
+    creates = (action == "delete") if undo else (action == "create")
+    deletes = (action == "create") if undo else (action == "delete")
+    if creates:
+        if state is not None:
+            raise _conflict(entry)
+        return copy.deepcopy(entry[target])
+    if state is None:
+        raise _conflict(entry)
+    if deletes:
+        return None
+    if any(state.get(k) != v for k, v in entry[expected].items()):
+        raise _conflict(entry)
+    _set_fields(state, entry[target])
+    return state
+
+
+def _conflict(entry: Dict) -> TaskValidationError:
+    return TaskValidationError(
+        f"La tâche {entry['i']} a changé depuis l'opération #{entry['s']} : "
+        "annulation ou rétablissement impossible."
+    )
+
+
+def operation_log(obj: Dict) -> OperationLog:
+    """Return the operation log of a context object, opening it once."""
+    log = obj.get("op_log")
+    if log is None:
+        log = obj["op_log"] = OperationLog(obj.get("data_file", "tasks.json"))
+    return log
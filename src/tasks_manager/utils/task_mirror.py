@@ -0,0 +1,117 @@
+"""Module to follow, from another process, a data file and its journal."""
+
+import json
+import os
+from typing import Dict, List
+
+from src.tasks_manager.utils.file_utils import _load_tasks
+from src.tasks_manager.utils.journal import journal_path
+from src.tasks_manager.utils.task_events import emit, replace_tasks
+
+
+class TaskMirror:
+    """In-memory copy of the tasks, refreshed record by record.
+
+    New journal lines are read from the last offset and applied one by
+    one; the data file is parsed again only when it is rewritten (by a
+    snapshot or a plain CLI command) and then diffed by task ID with
+    `task_events.replace_tasks`, so that cached indexes follow.
+    """
+
+    def __init__(self, obj: Dict, data_file: str):
+        self.obj = obj
+        self.data_file = data_file
+        self.journal_file = journal_path(data_file)
+        self._data_signature = _signature(data_file)
+        self._offset = 0
+        tasks_list = obj.get("tasks_list")
+        if tasks_list is None:
+            tasks_list = _load_tasks(data_file=data_file)
+        self._set(list(tasks_list))
+        for entry in self._read_journal():
+            self._apply(entry, notify=False)
+
+    @property
+    def tasks_list(self) -> List[Dict]:
+        return self.obj["tasks_list"]
+
+    def _set(self, tasks_list: List[Dict]) -> None:
+        self.obj["tasks_list"] = tasks_list
+        self._positions = {task["id"]: i for i, task in enumerate(tasks_list)}
+
+    def _read_journal(self) -> List[Dict]:
+        """Return the complete journal lines written since the last read."""
+        try:
+            with open(self.journal_file, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read()
+        except OSError:
+            return []
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+        self._offset += len(complete)
+        return [json.loads(line) for line in complete.splitlines() if line]
+
+    def refresh(self) -> int:
+        """Apply the changes made since the last refresh.
+
+        Returns the number of records that changed.
+        """
+        signature = _signature(self.data_file)
+        try:
+            journal_size = os.path.getsize(self.journal_file)
+        except OSError:
+            journal_size = 0
+        if signature != self._data_signature or journal_size < self._offset:
+            self._data_signature = signature
+            self._offset = 0
+            fresh = {
+                task["id"]: task
+                for task in _load_tasks(data_file=self.data_file)
+            }
+            for entry in self._read_journal():
+                task = entry["task"]
+                if entry["action"] == "delete":
+                    fresh.pop(task["id"], None)
+                else:
+                    fresh[task["id"]] = task
+            return self._sync(list(fresh.values()))
+
+        return sum(self._apply(entry) for entry in self._read_journal())
+
+    def _apply(self, entry: Dict, notify: bool = True) -> int:
+        task = entry["task"]
+        tasks_list = self.tasks_list
+        position = self._positions.get(task["id"])
+        old = None if position is None else tasks_list[position]
+        if entry["action"] == "delete":
+            if old is None:
+                return 0
+            self._set(tasks_list[:position] + tasks_list[position + 1:])
+        elif old == task:
+            return 0
+        elif old is None:
+            self._positions[task["id"]] = len(tasks_list)
+            tasks_list.append(task)
+        else:
+            tasks_list[position] = task
+
+        if notify:
+            if old is not None:
+                emit("delete", old)
+            if entry["action"] != "delete":
+                emit("create", task)
+        return 1
+
+    def _sync(self, fresh: List[Dict]) -> int:
+        """Replace the tasks by `fresh`, keeping the unchanged records."""
+        changed = replace_tasks(self.tasks_list, fresh)
+        self._set(self.tasks_list)
+        return changed
+
+
+def _signature(path: str):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
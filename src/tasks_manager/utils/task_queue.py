@@ -0,0 +1,195 @@
+"""Module to pick the next tasks to work on with an urgency priority queue."""
+
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.classes.errors import TaskValidationError
+from src.tasks_manager.utils.priority_manager import Priority, DEFAULT_PRIORITY
+from src.tasks_manager.utils.task_deadline import parse_deadline
+
+ACTIONABLE_STATUSES = {"TODO", "ONGOING"}
+
+# Weights of the urgency score components:
+# - priority: per priority level (LOW = 1 ... CRITICAL = 4)
+# - deadline: 1 when due now, 0.5 a week before, growing once overdue
+# - age: per day since creation
+DEFAULT_WEIGHTS = {"priority": 1.0, "deadline": 4.0, "age": 0.05}
+
+# Days over which the deadline component halves
+DEADLINE_HALF_LIFE = 7.0
+
+# Scores are computed against a reference time; past this drift the heap
+# is rebuilt on the next query so that deadline urgencies catch up.
+DEFAULT_MAX_DRIFT = timedelta(hours=1)
+
+SECONDS_PER_DAY = 86400.0
+
+
+def _task_times(task: Dict) -> Tuple[int, Optional[float], float]:
+    """Returns the clock-independent parts of a task's score."""
+    rank = Priority[task.get("priority") or DEFAULT_PRIORITY].value
+    deadline = task.get("deadline")
+    deadline_ts = None
+    if deadline:
+        day = parse_deadline(deadline)
+        deadline_ts = datetime(day.year, day.month, day.day).timestamp()
+    created_ts = datetime.fromisoformat(task["created_at"]).timestamp()
+    return rank, deadline_ts, created_ts
+
+
+def _score(times: Tuple[int, Optional[float], float], now: float, weights):
+    rank, deadline_ts, created_ts = times
+    score = weights["priority"] * rank
+    if deadline_ts is not None:
+        days_left = (deadline_ts - now) / SECONDS_PER_DAY
+        if days_left >= 0:
+            urgency = DEADLINE_HALF_LIFE / (DEADLINE_HALF_LIFE + days_left)
+        else:
+            urgency = 1.0 - days_left / DEADLINE_HALF_LIFE
+        score += weights["deadline"] * urgency
+    age_days = max(now - created_ts, 0.0) / SECONDS_PER_DAY
+    return score + weights["age"] * age_days
+
+
+def urgency_score(task: Dict, now: datetime = None, weights: Dict = None):
+    """Returns the urgency score of a task, higher meaning more urgent."""
+    now = now or datetime.now()
+    return _score(
+        _task_times(task), now.timestamp(), _check_weights(weights)
+    )
+
+
+def _check_weights(weights: Dict = None) -> Dict[str, float]:
+    merged = dict(DEFAULT_WEIGHTS)
+    if weights:
+        unknown = set(weights) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise TaskValidationError(
+                "Invalid urgency weight. Allowed: priority, deadline, age"
+            )
+        merged.update(weights)
+    return merged
+
+
+class UrgencyQueue:
+    """Max-heap of actionable tasks ordered by urgency score.
+
+    Mutations notified through `task_events` push a fresh heap entry and
+    invalidate the previous one, so updates cost O(log n). Scores are
+    computed at a reference time and the heap is rebuilt lazily once the
+    clock has drifted past `max_drift`.
+    """
+
+    _REMOVED = None
+
+    def __init__(
+        self, weights: Dict = None, max_drift: timedelta = DEFAULT_MAX_DRIFT
+    ):
+        self.weights = _check_weights(weights)
+        self.max_drift = max_drift
+        self._tasks: Dict[int, Dict] = {}
+        self._times: Dict[int, Tuple[int, Optional[float], float]] = {}
+        self._entries: Dict[int, list] = {}
+        self._heap: List[list] = []
+        self._counter = 0
+        self._reference = datetime.now().timestamp()
+
+    @classmethod
+    def from_tasks(
+        cls, tasks_list: List[Dict], weights: Dict = None, **kwargs
+    ) -> "UrgencyQueue":
+        """Build the queue of a task list in O(n)."""
+        queue = cls(weights, **kwargs)
+        for task in tasks_list:
+            if task.get("status") in ACTIONABLE_STATUSES:
+                queue._tasks[task["id"]] = task
+                queue._times[task["id"]] = _task_times(task)
+        queue.rebuild()
+        return queue
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def configure(self, weights: Dict = None) -> None:
+        """Change the score weights; the heap is rebuilt if they differ."""
+        weights = _check_weights(weights)
+        if weights != self.weights:
+            self.weights = weights
+            self.rebuild(self._reference)
+
+    def rebuild(self, now: float = None) -> None:
+        """Recompute every score at `now` and heapify."""
+        if now is None:
+            now = datetime.now().timestamp()
+        self._reference = now
+        self._entries = {}
+        self._heap = []
+        for task_id, times in self._times.items():
+            entry = self._entry(task_id, times)
+            self._entries[task_id] = entry
+            self._heap.append(entry)
+        heapq.heapify(self._heap)
+
+    def apply(self, action: str, task: Dict, previous: Dict) -> None:
+        """Follow a task mutation notified through `task_events`."""
+        if action == "delete":
+            self.discard(task["id"])
+        elif action in ("create", "status", "priority", "deadline"):
+            self.update(task)
+
+    def update(self, task: Dict) -> None:
+        """Add, re-score or drop a task depending on its status."""
+        if task.get("status") not in ACTIONABLE_STATUSES:
+            self.discard(task["id"])
+            return
+        self._invalidate(task["id"])
+        times = _task_times(task)
+        self._tasks[task["id"]] = task
+        self._times[task["id"]] = times
+        entry = self._entry(task["id"], times)
+        self._entries[task["id"]] = entry
+        heapq.heappush(self._heap, entry)
+        self._compact()
+
+    def discard(self, task_id: int) -> None:
+        """Remove a task from the queue."""
+        self._invalidate(task_id)
+        self._tasks.pop(task_id, None)
+        self._times.pop(task_id, None)
+        self._compact()
+
+    def top(self, k: int = 1, now: datetime = None) -> List[Dict]:
+        """Return the k most urgent tasks in O(k log n)."""
+        now_ts = (now or datetime.now()).timestamp()
+        if abs(now_ts - self._reference) > self.max_drift.total_seconds():
+            self.rebuild(now_ts)
+
+        popped = []
+        while self._heap and len(popped) < k:
+            entry = heapq.heappop(self._heap)
+            if entry[-1] is not self._REMOVED:
+                popped.append(entry)
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+        return [self._tasks[entry[-1]] for entry in popped]
+
+    def score(self, task_id: int) -> float:
+        """Return the score of a queued task at the reference time."""
+        return -self._entries[task_id][0]
+
+    def _entry(self, task_id: int, times) -> list:
+        self._counter += 1
+        score = _score(times, self._reference, self.weights)
+        return [-score, self._counter, task_id]
+
+    def _invalidate(self, task_id: int) -> None:
+        entry = self._entries.pop(task_id, None)
+        if entry is not None:
+            entry[-1] = self._REMOVED
+
+    def _compact(self) -> None:
+        # Drop invalidated entries once they outnumber the live ones
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
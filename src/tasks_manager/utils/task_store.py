@@ -0,0 +1,188 @@
+"""Module to keep the tasks in memory across many commands."""
+
+import os
+import time
+import warnings
+from typing import Dict
+
+from src.tasks_manager.utils.file_utils import (
+    _load_tasks,
+    _write_tasks,
+    _is_compact_file,
+)
+from src.tasks_manager.utils.journal import (
+    BackgroundWriter,
+    Journal,
+    journal_path,
+    replay_journal,
+)
+from src.tasks_manager.utils.task_events import subscribe, unsubscribe
+
+
+class TaskStore:
+    """Tasks loaded once and shared by the commands of a long-lived process.
+
+    `obj` is used as the click context object of every command, so the
+    indexes cached in it stay warm. Mutations are appended to a journal
+    (when enabled) and the data file is rewritten by `snapshot`, which
+    then empties the journal. With `write_delay`, the journal entries are
+    coalesced and written by a `BackgroundWriter` thread instead.
+    """
+
+    def __init__(
+        self,
+        data_file: str = "tasks.json",
+        journal: bool = True,
+        fsync: bool = False,
+        compact: bool = None,
+        write_delay: float = None,
+        write_threshold: int = 1000,
+    ):
+        self.data_file = data_file
+        self.journal_file = journal_path(data_file)
+        if compact is None:
+            compact = _is_compact_file(data_file=data_file)
+        tasks_list = _load_tasks(data_file=data_file)
+        tasks_list, replayed = replay_journal(tasks_list, self.journal_file)
+
+        self.obj: Dict = {
+            "data_file": data_file,
+            "tasks_list": tasks_list,
+            "compact": compact,
+            "autosave": False,
+        }
+        self.changes = 0
+        self.mutations = 0
+        self.snapshots = 0
+        self.snapshot_bytes = 0
+        self.last_snapshot = time.monotonic()
+        subscribe(self._touch)
+
+        self.journal = None
+        self.writer = None
+        if replayed:
+            self.snapshot()
+        if journal:
+            self.journal = Journal(self.journal_file, fsync=fsync)
+            if write_delay is None:
+                subscribe(self.journal.record)
+            else:
+                self.writer = BackgroundWriter(
+                    self.journal, write_delay, write_threshold
+                )
+                subscribe(self.writer.record)
+
+    @property
+    def tasks_list(self):
+        return self.obj["tasks_list"]
+
+    def _touch(self, action: str, task: Dict, previous: Dict) -> None:
+        self.changes += 1
+        self.mutations += 1
+
+    def snapshot(self) -> None:
+        """Write the tasks to the data file and empty the journal.
+
+        If the data file cannot be written, the OSError is raised and the
+        journal keeps the mutations.
+        """
+        if self.writer is None:
+            self._snapshot()
+            return
+        with self.writer.io_lock:
+            self.writer.discard()
+            self._snapshot()
+
+    def _snapshot(self) -> None:
+        tmp_file = f"{self.data_file}.tmp"
+        try:
+            _write_tasks(
+                self.obj["tasks_list"],
+                data_file=tmp_file,
+                compact=self.obj["compact"],
+            )
+            size = os.path.getsize(tmp_file)
+            os.replace(tmp_file, self.data_file)
+        except OSError:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+        self.snapshot_bytes += size
+        self.snapshots += 1
+        # The journal is only emptied once the data file holds the tasks
+        if self.journal is not None:
+            self.journal.truncate()
+        elif os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self.changes = 0
+        self.last_snapshot = time.monotonic()
+
+    def maybe_snapshot(self, interval: float) -> bool:
+        """Snapshot if there are changes older than `interval` seconds.
+
+        A failed write is reported as a warning and retried at the next
+        call, the journal still holding the mutations.
+        """
+        if self.changes and time.monotonic() - self.last_snapshot >= interval:
+            try:
+                self.snapshot()
+            except OSError as e:
+                warnings.warn(f"Snapshot failed: {e}", UserWarning)
+                return False
+            return True
+        return False
+
+    def sync(self) -> None:
+        """Return once the mutations made so far are on disk."""
+        if self.writer is not None:
+            self.writer.flush(sync=True)
+        elif self.journal is not None:
+            self.journal.sync()
+
+    def write_stats(self) -> Dict:
+        """Disk writes compared with the mutations they persist.
+
+        `write_amplification` is the number of bytes written (journal and
+        snapshots) per byte of journal entry produced by the mutations.
+        """
+        journal = self.journal
+        stats = {
+            "mutations": self.mutations,
+            "journal_writes": 0 if journal is None else journal.writes,
+            "journal_bytes": 0 if journal is None else journal.bytes_written,
+            "snapshots": self.snapshots,
+            "snapshot_bytes": self.snapshot_bytes,
+        }
+        logical_bytes = stats["journal_bytes"]
+        if self.writer is not None:
+            stats.update(self.writer.stats())
+            logical_bytes = stats["logical_bytes"]
+        writes = stats["journal_writes"] + self.snapshots
+        stats["mutations_per_write"] = round(
+            self.mutations / max(writes, 1), 2
+        )
+        stats["write_amplification"] = (
+            round(
+                (stats["journal_bytes"] + self.snapshot_bytes)
+                / logical_bytes,
+                3,
+            )
+            if logical_bytes
+            else None
+        )
+        return stats
+
+    def close(self) -> None:
+        """Snapshot pending changes and stop following mutations."""
+        if self.writer is not None:
+            unsubscribe(self.writer.record)
+        # The snapshot holds the pending entries, which are then dropped
+        if self.changes:
+            self.snapshot()
+        if self.writer is not None:
+            self.writer.close()
+        unsubscribe(self._touch)
+        if self.journal is not None:
+            unsubscribe(self.journal.record)
+            self.journal.close()
+            os.remove(self.journal_file)
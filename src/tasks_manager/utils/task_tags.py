@@ -1,31 +1,44 @@
 """Module to manage tags associated with tasks."""
 
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
 from src.classes.errors import TaskValidationError
-from src.tasks_manager.utils.query_utils import filter_by_id
+from src.tasks_manager.utils.query_utils import filter_by_id, task_matcher
+from src.tasks_manager.utils.tag_dictionary import TagIndex
+from src.tasks_manager.utils.task_events import emit
+from src.tasks_manager.utils.timings import timed
 
 MAX_TAG_LENGTH = 20
+BULK_ACTIONS = ("add", "remove", "rename", "merge")
 
 
 def tags_manager(
-    tasks_list: List[Dict], task_id: int, action: str, tags: List[str] = None
+    tasks_list: List[Dict],
+    task_id: int,
+    action: str,
+    tags: List[str] = None,
+    index: TagIndex = None,
 ) -> Tuple[Dict, List[Dict]]:
     """Manage tags for a specific task.
 
     :param tasks_list: List of all tasks.
     :param task_id: ID of the task to manage tags for.
-    :param action: Action to perform - 'add' or 'remove'.
-    :param tags: List of tags to add or remove.
-    :return: Updated task and tasks list.
+    :param action: Action to perform - 'add', 'remove', 'filter' or
+        'get_all_tags'.
+    :param tags: List of tags to add, remove or filter on.
+    :param index: Optional tag index used by 'filter' and 'get_all_tags'.
+    :return: Updated task (or filtered tasks, or tag usage) and tasks list.
     """
     if action == "add":
         return _add_tags_to_task(tasks_list, task_id, tags or [])
     elif action == "remove":
-        return _remove_tag_from_task(tasks_list, task_id, tags[0])
+        return _remove_tags_from_task(tasks_list, task_id, tags or [])
     if action == "filter":
-        return _filter_tasks_by_tags(tasks_list, tags or [])
+        return (
+            _filter_tasks_by_tags(tasks_list, tags or [], index=index),
+            tasks_list,
+        )
     elif action == "get_all_tags":
-        return _get_all_tags_with_usage(tasks_list)
+        return _get_all_tags_with_usage(tasks_list, index=index), tasks_list
 
 
 def _validate_tag(tag: str) -> None:
@@ -52,11 +65,11 @@ def _add_tags_to_task(
 
     task = filter_by_id(tasks_list=tasks_list, task_id=task_id)
 
-    current_tags = set(task.get("tags", []))
-    for tag in new_tags:
-        current_tags.add(tag.strip())
-
-    task["tags"] = sorted(current_tags)
+    previous = task.get("tags")
+    task["tags"] = sorted(
+        {tag.strip() for tag in new_tags}.union(previous or [])
+    )
+    emit("tags", task, {"tags": previous})
     return task, tasks_list
 
 
@@ -65,40 +78,57 @@ def _remove_tag_from_task(
 ) -> Tuple[Dict, List[Dict]]:
     """Remove a specific tag from a task."""
     _validate_tag(tag_to_remove)
-    task = filter_by_id(tasks_list=tasks_list, task_id=task_id)
+    return _remove_tags_from_task(tasks_list, task_id, [tag_to_remove])
 
-    current_tags = set(task.get("tags", []))
-    if tag_to_remove not in current_tags:
-        # tag not found in task tags - no change
-        return task, tasks_list
 
-    current_tags.remove(tag_to_remove)
-    task["tags"] = sorted(current_tags)
+def _remove_tags_from_task(
+    tasks_list: List[Dict], task_id: int, tags_to_remove: List[str]
+) -> Tuple[Dict, List[Dict]]:
+    """Remove one or multiple tags from a task."""
+    for tag in tags_to_remove:
+        _validate_tag(tag)
+    task = filter_by_id(tasks_list=tasks_list, task_id=task_id)
+
+    removed = {tag.strip() for tag in tags_to_remove}
+    previous = task.get("tags", [])
+    remaining = [tag for tag in previous if tag not in removed]
+    if len(remaining) != len(previous):
+        # tags not found in task tags leave the task unchanged
+        task["tags"] = remaining
+        emit("tags", task, {"tags": previous})
 
     return task, tasks_list
 
 
+@timed("query")
 def _filter_tasks_by_tags(
-    tasks_list: List[Dict], tags_filter: List[str]
+    tasks_list: List[Dict], tags_filter: List[str], index: TagIndex = None
 ) -> List[Dict]:
-    """Return tasks that have at least one of the given tags."""
+    """Return tasks that have at least one of the given tags.
+
+    With a tag index the lookup is a union of tag bitsets instead of a scan.
+    """
     if not tags_filter:
         return tasks_list
 
-    # Normalize tags filter to stripped lowercase for case-insensitive matching
     normalized_filter = {tag.strip() for tag in tags_filter if tag.strip()}
-    filtered_tasks = []
-
-    for task in tasks_list:
-        task_tags = set(task.get("tags", []))
-        if task_tags.intersection(normalized_filter):
-            filtered_tasks.append(task)
+    if index is not None:
+        return index.tasks_with_any(normalized_filter)
 
-    return filtered_tasks
+    return [
+        task
+        for task in tasks_list
+        if any(tag in normalized_filter for tag in task.get("tags", ()))
+    ]
 
 
-def _get_all_tags_with_usage(tasks_list: List[Dict]) -> Dict[str, int]:
+def _get_all_tags_with_usage(
+    tasks_list: List[Dict], index: TagIndex = None
+) -> Dict[str, int]:
     """Return a dict of all distinct tags with their usage count across all tasks."""  # noqa: E501
+    if index is not None:
+        return index.usage()
+
     tag_counts = {}
 
     for task in tasks_list:
@@ -106,3 +136,108 @@ def _get_all_tags_with_usage(tasks_list: List[Dict]) -> Dict[str, int]:
             tag_counts[tag] = tag_counts.get(tag, 0) + 1
 
     return dict(sorted(tag_counts.items()))
+
+
+def bulk_tags_manager(
+    tasks_list: List[Dict],
+    action: str,
+    tags: List[str],
+    target: str = None,
+    status: str = None,
+    priority: str = None,
+    search: str = None,
+    tag: str = None,
+    index: TagIndex = None,
+) -> Tuple[int, List[Dict]]:
+    """Apply a tag action to every task matching the given filters.
+
+    All matching tasks are updated in a single pass over the list. With a
+    tag index, only the tasks carrying the source tags are visited, and an
+    unfiltered rename only touches the tag dictionary and those tasks.
+
+    :param tasks_list: List of all tasks.
+    :param action: Action to perform - 'add', 'remove', 'rename' or 'merge'.
+    :param tags: Tags to add or remove, or source tags to rename or merge.
+    :param target: Target tag for 'rename' and 'merge'.
+    :param status: Only update tasks with this status.
+    :param priority: Only update tasks with this priority.
+    :param search: Only update tasks whose title or description match.
+    :param tag: Only update tasks that already have this tag.
+    :param index: Optional tag index of the tasks list.
+    :return: Number of updated tasks and the tasks list.
+    """
+    if action not in BULK_ACTIONS:
+        raise TaskValidationError(
+            "Invalid action. Allowed actions: add, remove, rename, merge."
+        )
+    if not tags:
+        raise TaskValidationError("At least one tag must be provided.")
+    for tag_name in tags:
+        _validate_tag(tag_name)
+    sources = [tag_name.strip() for tag_name in tags]
+
+    if action in ("rename", "merge"):
+        if target is None:
+            raise TaskValidationError(
+                f"A target tag is required for '{action}'."
+            )
+        _validate_tag(target)
+        target = target.strip()
+        if action == "rename" and len(sources) != 1:
+            raise TaskValidationError("Exactly one tag can be renamed.")
+
+    unfiltered = not (status or priority or search or tag)
+    if index is not None and action == "rename" and unfiltered:
+        renamed = index.rename(sources[0], target)
+        for task, previous in renamed:
+            emit("tags", task, {"tags": previous})
+        return len(renamed), tasks_list
+
+    update = _bulk_tag_updater(action, sources, target)
+    matches = task_matcher(status, priority, search, tag)
+    candidates = tasks_list
+    if index is not None and action != "add":
+        candidates = index.tasks_with_any(sources)
+
+    updated = 0
+    for task in candidates:
+        if not matches(task):
+            continue
+        current_tags = task.get("tags")
+        new_tags = update(current_tags or [])
+        if new_tags != (current_tags or []):
+            task["tags"] = new_tags
+            emit("tags", task, {"tags": current_tags})
+            updated += 1
+
+    return updated, tasks_list
+
+
+def _bulk_tag_updater(
+    action: str, sources: List[str], target: str = None
+) -> Callable[[List[str]], List[str]]:
+    """Return a function computing the new tags of a task for an action."""
+    source_set = set(sources)
+
+    if action == "add":
+
+        def update(current_tags):
+            if source_set.issubset(current_tags):
+                return current_tags
+            return sorted(source_set.union(current_tags))
+
+    elif action == "remove":
+
+        def update(current_tags):
+            if source_set.isdisjoint(current_tags):
+                return current_tags
+            return sorted(set(current_tags) - source_set)
+
+    else:
+
+        def update(current_tags):
+            if source_set.isdisjoint(current_tags):
+                return current_tags
+            return sorted((set(current_tags) - source_set) | {target})
+
+    return update
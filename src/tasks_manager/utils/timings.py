@@ -0,0 +1,147 @@
+"""Module to time the phases of a CLI invocation."""
+
+import functools
+import json
+import os
+import socket
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# Chemin d'un fichier JSONL où ajouter les temps de chaque invocation
+TIMINGS_LOG_ENV = "TASK_MANAGER_TIMINGS_LOG"
+
+_active: Optional["PhaseTimer"] = None
+# Appelé avec (phase, secondes) après chaque appel d'une fonction @timed
+_observer: Optional[Callable[[str, float], None]] = None
+
+
+class PhaseTimer:
+    """Accumulates the exclusive time spent in named phases.
+
+    Phases can be nested: the time of an inner phase is not counted in the
+    outer one, so the phases add up to the measured total.
+    """
+
+    def __init__(self, started: float = None):
+        self.started = time.perf_counter() if started is None else started
+        self.phases: Dict[str, float] = {}
+        self.total = None
+        self._stack: List[list] = []
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def push(self, name: str) -> None:
+        self.phases.setdefault(name, 0.0)
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def pop(self) -> None:
+        name, start, children = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        self.add(name, elapsed - children)
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    @contextmanager
+    def phase(self, name: str):
+        self.push(name)
+        try:
+            yield
+        finally:
+            self.pop()
+
+    def stop(self) -> None:
+        """Close the phases still open and fix the total time."""
+        while self._stack:
+            self.pop()
+        self.total = time.perf_counter() - self.started
+
+    def report(self) -> str:
+        """Human-readable breakdown, one phase per line."""
+        total = self.total or sum(self.phases.values()) or 1e-9
+        lines = ["Temps par phase :"]
+        for name, seconds in self.phases.items():
+            lines.append(
+                f"  {name:<10} {seconds * 1e3:9.1f} ms"
+                f" {100 * seconds / total:5.1f} %"
+            )
+        lines.append(f"  {'total':<10} {total * 1e3:9.1f} ms")
+        return "\n".join(lines)
+
+    def as_record(self, **fields) -> Dict:
+        """JSON-serializable record of the phases, with extra `fields`."""
+        record = {
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+        }
+        record.update(fields)
+        record["total_ms"] = round((self.total or 0.0) * 1e3, 3)
+        record["phases_ms"] = {
+            name: round(seconds * 1e3, 3)
+            for name, seconds in self.phases.items()
+        }
+        return record
+
+
+def activate(timer: Optional[PhaseTimer]) -> None:
+    """Make `timer` receive the phases of `phase` and `timed` (None: off)."""
+    global _active
+    _active = timer
+
+
+def active() -> Optional[PhaseTimer]:
+    return _active
+
+
+def set_observer(observer: Optional[Callable[[str, float], None]]) -> None:
+    """Send the duration of every `timed` call to `observer` (None: off)."""
+    global _observer
+    _observer = observer
+
+
+@contextmanager
+def phase(name: str):
+    """Time a block in the active timer; does nothing without one."""
+    timer = _active
+    if timer is None:
+        yield
+        return
+    with timer.phase(name):
+        yield
+
+
+def timed(name: str):
+    """Decorator timing every call of a function as phase `name`.
+
+    The call is counted in the active timer and reported to the observer;
+    with neither, the wrapper only adds two global lookups.
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active is None and _observer is None:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                if _active is None:
+                    return function(*args, **kwargs)
+                with _active.phase(name):
+                    return function(*args, **kwargs)
+            finally:
+                if _observer is not None:
+                    _observer(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def append_record(path: str, record: Dict) -> None:
+    """Append a record as one JSON line; a single write keeps lines whole."""
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line)
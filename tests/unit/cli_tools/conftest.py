@@ -0,0 +1,36 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from src.task_manager import task_manager
+
+
+class TaskManagerCli:
+    """Runs task_manager commands on the tasks.json of the current folder."""
+
+    def __init__(self):
+        self.runner = CliRunner()
+
+    def run(self, *args):
+        return self.runner.invoke(task_manager, list(args), obj={})
+
+    def __call__(self, *args):
+        result = self.run(*args)
+        assert result.exit_code == 0, result.output
+        return result.output
+
+    def tasks(self):
+        with open("tasks.json", encoding="utf-8") as f:
+            return json.load(f)
+
+    def titles(self):
+        return [task["title"] for task in self.tasks()]
+
+
+@pytest.fixture
+def cli(tmp_path):
+    """Command runner working in an empty temporary folder."""
+    app = TaskManagerCli()
+    with app.runner.isolated_filesystem(temp_dir=tmp_path):
+        yield app
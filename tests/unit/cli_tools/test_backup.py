@@ -0,0 +1,25 @@
+def test_backup_restore_and_verify(cli):
+    cli("create_task", "--title", "A", "--description", "")
+    assert "Sauvegarde full n°1" in cli("backup")
+    cli("create_task", "--title", "B", "--description", "")
+    output = cli("backup")
+    assert "Sauvegarde delta n°2" in output
+    assert "1 tâche(s) écrite(s)" in output
+
+    cli("delete_task", "1")
+    cli("delete_task", "2")
+    assert cli.titles() == []
+    assert "restaurée" in cli("restore")
+    assert cli.titles() == ["A", "B"]
+
+    # la restauration est annulable
+    cli("undo")
+    assert cli.titles() == []
+
+    output = cli("restore", "--verify")
+    assert output.count("OK") == 2
+
+
+def test_restore_without_backup_fails(cli):
+    result = cli.run("restore", "--at", "2025-01-01")
+    assert result.exit_code != 0
@@ -91,4 +91,6 @@ def test_delete_task(runner, context):
 
         assert result.exit_code == 0
         assert "Tâche avec l'ID 1 supprimée" in result.output
-        mock_delete.assert_called_once_with(1, [{"id": 1, "title": "Tâche à supprimer"}])
+        mock_delete.assert_called_once_with(
+            1, [{"id": 1, "title": "Tâche à supprimer"}], dependencies=None
+        )
@@ -0,0 +1,32 @@
+import json
+
+from src.classes.errors import TaskValidationError
+
+
+def test_dependencies_and_unblocked(cli):
+    for title in ("Plans", "Fondations", "Murs"):
+        cli("create_task", "--title", title)
+    cli("dependencies", "2", "add", "1")
+    assert "bloquée par : 2" in cli("dependencies", "3", "add", "2")
+    assert cli.tasks()[2]["blocked_by"] == [2]
+
+    result = cli.run("dependencies", "1", "add", "3")
+    assert isinstance(result.exception, TaskValidationError)
+    assert "blocked_by" not in cli.tasks()[0]
+
+    output = cli("unblocked")
+    assert "Plans" in output and "Fondations" not in output
+
+    cli("change_task_status", "1", "--status", "DONE")
+    output = cli("unblocked", "--format", "json")
+    assert [task["title"] for task in json.loads(output)] == ["Fondations"]
+
+    output = cli("dependencies", "2", "list")
+    assert "[1] Plans (DONE)" in output and "[3] Murs" in output
+
+    cli("delete_task", "2")
+    assert "blocked_by" not in cli.tasks()[1]
+    assert "Murs" in cli("unblocked")
+
+    cli("undo")
+    assert cli.tasks()[2]["blocked_by"] == [2]
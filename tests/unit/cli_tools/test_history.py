@@ -0,0 +1,34 @@
+def test_undo_redo_history(cli):
+    cli("create_task", "--title", "A", "--description", "")
+    cli("create_task", "--title", "B", "--description", "")
+    cli("bulk_tags", "add", "lot", "--status", "TODO")
+
+    output = cli("undo")
+    assert "Annulé : bulk_tags" in output
+    assert all(not task.get("tags") for task in cli.tasks())
+
+    output = cli("history", "1")
+    assert "création : A" in output
+    assert "(annulée)" in output
+
+    assert "Rétabli : bulk_tags" in cli("redo")
+    assert [task["tags"] for task in cli.tasks()] == [["lot"], ["lot"]]
+
+    cli("undo", "-n", "3")
+    assert cli.tasks() == []
+    assert "Rien à annuler." in cli("undo")
+
+
+def test_new_change_clears_redo(cli):
+    cli("create_task", "--title", "A", "--description", "")
+    cli("undo")
+    cli("create_task", "--title", "B", "--description", "")
+    assert "Rien à rétablir." in cli("redo")
+    assert cli.titles() == ["B"]
+
+
+def test_failed_command_is_not_undone(cli):
+    cli("create_task", "--title", "A", "--description", "")
+    result = cli.run("delete_task", "9")
+    assert result.exit_code != 0
+    assert "Annulé : create_task" in cli("undo")
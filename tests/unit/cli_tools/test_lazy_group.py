@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import click
+from click.testing import CliRunner
+
+from src.tasks_manager.cli_tools.lazy_group import LazyGroup
+
+
+def _group():
+    @click.group(
+        cls=LazyGroup,
+        lazy_subcommands={
+            "next": "src.tasks_manager.cli_tools.next_tasks:next_tasks"
+        },
+    )
+    def cli():
+        pass
+
+    @cli.command()
+    def hello():
+        click.echo("hello")
+
+    return cli
+
+
+def test_lists_lazy_and_regular_commands():
+    cli = _group()
+    assert cli.list_commands(None) == ["hello", "next"]
+
+
+def test_loads_command_on_demand():
+    cli = _group()
+    command = cli.get_command(None, "next")
+    assert command.name == "next"
+    assert cli.lazy_subcommands == {}
+    assert cli.get_command(None, "next") is command
+
+
+def test_regular_command_still_runs():
+    result = CliRunner().invoke(_group(), ["hello"])
+    assert result.output == "hello\n"
+
+
+def test_startup_does_not_import_subcommands_nor_rich():
+    code = (
+        "import sys, src.task_manager; "
+        "print(any(m == 'rich' or m.startswith('rich.') for m in sys.modules),"
+        " 'src.tasks_manager.cli_tools.view_tasks' in sys.modules)"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert completed.stdout.split() == ["False", "False"]
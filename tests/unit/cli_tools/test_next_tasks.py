@@ -0,0 +1,75 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+from unittest.mock import patch
+
+from src.tasks_manager.cli_tools.next_tasks import next_tasks
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture
+def context():
+    return {
+        "tasks_list": [
+            {
+                "id": 1,
+                "title": "Basse",
+                "status": "TODO",
+                "priority": "LOW",
+                "created_at": "2025-01-01T10:00:00",
+            },
+            {
+                "id": 2,
+                "title": "Critique",
+                "status": "ONGOING",
+                "priority": "CRITICAL",
+                "created_at": "2025-01-01T10:00:00",
+            },
+            {
+                "id": 3,
+                "title": "Terminée",
+                "status": "DONE",
+                "created_at": "2025-01-01T10:00:00",
+            },
+        ]
+    }
+
+
+@patch("src.tasks_manager.cli_tools.next_tasks.display_tasks")
+def test_next_tasks_ranks_actionable_tasks(mock_display, runner, context):
+    result = runner.invoke(next_tasks, ["-k", "5"], obj=context)
+
+    assert result.exit_code == 0
+    assert "1. [2] Critique" in result.output
+    assert "2. [1] Basse" in result.output
+    assert "Terminée" not in result.output
+    assert result.output.count("Critique") == 1
+    mock_display.assert_not_called()
+
+
+def test_next_tasks_json_output_is_clean(context):
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(next_tasks, ["--format", "json"], obj=context)
+
+    assert result.exit_code == 0
+    tasks = json.loads(result.stdout)
+    assert [task["id"] for task in tasks] == [2, 1]
+    assert tasks[0]["score"] > tasks[1]["score"]
+    assert "score" not in context["tasks_list"][1]
+
+
+@patch("src.tasks_manager.cli_tools.next_tasks.display_tasks")
+def test_next_tasks_weights_are_configurable(mock_display, runner, context):
+    result = runner.invoke(
+        next_tasks,
+        ["-k", "1", "--priority-weight", "-1"],
+        obj=context,
+    )
+
+    assert result.exit_code == 0
+    assert "1. [1] Basse" in result.output
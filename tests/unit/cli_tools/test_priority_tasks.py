@@ -43,6 +43,7 @@ def test_manage_priority_get(mock_task_priority, mock_display, runner, context):
     )
 
     assert result.exit_code == 0
+    assert "Priority of task 1: " in result.output
     mock_task_priority.assert_called_once_with(ANY, 1, "get", None)
     mock_display.assert_called_once()
 
@@ -50,30 +51,61 @@ def test_manage_priority_get(mock_task_priority, mock_display, runner, context):
 @patch("src.tasks_manager.cli_tools.priority_tasks.display_tasks")
 @patch("src.tasks_manager.cli_tools.priority_tasks.task_priority")
 def test_manage_priority_filter(mock_task_priority, mock_display, runner, context):
-    mock_task_priority.return_value = {"id": 1, "title": "Tâche", "priority": "CRITICAL"}
+    filtered = [{"id": 1, "title": "Tâche", "priority": "CRITICAL"}]
+    mock_task_priority.return_value = filtered
 
     result = runner.invoke(
         manage_priority,
-        ["1", "filter", "--priority", "CRITICAL"],
+        ["filter", "--priority", "CRITICAL"],
         obj=context,
     )
 
     assert result.exit_code == 0
-    mock_task_priority.assert_called_once_with(ANY, 1, "filter", "CRITICAL")
-    mock_display.assert_called_once()
+    mock_task_priority.assert_called_once_with(
+        ANY, None, "filter", "CRITICAL", index=ANY
+    )
+    mock_display.assert_called_once_with(filtered, 1, 1, 1, fmt=None)
 
 
 @patch("src.tasks_manager.cli_tools.priority_tasks.display_tasks")
 @patch("src.tasks_manager.cli_tools.priority_tasks.task_priority")
 def test_manage_priority_sort(mock_task_priority, mock_display, runner, context):
-    mock_task_priority.return_value = {"id": 1, "title": "Tâche", "priority": "LOW"}
+    mock_task_priority.return_value = [{"id": 1, "title": "Tâche", "priority": "LOW"}]
 
     result = runner.invoke(
         manage_priority,
-        ["1", "sort"],
+        ["sort"],
         obj=context,
     )
 
     assert result.exit_code == 0
-    mock_task_priority.assert_called_once_with(ANY, 1, "sort", None)
+    mock_task_priority.assert_called_once_with(ANY, None, "sort", None, index=ANY)
     mock_display.assert_called_once()
+
+
+@patch("src.tasks_manager.cli_tools.priority_tasks.display_tasks")
+def test_manage_priority_sort_with_legacy_task_id(mock_display, runner):
+    context = {
+        "tasks_list": [
+            {"id": i, "title": f"Tâche {i}", "priority": priority}
+            for i, priority in enumerate(["LOW", "CRITICAL", "HIGH"], start=1)
+        ]
+    }
+
+    result = runner.invoke(
+        manage_priority,
+        ["1", "sort", "--size", "2", "--page", "2"],
+        obj=context,
+    )
+
+    assert result.exit_code == 0
+    mock_display.assert_called_once_with([context["tasks_list"][0]], 2, 2, 3, fmt=None)
+    # the tasks list itself is left untouched
+    assert [task["id"] for task in context["tasks_list"]] == [1, 2, 3]
+
+
+def test_manage_priority_set_requires_task_id(runner, context):
+    result = runner.invoke(manage_priority, ["set"], obj=context)
+
+    assert result.exit_code != 0
+    assert "ACTION is required" in result.output
@@ -0,0 +1,64 @@
+import pytest
+from click.testing import CliRunner
+
+from src.tasks_manager.cli_tools.recurrence import recurrence
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture
+def context():
+    return {
+        "tasks_list": [
+            {
+                "id": 1,
+                "title": "Arroser les plantes",
+                "description": "",
+                "status": "TODO",
+                "created_at": "2025-01-01T10:00:00",
+            }
+        ]
+    }
+
+
+def test_set_recurrence(runner, context):
+    result = runner.invoke(
+        recurrence,
+        ["set", "1", "--freq", "daily", "--interval", "2", "--start", "2025-01-01"],
+        obj=context,
+    )
+
+    assert result.exit_code == 0
+    assert context["tasks_list"][0]["recurrence"] == {
+        "freq": "daily",
+        "interval": 2,
+        "start": "2025-01-01",
+    }
+
+
+def test_set_recurrence_requires_freq(runner, context):
+    result = runner.invoke(recurrence, ["set", "1"], obj=context)
+
+    assert result.exit_code != 0
+    assert "--freq" in result.output
+
+
+def test_touch_occurrence_changes_status(runner, context):
+    runner.invoke(
+        recurrence,
+        ["set", "1", "--freq", "daily", "--start", "2025-01-01"],
+        obj=context,
+    )
+
+    result = runner.invoke(
+        recurrence, ["touch", "1@2025-01-03", "--status", "DONE"], obj=context
+    )
+
+    assert result.exit_code == 0
+    assert "Occurrence 1@2025-01-03 enregistrée comme tâche 2" in result.output
+    concrete = context["tasks_list"][1]
+    assert concrete["status"] == "DONE"
+    assert concrete["deadline"] == "2025-01-03"
@@ -0,0 +1,41 @@
+from datetime import date, timedelta
+
+import pytest
+from click.testing import CliRunner
+
+from src.tasks_manager.cli_tools.reminders import reminders
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture
+def context():
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    later = (date.today() + timedelta(days=30)).isoformat()
+    return {
+        "tasks_list": [
+            {"id": 1, "title": "Demain", "status": "TODO", "deadline": tomorrow},
+            {"id": 2, "title": "Plus tard", "status": "TODO", "deadline": later},
+        ]
+    }
+
+
+def test_once_sends_due_reminders(runner, context):
+    result = runner.invoke(
+        reminders, ["--once", "--lead", "48"], obj=context
+    )
+    assert result.exit_code == 0
+    assert "Demain" in result.output
+    assert "Plus tard" not in result.output
+    assert context["autosave"] is False
+
+
+def test_invalid_sink(runner, context):
+    result = runner.invoke(
+        reminders, ["--once", "--sink", "email"], obj=context
+    )
+    assert result.exit_code != 0
+    assert "Invalid sink" in result.output
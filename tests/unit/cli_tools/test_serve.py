@@ -0,0 +1,65 @@
+import json
+import threading
+
+import pytest
+
+from src.task_manager import task_manager
+from src.tasks_manager.cli_tools.serve import TaskServer
+from src.tasks_manager.utils.task_client import request
+from src.tasks_manager.utils.task_store import TaskStore
+
+
+@pytest.fixture
+def server(tmp_path):
+    data_file = tmp_path / "tasks.json"
+    data_file.write_text(
+        json.dumps(
+            [
+                {
+                    "id": 1,
+                    "title": "Une",
+                    "description": "",
+                    "status": "TODO",
+                    "created_at": "2025-01-01T10:00:00",
+                }
+            ]
+        ),
+        encoding="utf-8",
+    )
+    store = TaskStore(str(data_file))
+    server = TaskServer(str(tmp_path / "s.sock"), task_manager, store)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+    store.close()
+
+
+def test_commands_share_the_in_memory_tasks(server):
+    path = server.server_address
+
+    created = request(path, ["create_task", "--title", "Deux"])
+    assert created["exit_code"] == 0
+    assert "Tâche créée : Deux" in created["output"]
+
+    listed = request(path, ["view_tasks", "--format", "ndjson"])
+    titles = [json.loads(line)["title"] for line in listed["output"].splitlines()]
+    assert titles == ["Une", "Deux"]
+    assert len(server.store.tasks_list) == 2
+    assert len(server.store.journal) == 1
+
+
+def test_errors_are_reported(server):
+    response = request(server.server_address, ["view_tasks", "--page", "x"])
+    assert response["exit_code"] == 2
+    assert "Invalid value" in response["error"]
+
+
+def test_local_commands_are_refused(server):
+    response = request(server.server_address, ["serve"])
+    assert response["exit_code"] == 2
+    assert "cannot run on the server" in response["error"]
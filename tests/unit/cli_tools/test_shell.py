@@ -0,0 +1,85 @@
+import io
+import json
+
+import pytest
+
+from src.task_manager import task_manager
+from src.tasks_manager.cli_tools.shell import TaskIdIndex, TaskShell
+from src.tasks_manager.utils.task_store import TaskStore
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "tasks.json"
+    tasks = [
+        {
+            "id": task_id,
+            "title": f"Tâche {task_id}",
+            "description": "",
+            "status": "TODO",
+            "created_at": "2025-01-01T10:00:00",
+            "tags": ["urgent"] if task_id == 1 else ["home"],
+        }
+        for task_id in (1, 2, 12)
+    ]
+    path.write_text(json.dumps(tasks), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def task_shell(data_file):
+    store = TaskStore(str(data_file), journal=False)
+    task_shell = TaskShell(task_manager, store, autosave=0, stdout=io.StringIO())
+    yield task_shell
+    task_shell.do_exit("")
+
+
+def _saved_titles(data_file):
+    return [t["title"] for t in json.loads(data_file.read_text("utf-8"))]
+
+
+def test_commands_share_tasks_until_save(task_shell, data_file):
+    task_shell.onecmd('create_task --title "Nouvelle tâche"')
+    task_shell.onecmd("view_tasks --format plain --size 50")
+
+    output = task_shell.stdout.getvalue()
+    assert "Tâche créée : Nouvelle tâche" in output
+    assert "13 [TODO] Nouvelle tâche" in output
+    assert "Nouvelle tâche" not in _saved_titles(data_file)
+
+    task_shell.onecmd("save")
+    assert "Nouvelle tâche" in _saved_titles(data_file)
+
+
+def test_exit_saves_changes(task_shell, data_file):
+    task_shell.onecmd("delete_task 2")
+    assert task_shell.onecmd("exit") is True
+    assert _saved_titles(data_file) == ["Tâche 1", "Tâche 12"]
+
+
+def test_unknown_command(task_shell):
+    task_shell.onecmd("bogus 1")
+    assert "Commande inconnue : bogus" in task_shell.stdout.getvalue()
+
+
+def test_completion_of_ids_tags_and_options(task_shell):
+    assert task_shell.completedefault("1", "tags_manager 1", 13, 14) == [
+        "1",
+        "12",
+    ]
+    assert task_shell.completedefault("ur", "tags_manager 1 add ur", 0, 0) == [
+        "urgent"
+    ]
+    assert task_shell.completedefault("--st", "view_tasks --st", 0, 0) == [
+        "--status"
+    ]
+    assert "view_tasks" in task_shell.completenames("view")
+
+
+def test_id_index_follows_creations():
+    obj = {"tasks_list": [{"id": 1}]}
+    index = TaskIdIndex(obj)
+    assert index.complete("") == ["1"]
+    obj["tasks_list"].append({"id": 10})
+    index.apply("create", {"id": 10}, {})
+    assert index.complete("1") == ["1", "10"]
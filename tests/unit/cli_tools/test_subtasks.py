@@ -0,0 +1,29 @@
+from src.classes.errors import TaskValidationError
+
+
+def test_subtasks_and_tree(cli):
+    for title in ("Maison", "Gros œuvre", "Toiture", "Jardin"):
+        cli("create_task", "--title", title)
+    cli("subtasks", "attach", "2", "1")
+    cli("subtasks", "attach", "3", "2")
+    assert cli.tasks()[2]["parent"] == 2
+
+    result = cli.run("subtasks", "attach", "1", "3")
+    assert isinstance(result.exception, TaskValidationError)
+
+    cli("change_task_status", "3", "--status", "DONE")
+    cli("priority_manager", "3", "set", "--priority", "HIGH")
+    output = cli("view_tasks", "--tree", "1")
+    lines = output.splitlines()
+    assert lines[0].startswith("[1] Maison (TODO) — 1/3 faites")
+    assert "priorité max HIGH" in lines[0]
+    assert lines[2].startswith("    [3] Toiture (DONE)")
+    assert "Jardin" not in output
+
+    output = cli("subtasks", "open", "1", "--format", "plain")
+    assert "Gros œuvre" in output and "Toiture" not in output
+
+    cli("delete_task", "2")
+    assert cli.tasks()[1]["parent"] == 1
+    cli("subtasks", "detach", "3")
+    assert "parent" not in cli.tasks()[1]
@@ -1,8 +1,10 @@
+import json
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch, ANY
 
-from src.tasks_manager.cli_tools.tags import tags_cli
+from src.tasks_manager.cli_tools.tags import tags_cli, bulk_tags_cli
 
 
 @pytest.fixture
@@ -31,7 +33,7 @@ def test_tags_add(mock_tags_manager, mock_display, runner, context):
 
     assert result.exit_code == 0
     assert "Task 1 updated successfully with action 'add'." in result.output
-    mock_tags_manager.assert_called_once_with(ANY, 1, "add", ["home"])
+    mock_tags_manager.assert_called_once_with(ANY, 1, "add", ["home"], index=None)
     mock_display.assert_called_once()
 
 
@@ -62,7 +64,7 @@ def test_tags_remove(mock_tags_manager, mock_display, runner, context):
 
     assert result.exit_code == 0
     assert "Task 1 updated successfully with action 'remove'." in result.output
-    mock_tags_manager.assert_called_once_with(ANY, 1, "remove", ["urgent"])
+    mock_tags_manager.assert_called_once_with(ANY, 1, "remove", ["urgent"], index=None)
     mock_display.assert_called_once()
 
 
@@ -93,8 +95,8 @@ def test_tags_get_all_tags(mock_tags_manager, mock_display, runner, context):
     assert "Task 1 updated successfully with action 'get_all_tags'." in result.output
     for tag, count in tags_dict.items():
         assert f"{tag}: {count}" in result.output
-    mock_tags_manager.assert_called_once_with(ANY, 1, "get_all_tags", [])
-    mock_display.assert_called_once()
+    mock_tags_manager.assert_called_once_with(ANY, 1, "get_all_tags", [], index=ANY)
+    mock_display.assert_not_called()
 
 
 @patch("src.tasks_manager.cli_tools.tags.display_tasks")
@@ -114,5 +116,54 @@ def test_tags_filter(mock_tags_manager, mock_display, runner, context):
     assert "Filtered tasks:" in result.output
     for task in filtered_tasks:
         assert f"Task ID: {task['id']}, Tags: {task.get('tags', [])}" in result.output
-    mock_tags_manager.assert_called_once_with(ANY, 1, "filter", ["urgent"])
+    mock_tags_manager.assert_called_once_with(ANY, 1, "filter", ["urgent"], index=ANY)
     mock_display.assert_called_once()
+
+
+@patch("src.tasks_manager.cli_tools.tags.bulk_tags_manager")
+def test_bulk_tags_rename(mock_bulk_tags_manager, runner, context):
+    mock_bulk_tags_manager.return_value = (1, context["tasks_list"])
+
+    result = runner.invoke(
+        bulk_tags_cli,
+        ["rename", "urgent", "--to", "asap", "--status", "TODO"],
+        obj=context,
+    )
+
+    assert result.exit_code == 0
+    assert "1 task(s) updated with action 'rename'." in result.output
+    mock_bulk_tags_manager.assert_called_once_with(
+        ANY,
+        "rename",
+        ["urgent"],
+        target="asap",
+        status="TODO",
+        priority=None,
+        search=None,
+        tag=None,
+        index=ANY,
+    )
+
+
+def test_bulk_tags_add_with_filter(runner, context):
+    result = runner.invoke(
+        bulk_tags_cli,
+        ["add", "home", "--tag", "urgent"],
+        obj=context,
+    )
+
+    assert result.exit_code == 0
+    assert context["tasks_list"][0]["tags"] == ["home", "urgent"]
+
+
+def test_tags_add_json_output_is_clean(context):
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(
+        tags_cli, ["1", "add", "home", "--format", "json"], obj=context
+    )
+
+    assert result.exit_code == 0
+    (task,) = json.loads(result.stdout)
+    assert task["id"] == 1
+    assert sorted(task["tags"]) == ["home", "urgent"]
+    assert "updated successfully" in result.stderr
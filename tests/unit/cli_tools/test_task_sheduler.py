@@ -1,7 +1,10 @@
+import json
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
 
+from src.classes.errors import TaskNotFoundError
 from src.tasks_manager.cli_tools.task_sheduler import task_deadline
 
 
@@ -33,10 +36,23 @@ def test_add_deadline(mock_deadline_task_cls, mock_display, runner, context):
     assert "Deadline '2025-12-31' added to task ID 1." in result.output
     mock_deadline_task.add_deadline_to_task.assert_called_once()
     mock_display.assert_called_once_with(
-        [mock_deadline_task.task], page=1, total_pages=1, total_tasks=len(context["tasks_list"])
+        [mock_deadline_task.task], page=1, total_pages=1, total_tasks=len(context["tasks_list"]), fmt=None
     )
 
 
+def test_add_deadline_ndjson_output_is_clean(context):
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(
+        task_deadline,
+        ["1", "--add_deadline", "--deadline", "2030-01-01", "--format", "ndjson"],
+        obj=context,
+    )
+
+    assert result.exit_code == 0
+    (line,) = result.stdout.splitlines()
+    assert json.loads(line)["deadline"] == "2030-01-01"
+
+
 @patch("src.tasks_manager.cli_tools.task_sheduler.display_tasks")
 @patch("src.tasks_manager.cli_tools.task_sheduler.DeadlineTask")
 def test_modify_deadline(mock_deadline_task_cls, mock_display, runner, context):
@@ -94,5 +110,103 @@ def test_no_action_calls_display(mock_deadline_task_cls, mock_display, runner, c
     # No messages about deadlines since no action
     assert "Deadline" not in result.output
     mock_display.assert_called_once_with(
-        [mock_deadline_task.task], page=1, total_pages=1, total_tasks=len(context["tasks_list"])
+        [mock_deadline_task.task], page=1, total_pages=1, total_tasks=len(context["tasks_list"]), fmt=None
+    )
+
+
+@patch("src.tasks_manager.cli_tools.task_sheduler.display_tasks")
+def test_overdue_without_task_id(mock_display, runner):
+    tasks = [
+        {"id": 1, "title": "Tâche 1", "status": "TODO", "deadline": "2000-01-01"},
+        {"id": 2, "title": "Tâche 2", "status": "DONE", "deadline": "2000-01-01"},
+    ]
+
+    result = runner.invoke(task_deadline, ["--overdue"], obj={"tasks_list": tasks})
+
+    assert result.exit_code == 0
+    mock_display.assert_called_once_with(
+        [tasks[0]], page=1, total_pages=1, total_tasks=1, fmt=None
+    )
+
+
+def test_task_id_required_without_query(runner, context):
+    result = runner.invoke(task_deadline, ["--remove_deadline"], obj=context)
+
+    assert result.exit_code != 0
+    assert "TASK_ID is required" in result.output
+
+
+def test_bulk_deadline_with_filter(runner):
+    tasks = [
+        {"id": 1, "title": "Tâche 1", "status": "TODO"},
+        {"id": 2, "title": "Tâche 2", "status": "DONE"},
+        {"id": 3, "title": "Tâche 3", "status": "TODO"},
+    ]
+
+    result = runner.invoke(
+        task_deadline,
+        ["--bulk", "--ids", "1,2", "--status", "TODO", "--deadline", "2000-01-01"],
+        obj={"tasks_list": tasks},
     )
+
+    assert result.exit_code == 0
+    assert "Deadline set for 1 task(s)." in result.output
+    assert "Warning: 1 deadline(s) are in the past (IDs: 1)." in result.output
+    assert tasks[0]["deadline"] == "2000-01-01"
+    assert "deadline" not in tasks[2]
+
+
+def test_bulk_deadline_with_mapping(runner, tmp_path):
+    tasks = [{"id": 1, "title": "Tâche 1"}, {"id": 2, "title": "Tâche 2"}]
+    mapping = tmp_path / "mapping.csv"
+    mapping.write_text("1,2999-01-01\n2,2999-02-01\n")
+
+    result = runner.invoke(
+        task_deadline,
+        ["--bulk", "--mapping", str(mapping)],
+        obj={"tasks_list": tasks},
+    )
+
+    assert result.exit_code == 0
+    assert "Deadline set for 2 task(s)." in result.output
+    assert tasks[1]["deadline"] == "2999-02-01"
+
+
+def test_bulk_deadline_requires_deadline_or_mapping(runner, context):
+    result = runner.invoke(task_deadline, ["--bulk"], obj=context)
+
+    assert result.exit_code != 0
+    assert "--deadline or --mapping" in result.output
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--bulk", "--deadline", "2999-01-01"],
+        ["--bulk", "--mapping", "mapping.csv", "--status", "TODO"],
+    ],
+)
+def test_bulk_deadline_needs_one_selection(runner, args):
+    tasks = [{"id": 1, "title": "Tâche 1", "status": "TODO"}]
+
+    with runner.isolated_filesystem():
+        with open("mapping.csv", "w") as f:
+            f.write("1,2999-01-01\n")
+        result = runner.invoke(task_deadline, args, obj={"tasks_list": tasks})
+
+    assert result.exit_code == 2
+    assert "deadline" not in tasks[0]
+
+
+def test_bulk_deadline_with_unknown_ids(runner):
+    tasks = [{"id": 1, "title": "Tâche 1", "status": "TODO"}]
+
+    result = runner.invoke(
+        task_deadline,
+        ["--bulk", "--ids", "1,7,9", "--deadline", "2999-01-01"],
+        obj={"tasks_list": tasks},
+    )
+
+    assert isinstance(result.exception, TaskNotFoundError)
+    assert "IDs 7, 9" in str(result.exception)
+    assert "deadline" not in tasks[0]
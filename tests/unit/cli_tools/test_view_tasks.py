@@ -1,7 +1,11 @@
+import json
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch
-from src.tasks_manager.cli_tools.view_tasks import view_tasks
+from src.tasks_manager.cli_tools.view_tasks import view_tasks, watch_page
+from src.tasks_manager.utils.task_events import emit
+from src.tasks_manager.utils.task_history import OperationLog
 
 
 @pytest.fixture
@@ -11,7 +15,6 @@ def runner():
 
 @pytest.fixture
 def context():
-    # Ajout de "created_at" car le tri par défaut utilise cette clé
     return {
         "tasks_list": [
             {"id": 1, "title": "Task 1", "status": "TODO", "created_at": "2023-01-01T00:00:00"}
@@ -71,7 +74,7 @@ def test_view_tasks_all_filters(
     mock_sorted_task.assert_called_once_with(mock_search_tasks.return_value, sort_by="title", ascending=True)
     mock_get_tasks.assert_called_once_with(1, 10, mock_sorted_task.return_value)
 
-    mock_display.assert_called_once_with(mock_get_tasks.return_value[0], 1, 1, 1)
+    mock_display.assert_called_once_with(mock_get_tasks.return_value[0], 1, 1, 1, fmt=None)
 
 
 @patch("src.tasks_manager.cli_tools.view_tasks.display_tasks")
@@ -83,7 +86,7 @@ def test_view_tasks_no_filters(mock_get_tasks, mock_display, runner, context):
 
     assert result.exit_code == 0
     mock_get_tasks.assert_called_once_with(1, 10, context["tasks_list"])
-    mock_display.assert_called_once_with(context["tasks_list"], 1, 1, 1)
+    mock_display.assert_called_once_with(context["tasks_list"], 1, 1, 1, fmt=None)
 
 
 @patch("src.tasks_manager.cli_tools.view_tasks.display_tasks")
@@ -95,4 +98,160 @@ def test_view_tasks_id_not_found(mock_filter_by_id, mock_display, runner, contex
 
     assert result.exit_code == 0
     # Quand id introuvable, tasks_list devient vide, display_tasks appelé avec []
-    mock_display.assert_called_once_with([], 1, 0, 0)
+    mock_display.assert_called_once_with([], 1, 0, 0, fmt=None)
+
+
+@patch("src.tasks_manager.cli_tools.view_tasks.display_tasks")
+def test_view_tasks_due_between(mock_display, runner):
+    tasks = [
+        {"id": 1, "title": "A", "status": "TODO", "created_at": "2023-01-02T00:00:00", "deadline": "2025-02-01"},
+        {"id": 2, "title": "B", "status": "TODO", "created_at": "2023-01-01T00:00:00", "deadline": "2025-03-01"},
+    ]
+
+    result = runner.invoke(
+        view_tasks,
+        ["--due-between", "2025-01-01", "2025-02-15"],
+        obj={"tasks_list": tasks},
+    )
+
+    assert result.exit_code == 0
+    mock_display.assert_called_once_with([tasks[0]], 1, 1, 1, fmt=None)
+
+
+@patch("src.tasks_manager.cli_tools.view_tasks.display_tasks")
+def test_view_tasks_deadline_query_keeps_deadline_order(mock_display, runner):
+    tasks = [
+        {"id": 1, "title": "A", "status": "TODO", "created_at": "2023-01-02T00:00:00", "deadline": "2025-02-01"},
+        {"id": 2, "title": "B", "status": "TODO", "created_at": "2023-01-01T00:00:00", "deadline": "2025-03-01"},
+    ]
+
+    result = runner.invoke(
+        view_tasks,
+        ["--due-between", "2025-01-01", "2025-12-31"],
+        obj={"tasks_list": tasks},
+    )
+
+    assert result.exit_code == 0
+    mock_display.assert_called_once_with(tasks, 1, 1, 2, fmt=None)
+
+
+def test_view_tasks_single_deadline_query(runner, context):
+    result = runner.invoke(
+        view_tasks, ["--overdue", "--due-within", "3"], obj=context
+    )
+
+    assert result.exit_code != 0
+
+
+@pytest.mark.parametrize(
+    "args, note",
+    [
+        (["--status", "DONE", "--format", "json"], "Total de tâches: 0"),
+        (["--page", "9", "--format", "ndjson"], "Page 9 n'existe pas"),
+    ],
+)
+def test_view_tasks_empty_page_notes_go_to_stderr(context, args, note):
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(view_tasks, args, obj=context)
+
+    assert result.exit_code == 0
+    if "json" in args:
+        assert json.loads(result.stdout) == []
+    else:
+        assert result.stdout == ""
+    assert note in result.stderr
+
+
+class _Watcher:
+    interval = 0
+
+    def __init__(self, changes):
+        self.changes = list(changes)
+
+    def changed(self):
+        return self.changes.pop(0)
+
+
+class _Mirror:
+    def __init__(self, refreshes):
+        self.refreshes = list(refreshes)
+
+    def refresh(self):
+        return self.refreshes.pop(0)
+
+
+def test_watch_page_renders_only_visible_changes():
+    pages = iter(["a", "a", "b"])
+    shown = []
+    watcher = _Watcher([False, True, True, True])
+    mirror = _Mirror([0, 1, 1])
+
+    renders = watch_page(
+        watcher,
+        mirror,
+        select=lambda: next(pages),
+        show=shown.append,
+        sleep=lambda seconds: None,
+        should_stop=lambda: not watcher.changes,
+    )
+
+    assert renders == 2
+    assert shown == ["a", "b"]
+
+
+@patch("src.tasks_manager.cli_tools.view_tasks.watch_page")
+def test_view_tasks_watch_disables_autosave(mock_watch, runner, tmp_path):
+    data_file = tmp_path / "tasks.json"
+    data_file.write_text("[]", encoding="utf-8")
+    obj = {"tasks_list": [], "data_file": str(data_file)}
+    mock_watch.side_effect = KeyboardInterrupt
+
+    result = runner.invoke(view_tasks, ["--watch", "--format", "json"], obj=obj)
+
+    assert result.exit_code == 0
+    assert obj["autosave"] is False
+    watcher, mirror = mock_watch.call_args[0][:2]
+    assert watcher.paths == (str(data_file), str(data_file) + ".journal")
+
+
+@patch("src.tasks_manager.cli_tools.view_tasks.watch_page")
+def test_view_tasks_watch_records_no_operations(mock_watch, runner, tmp_path):
+    data_file = tmp_path / "tasks.json"
+    data_file.write_text("[]", encoding="utf-8")
+    op_log = OperationLog(str(data_file))
+    op_log.begin("view_tasks")
+    obj = {"tasks_list": [], "data_file": str(data_file), "op_log": op_log}
+
+    def reload_external_edit(*args):
+        emit("create", {"id": 1, "title": "Ailleurs"})
+        raise KeyboardInterrupt
+
+    mock_watch.side_effect = reload_external_edit
+
+    result = runner.invoke(view_tasks, ["--watch", "--format", "json"], obj=obj)
+
+    assert result.exit_code == 0
+    assert op_log._pending == []
+
+
+@patch("src.tasks_manager.cli_tools.view_tasks.display_tasks")
+def test_view_tasks_jobs_uses_the_parallel_scan(mock_display, runner):
+    tasks = [
+        {"id": i, "title": f"T{i}", "description": "", "status": "TODO", "created_at": f"2023-01-0{i}T00:00:00"}
+        for i in range(1, 4)
+    ]
+
+    with patch(
+        "src.tasks_manager.utils.parallel_scan.parallel_scan",
+        return_value=tasks[::-1],
+    ) as mock_scan:
+        result = runner.invoke(
+            view_tasks,
+            ["--jobs", "2", "--status", "TODO", "--desc"],
+            obj={"tasks_list": tasks},
+        )
+
+    assert result.exit_code == 0
+    assert mock_scan.call_args.kwargs["workers"] == 2
+    assert mock_scan.call_args.kwargs["ascending"] is False
+    mock_display.assert_called_once_with(tasks[::-1], 1, 1, 3, fmt=None)
@@ -0,0 +1,95 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from src.classes.errors import TaskValidationError
+from src.tasks_manager.utils.backup import BackupSet, task_hash
+
+
+def _tasks(count):
+    return [
+        {"id": i, "title": f"Tâche {i}", "status": "TODO"}
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+def backups(tmp_path):
+    return BackupSet(str(tmp_path / "backups"))
+
+
+class TestBackup:
+    def test_delta_holds_only_changes(self, backups):
+        tasks = _tasks(100)
+        first = backups.backup(tasks, now=datetime(2025, 1, 1, 10))
+        tasks[4] = dict(tasks[4], status="DONE")
+        del tasks[9]
+        tasks.append({"id": 101, "title": "Nouvelle", "status": "TODO"})
+        second = backups.backup(tasks, now=datetime(2025, 1, 1, 11))
+
+        assert first["kind"] == "full"
+        assert (second["kind"], second["changed"], second["deleted"]) == (
+            "delta",
+            2,
+            1,
+        )
+        assert second["bytes"] < first["bytes"]
+
+    def test_full_every_starts_a_new_chain(self, backups):
+        tasks = _tasks(3)
+        kinds = [
+            backups.backup(tasks, full_every=3)["kind"] for _ in range(7)
+        ]
+        assert kinds == ["full", "delta", "delta"] * 2 + ["full"]
+
+    def test_task_hash_ignores_field_order(self):
+        assert task_hash({"id": 1, "title": "A"}) == task_hash(
+            {"title": "A", "id": 1}
+        )
+
+    def test_stale_hash_cache_is_rebuilt(self, backups):
+        tasks = _tasks(5)
+        backups.backup(tasks)
+        os.remove(backups.hashes_path)
+        tasks[0] = dict(tasks[0], title="Modifiée")
+        assert backups.backup(tasks)["changed"] == 1
+
+
+class TestRestore:
+    def test_restore_at_timestamp(self, backups):
+        tasks = _tasks(10)
+        states = []
+        for hour in range(10, 14):
+            tasks = [dict(task) for task in tasks]
+            tasks[hour - 10]["status"] = "DONE"
+            if hour == 12:
+                tasks.pop()
+            backups.backup(tasks, now=datetime(2025, 1, 1, hour))
+            states.append(tasks)
+
+        entry, restored = backups.restore(datetime(2025, 1, 1, 12, 30))
+        assert entry["n"] == 3
+        assert restored == states[2]
+        assert backups.restore()[1] == states[-1]
+        with pytest.raises(TaskValidationError):
+            backups.restore(datetime(2024, 12, 31))
+
+
+class TestVerify:
+    def test_detects_corruption_and_broken_chain(self, backups):
+        tasks = _tasks(10)
+        for i in range(3):
+            tasks = [dict(task) for task in tasks]
+            tasks[i]["title"] = f"Version {i}"
+            backups.backup(tasks)
+        assert [problem for _, problem in backups.verify()] == [None] * 3
+
+        second = backups.entries()[1]
+        path = os.path.join(backups.directory, second["file"])
+        with open(path, "ab") as f:
+            f.write(b"x")
+        problems = [problem for _, problem in backups.verify()]
+        assert problems[0] is None
+        assert "somme de contrôle" in problems[1]
+        assert "chaîne rompue" in problems[2]
@@ -10,6 +10,7 @@ from src.tasks_manager.utils.data_manager import (
     _change_task_status,
 )
 
+from src.tasks_manager.utils.task_events import subscribe, unsubscribe
 from src.classes.errors import (
     TaskValidationError,
     TaskNotFoundError,
@@ -112,6 +113,19 @@ class TestTaskManager:
         )
         assert modified_task["title"] == "Nouveau titre"
 
+    def test_modify_task_emits_previous_values(self):
+        events = []
+
+        def listener(action, task, previous):
+            events.append((action, task["id"], previous["title"]))
+
+        subscribe(listener)
+        try:
+            _modify_task(self.initial_tasks, 1, title="Nouveau titre")
+        finally:
+            unsubscribe(listener)
+        assert events == [("modify", 1, "Première tâche")]
+
     def test_modify_task_updates_description(self):
         modified_task, _ = _modify_task(
             task_id=1,
@@ -120,6 +134,15 @@ class TestTaskManager:
         )
         assert modified_task["description"] == "Nouvelle description"
 
+    def test_modify_task_updates_task_after_the_first(self):
+        modified_task, _ = _modify_task(
+            task_id=2,
+            title="Nouveau titre",
+            tasks_list=self.initial_tasks,
+        )
+        assert modified_task["id"] == 2
+        assert modified_task["title"] == "Nouveau titre"
+
     def test_modify_task_updates_with_too_long_title(self):
         long_title = "T" * 101
         with pytest.raises(
@@ -189,7 +212,7 @@ class TestTaskManager:
                 task_id=9999,
             )
 
-    def test_update_status_valid(self):
+    def test_update_status_valid(self, capsys):
         updated, tasks = _change_task_status(
             tasks_list=self.initial_tasks,
             task_id=1,
@@ -197,6 +220,7 @@ class TestTaskManager:
         )
         assert updated["status"] == "ONGOING"
         assert any(t["id"] == 1 and t["status"] == "ONGOING" for t in tasks)
+        assert capsys.readouterr().out == ""
 
     def test_update_status_invalid_status(self):
         with pytest.raises(
@@ -1,15 +1,20 @@
 """Module to test file utilities in Task Manager application."""
 
+import io
 import json
-from src.tasks_manager.utils.file_utils import _load_tasks, _save_tasks
-from pathlib import Path
+from src.tasks_manager.utils.file_utils import (
+    _load_tasks,
+    _save_tasks,
+    _is_compact_file,
+    display_tasks,
+    stream_tasks,
+)
 
 
 class TestLoadTasks:
-    def test_load_existing_file_returns_list(self):
+    def test_load_existing_file_returns_list(self, tmp_path):
         data = [{"id": 1, "title": "Tâche test"}]
-        file_path = Path("./tests/data/tasks.json")
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path = tmp_path / "tasks.json"
         file_path.write_text(
             json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
         )
@@ -71,3 +76,78 @@ class TestSaveTasks:
 
         saved = json.loads(file_path.read_text(encoding="utf-8"))
         assert saved == tasks
+
+    def test_save_tasks_compact_stores_tag_ids(self, tmp_path):
+        file_path = tmp_path / "compact.json"
+        tasks = [
+            {"id": 1, "title": "A", "tags": ["work", "urgent"]},
+            {"id": 2, "title": "B", "tags": ["work"]},
+        ]
+
+        _save_tasks(tasks, str(file_path), compact=True)
+
+        saved = json.loads(file_path.read_text(encoding="utf-8"))
+        assert saved["tag_dictionary"] == ["work", "urgent"]
+        assert saved["tasks"][1]["tags"] == [0]
+        assert _is_compact_file(str(file_path))
+        assert _load_tasks(str(file_path)) == tasks
+
+    def test_plain_file_is_not_compact(self, tmp_path):
+        file_path = tmp_path / "plain.json"
+        _save_tasks([{"id": 1, "title": "A"}], str(file_path))
+        assert not _is_compact_file(str(file_path))
+
+
+TASKS = [
+    {
+        "id": 1,
+        "title": "Tâche\tune",
+        "description": "",
+        "status": "TODO",
+        "created_at": "2025-01-01T10:00:00",
+        "tags": ["urgent", "home"],
+        "priority": "HIGH",
+    },
+    {
+        "id": 2,
+        "title": "Tâche deux",
+        "description": "Ligne 1\nLigne 2",
+        "status": "DONE",
+        "created_at": "2025-01-02T10:00:00",
+        "deadline": "2025-07-01",
+    },
+]
+
+
+class TestStreamTasks:
+    def _render(self, fmt, tasks=TASKS):
+        out = io.StringIO()
+        stream_tasks(iter(tasks), fmt, out)
+        return out.getvalue()
+
+    def test_plain(self):
+        lines = self._render("plain").splitlines()
+        assert lines[0] == "1 [TODO] Tâche\tune | - | HIGH | #urgent #home"
+        assert lines[1] == "2 [DONE] Tâche deux | 2025-07-01 | -"
+
+    def test_tsv_escapes_separators(self):
+        lines = self._render("tsv").splitlines()
+        assert lines[0].split("\t")[:3] == ["id", "status", "title"]
+        assert len(lines) == 3
+        assert lines[1].split("\t")[2] == "Tâche une"
+        assert lines[1].split("\t")[6] == "urgent,home"
+        assert lines[2].split("\t")[3] == "Ligne 1 Ligne 2"
+
+    def test_json_and_ndjson_round_trip(self):
+        assert json.loads(self._render("json")) == TASKS
+        assert json.loads(self._render("json", [])) == []
+        ndjson = self._render("ndjson").splitlines()
+        assert [json.loads(line) for line in ndjson] == TASKS
+
+    def test_display_tasks_streams_non_table_formats(self, capsys):
+        display_tasks(TASKS, 1, 1, 2, fmt="ndjson")
+        assert capsys.readouterr().out.count("\n") == 2
+
+    def test_display_tasks_defaults_to_plain_when_piped(self, capsys):
+        display_tasks(TASKS, 1, 1, 2)
+        assert capsys.readouterr().out.startswith("1 [TODO]")
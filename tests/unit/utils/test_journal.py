@@ -0,0 +1,110 @@
+import json
+import time
+
+from src.tasks_manager.utils.journal import (
+    BackgroundWriter,
+    Journal,
+    replay_journal,
+)
+
+
+class TestJournal:
+    def test_record_and_replay(self, tmp_path):
+        path = str(tmp_path / "tasks.json.journal")
+        journal = Journal(path)
+        journal.record("create", {"id": 3, "title": "Nouvelle"})
+        journal.record("status", {"id": 1, "title": "Une", "status": "DONE"})
+        journal.record("delete", {"id": 2, "title": "Deux"})
+        journal.close()
+
+        tasks = [
+            {"id": 1, "title": "Une", "status": "TODO"},
+            {"id": 2, "title": "Deux"},
+        ]
+        tasks, replayed = replay_journal(tasks, path)
+
+        assert replayed == 3
+        assert tasks == [
+            {"id": 1, "title": "Une", "status": "DONE"},
+            {"id": 3, "title": "Nouvelle"},
+        ]
+
+    def test_truncate(self, tmp_path):
+        path = tmp_path / "journal"
+        journal = Journal(str(path))
+        journal.record("create", {"id": 1})
+        journal.truncate()
+        journal.record("create", {"id": 2})
+        journal.close()
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["task"]["id"] for line in lines] == [2]
+        assert len(journal) == 1
+
+    def test_replay_ignores_torn_last_line(self, tmp_path):
+        path = tmp_path / "journal"
+        path.write_text(
+            json.dumps({"action": "create", "task": {"id": 1}})
+            + '\n{"action": "cre',
+            encoding="utf-8",
+        )
+        tasks, replayed = replay_journal([], str(path))
+        assert tasks == [{"id": 1}]
+        assert replayed == 1
+
+    def test_replay_without_journal(self, tmp_path):
+        tasks = [{"id": 1}]
+        assert replay_journal(tasks, str(tmp_path / "none")) == (tasks, 0)
+
+
+class TestBackgroundWriter:
+    def test_burst_is_coalesced_into_one_write(self, tmp_path):
+        path = str(tmp_path / "journal")
+        journal = Journal(path)
+        writer = BackgroundWriter(journal, delay=60)
+        for status in ("ONGOING", "DONE") * 50:
+            writer.record("status", {"id": 1, "status": status})
+        writer.record("create", {"id": 2})
+        assert journal.writes == 0
+
+        writer.flush()
+        assert journal.writes == 1
+        assert writer.stats()["records_written"] == 2
+        tasks, replayed = replay_journal([{"id": 1}], path)
+        assert tasks == [{"id": 1, "status": "DONE"}, {"id": 2}]
+
+        writer.close()
+        journal.close()
+
+    def test_threshold_and_delay_trigger_writes(self, tmp_path):
+        journal = Journal(str(tmp_path / "journal"))
+        writer = BackgroundWriter(journal, delay=60, threshold=3)
+        for task_id in range(3):
+            writer.record("create", {"id": task_id})
+        writer.flush()
+        assert journal.entries == 3
+
+        fast = BackgroundWriter(journal, delay=0.01)
+        fast.record("create", {"id": 9})
+        for _ in range(200):
+            if journal.entries == 4:
+                break
+            time.sleep(0.01)
+        assert journal.entries == 4
+
+        writer.close()
+        fast.close()
+        journal.close()
+
+    def test_sync_flush_and_discard(self, tmp_path):
+        journal = Journal(str(tmp_path / "journal"))
+        writer = BackgroundWriter(journal, delay=60)
+        writer.record("create", {"id": 1})
+        writer.flush(sync=True)
+        assert writer.stats()["syncs"] == 1
+
+        writer.record("create", {"id": 2})
+        writer.discard()
+        writer.close()
+        journal.close()
+        assert journal.entries == 1
@@ -0,0 +1,78 @@
+import tracemalloc
+
+from click.testing import CliRunner
+
+from src.task_manager import task_manager
+from src.tasks_manager.utils import timings
+from src.tasks_manager.utils.memory_report import MemoryTimer, field_sizes
+
+
+class TestFieldSizes:
+    def test_groups_and_shared_objects(self):
+        status = "TODO"
+        tasks = [
+            {
+                "id": i,
+                "title": f"Préparer {i}",
+                "status": status,
+                "tags": ["urgent"],
+                "created_at": "2025-01-01T10:00:00",
+            }
+            for i in range(10)
+        ]
+        sizes = field_sizes(tasks)
+        assert set(sizes) == {
+            "dict",
+            "title",
+            "description",
+            "tags",
+            "timestamps",
+            "other",
+        }
+        assert sizes["description"] == 0
+        assert sizes["title"] > 0 and sizes["timestamps"] > 0
+        # la même chaîne de statut n'est comptée qu'une fois
+        one = field_sizes(tasks[:1])
+        assert sizes["other"] < 10 * one["other"]
+
+
+class TestMemoryTimer:
+    def test_phase_peaks_include_nested_phases(self):
+        timer = MemoryTimer()
+        with timer.phase("load"):
+            kept = [bytes(1000) for _ in range(1000)]
+            with timer.phase("query"):
+                temporary = bytearray(2_000_000)
+                del temporary
+        timer.stop()
+
+        assert not tracemalloc.is_tracing()
+        assert timer.peaks["query"] >= 2_000_000
+        assert timer.peaks["load"] >= timer.peaks["query"]
+        assert timer.kept["load"] >= 1_000_000
+        assert timer.peak >= timer.peaks["load"]
+        report = timer.memory_report([{"id": 1, "title": "Préparer"}])
+        assert "Octets par tâche (1 tâches)" in report
+        assert len(kept) == 1000
+
+
+def test_cli_memory_report(tmp_path):
+    runner = CliRunner(mix_stderr=False)
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        runner.invoke(
+            task_manager,
+            ["create_task", "--title", "Préparer", "--description", ""],
+            obj={},
+        )
+        result = runner.invoke(
+            task_manager,
+            ["--memory-report", "view_tasks", "--format", "plain"],
+            obj={},
+        )
+    assert result.exit_code == 0
+    assert "Mémoire (tracemalloc)" in result.stderr
+    assert "load" in result.stderr and "display" in result.stderr
+    assert "Principaux sites d'allocation" in result.stderr
+    assert "Octets par tâche (1 tâches)" in result.stderr
+    assert timings.active() is None
+    assert not tracemalloc.is_tracing()
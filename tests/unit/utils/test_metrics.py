@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from src.classes.errors import TaskNotFoundError
+from src.task_manager import task_manager
+from src.tasks_manager.utils import metrics
+from src.tasks_manager.utils.data_manager import (
+    _change_task_status,
+    _create_task,
+)
+from src.tasks_manager.utils.metrics import MetricsRegistry, TaskMetrics
+from src.tasks_manager.utils.query_utils import search_tasks
+from src.tasks_manager.utils.task_api import TaskAPI
+from src.tasks_manager.utils.task_store import TaskStore
+
+
+@pytest.fixture
+def task_metrics():
+    task_metrics = metrics.enable()
+    yield task_metrics
+    metrics.disable()
+
+
+def _samples(text):
+    values = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            values[name] = float(value)
+    return values
+
+
+class TestTaskMetrics:
+    def test_mutations_errors_and_status_gauges(self, task_metrics):
+        tasks = []
+        _create_task("Préparer", "", tasks)
+        _create_task("Ranger", "", tasks)
+        _change_task_status(tasks, 1, "DONE")
+        metrics.record_error(TaskNotFoundError("absente"))
+
+        values = _samples(task_metrics.render(tasks))
+        assert values['task_manager_mutations_total{action="create"}'] == 2
+        assert values['task_manager_mutations_total{action="status"}'] == 1
+        assert values['task_manager_mutations_total{action="delete"}'] == 0
+        assert values['task_manager_errors_total{type="TaskNotFoundError"}'] == 1  # noqa: E501
+        assert values['task_manager_tasks{status="TODO"}'] == 1
+        assert values['task_manager_tasks{status="DONE"}'] == 1
+
+    def test_query_latency_histogram(self, task_metrics):
+        search_tasks("prép", [{"id": 1, "title": "Préparer"}])
+
+        values = _samples(task_metrics.render())
+        assert values['task_manager_phase_duration_seconds_count{phase="query"}'] == 1  # noqa: E501
+        assert values['task_manager_phase_duration_seconds_bucket{phase="query",le="+Inf"}'] == 1  # noqa: E501
+        assert "# TYPE task_manager_phase_duration_seconds histogram" in (
+            task_metrics.render()
+        )
+
+    def test_disable_stops_collecting(self):
+        task_metrics = TaskMetrics()
+        task_metrics.close()
+        _create_task("Préparer", "", [])
+        assert "action=\"create\"} 0" in task_metrics.render()
+
+
+class TestRegistry:
+    def test_load_previous_adds_counters_not_gauges(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("runs_total", "Runs.")
+        gauge = registry.gauge("size", "Size.")
+        counter.inc(amount=2)
+        gauge.set(value=5)
+        registry.load_previous(registry.render())
+        gauge.set(value=7)
+
+        values = _samples(registry.render())
+        assert values == {"runs_total": 4, "size": 7}
+
+
+class TestExport:
+    def test_textfile_accumulates_cli_runs(self, monkeypatch, tmp_path):
+        metrics_file = tmp_path / "task_manager.prom"
+        monkeypatch.setenv(metrics.METRICS_FILE_ENV, str(metrics_file))
+        runner = CliRunner(mix_stderr=False)
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            for title in ("Préparer", "Ranger"):
+                result = runner.invoke(
+                    task_manager,
+                    ["create_task", "--title", title, "--description", ""],
+                    obj={},
+                )
+                assert result.exit_code == 0
+            result = runner.invoke(task_manager, ["delete_task", "99"], obj={})
+            assert isinstance(result.exception, TaskNotFoundError)
+
+        values = _samples(metrics_file.read_text(encoding="utf-8"))
+        assert values['task_manager_mutations_total{action="create"}'] == 2
+        assert values['task_manager_errors_total{type="TaskNotFoundError"}'] == 1  # noqa: E501
+        assert values['task_manager_tasks{status="TODO"}'] == 2
+        assert values['task_manager_phase_duration_seconds_count{phase="load"}'] == 3  # noqa: E501
+        assert metrics.current() is None
+
+    def test_api_endpoint(self, tmp_path, task_metrics):
+        data_file = tmp_path / "tasks.json"
+        data_file.write_text("[]", encoding="utf-8")
+        store = TaskStore(str(data_file))
+        try:
+            api = TaskAPI(store)
+            body = json.dumps({"title": "Préparer"}).encode()
+            asyncio.run(api.handle("POST", "/tasks", body))
+            asyncio.run(api.handle("GET", "/tasks/9", b""))
+            status, text = asyncio.run(api.handle("GET", "/metrics", b""))
+        finally:
+            store.close()
+
+        assert status == 200
+        values = _samples(text)
+        assert values['task_manager_mutations_total{action="create"}'] == 1
+        assert values['task_manager_errors_total{type="TaskNotFoundError"}'] == 1  # noqa: E501
+        assert values['task_manager_tasks{status="TODO"}'] == 1
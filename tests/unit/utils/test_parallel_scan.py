@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from src.classes.errors import TaskValidationError
+from src.tasks_manager.utils.parallel_scan import parallel_scan
+from src.tasks_manager.utils.query_utils import (
+    filter_tasks_by_status,
+    search_tasks,
+    sorted_task,
+)
+
+
+def _tasks(count):
+    rng = random.Random(1)
+    return [
+        {
+            "id": task_id,
+            "title": rng.choice(["Réunion", "Rapport", "Ménage"]),
+            "description": rng.choice(["", "équipe", "client"]),
+            "status": rng.choice(["TODO", "ONGOING", "DONE"]),
+            "created_at": f"2025-01-{rng.randint(1, 28):02d}T10:00:00",
+        }
+        for task_id in range(1, count + 1)
+    ]
+
+
+class TestParallelScan:
+    @pytest.mark.parametrize("sort_by", ["title", "created_at", "status"])
+    @pytest.mark.parametrize("ascending", [True, False])
+    def test_matches_the_serial_pipeline(self, sort_by, ascending):
+        tasks = _tasks(300)
+        expected = sorted_task(
+            search_tasks("é", filter_tasks_by_status("TODO", tasks)),
+            sort_by=sort_by,
+            ascending=ascending,
+        )
+
+        result = parallel_scan(
+            tasks,
+            status="TODO",
+            search="é",
+            sort_by=sort_by,
+            ascending=ascending,
+            workers=3,
+            min_shard_size=1,
+        )
+
+        assert result == expected
+        assert all(a is b for a, b in zip(result, expected))
+
+    def test_unsorted_scan_keeps_the_original_order(self):
+        tasks = _tasks(100)
+        result = parallel_scan(
+            tasks, status="DONE", workers=2, min_shard_size=1
+        )
+        assert result == filter_tasks_by_status("DONE", tasks)
+
+    def test_small_lists_are_scanned_in_process(self):
+        tasks = _tasks(10)
+        assert parallel_scan(tasks, workers=4) == tasks
+
+    def test_invalid_filters_are_rejected(self):
+        with pytest.raises(TaskValidationError):
+            parallel_scan(_tasks(10), status="LATER")
+        with pytest.raises(ValueError):
+            parallel_scan(_tasks(10), sort_by="color")
@@ -2,6 +2,8 @@
 
 import pytest
 from src.tasks_manager.utils.priority_manager import (
+    PriorityIndex,
+    task_priority,
     set_task_priority,
     get_task_priority,
     sort_tasks_by_priority,
@@ -9,6 +11,7 @@ from src.tasks_manager.utils.priority_manager import (
 )
 
 from src.classes.errors import TaskValidationError
+from src.tasks_manager.utils.task_events import subscribe, unsubscribe
 
 
 class TestPriorityManager:
@@ -56,3 +59,52 @@ class TestPriorityManager:
     def test_filter_tasks_invalid_priority_raises(self):
         with pytest.raises(TaskValidationError, match="Invalid priority"):
             filter_tasks_by_priority(self.tasks, "INVALID")
+
+    def test_sort_tasks_by_priority_is_stable(self):
+        sorted_tasks = sort_tasks_by_priority(self.tasks)
+        assert [task["id"] for task in sorted_tasks] == [3, 2, 4, 5, 1]
+
+    def test_task_priority_sort_without_task_id(self):
+        sorted_tasks = task_priority(self.tasks, None, "sort")
+        assert sorted_tasks[0]["id"] == 3
+
+    def test_task_priority_set_requires_priority(self):
+        with pytest.raises(TaskValidationError):
+            task_priority(self.tasks, 1, "set")
+
+
+class TestPriorityIndex:
+    def setup_method(self):
+        self.tasks = [
+            {"id": 1, "title": "Tâche 1", "priority": "LOW"},
+            {"id": 2, "title": "Tâche 2", "priority": "HIGH"},
+            {"id": 3, "title": "Tâche 3"},
+        ]
+        self.index = PriorityIndex.from_tasks(self.tasks)
+        subscribe(self.index.apply)
+
+    def teardown_method(self):
+        unsubscribe(self.index.apply)
+
+    def test_counts(self):
+        assert self.index.counts() == {
+            "CRITICAL": 0,
+            "HIGH": 1,
+            "NORMAL": 1,
+            "LOW": 1,
+        }
+
+    def test_sort_is_bucket_concatenation(self):
+        sorted_tasks = sort_tasks_by_priority(self.tasks, index=self.index)
+        assert [task["id"] for task in sorted_tasks] == [2, 3, 1]
+
+    def test_set_task_priority_moves_task_between_buckets(self):
+        set_task_priority(self.tasks[0], "CRITICAL")
+        assert filter_tasks_by_priority(self.tasks, "LOW", self.index) == []
+        assert filter_tasks_by_priority(
+            self.tasks, "critical", self.index
+        ) == [self.tasks[0]]
+
+    def test_delete_event_removes_task(self):
+        self.index.apply("delete", self.tasks[1], {})
+        assert self.index.tasks("HIGH") == []
@@ -244,16 +244,14 @@ class TestGetTasks:
         self, capsys
     ):
         result = get_tasks(page=5, size=10, tasks_list=self.tasks)
-        print(result)
 
         assert result == ([], 30, 3)
         captured = capsys.readouterr()
-        assert "Page 5 n'existe pas. Total de pages: 3" in captured.out
+        assert captured.out == ""
 
     def test_get_tasks_should_return_empty_list_for_empty_file(self, capsys):
         tasks_list = []
         result = get_tasks(tasks_list=tasks_list)
         assert result == ([], 0, 0)
         captured = capsys.readouterr()
-        assert "Total de tâches: 0" in captured.out
-        assert "Total de pages: 0" in captured.out
+        assert captured.out == ""
@@ -0,0 +1,157 @@
+"""Module to test recurring tasks."""
+
+import pytest
+from datetime import date
+
+from src.classes.errors import TaskNotFoundError, TaskValidationError
+from src.tasks_manager.utils.recurrence import (
+    set_recurrence,
+    clear_recurrence,
+    occurrence_dates,
+    iter_occurrences,
+    RecurrenceIndex,
+    parse_occurrence_id,
+    materialize_occurrence,
+)
+from src.tasks_manager.utils.task_deadline import (
+    DeadlineIndex,
+    tasks_due_between,
+)
+from src.tasks_manager.utils.task_events import subscribe, unsubscribe
+
+
+def dates(rule, start, end):
+    return [day.isoformat() for day in occurrence_dates(rule, start, end)]
+
+
+class TestOccurrenceDates:
+    def test_every_n_days_jumps_to_window(self):
+        rule = {"freq": "daily", "interval": 3, "start": "2025-01-01"}
+        assert dates(rule, date(2025, 3, 1), date(2025, 3, 7)) == [
+            "2025-03-02",
+            "2025-03-05",
+        ]
+
+    def test_weekly_with_count(self):
+        rule = {"freq": "weekly", "start": "2025-01-06", "count": 3}
+        assert dates(rule, date(2025, 1, 1), date(2025, 12, 31)) == [
+            "2025-01-06",
+            "2025-01-13",
+            "2025-01-20",
+        ]
+        assert dates(rule, date(2025, 1, 14), date(2025, 12, 31)) == [
+            "2025-01-20"
+        ]
+
+    def test_monthly_clamps_to_month_end_with_until(self):
+        rule = {"freq": "monthly", "start": "2025-01-31", "until": "2025-04-30"}
+        assert dates(rule, date(2025, 2, 1), date(2025, 12, 31)) == [
+            "2025-02-28",
+            "2025-03-31",
+            "2025-04-30",
+        ]
+
+
+class TestRecurringTasks:
+    def setup_method(self):
+        self.tasks = [
+            {
+                "id": 1,
+                "title": "Sortir les poubelles",
+                "description": "",
+                "status": "TODO",
+                "created_at": "2025-01-01T10:00:00",
+                "tags": ["maison"],
+            },
+            {
+                "id": 2,
+                "title": "Rapport",
+                "description": "",
+                "status": "TODO",
+                "created_at": "2025-01-01T10:00:00",
+                "deadline": "2025-01-08",
+            },
+        ]
+        set_recurrence(self.tasks, 1, "weekly", start="2025-01-06")
+
+    def test_set_recurrence_validation(self):
+        with pytest.raises(TaskValidationError):
+            set_recurrence(self.tasks, 1, "yearly")
+        with pytest.raises(TaskValidationError):
+            set_recurrence(self.tasks, 1, "daily", interval=0)
+        with pytest.raises(TaskValidationError):
+            set_recurrence(
+                self.tasks, 1, "daily", start="2025-02-01", until="2025-01-01"
+            )
+
+    def test_iter_occurrences_are_virtual_tasks(self):
+        occurrences = list(
+            iter_occurrences(self.tasks[0], date(2025, 1, 1), date(2025, 1, 14))
+        )
+        assert [o["id"] for o in occurrences] == ["1@2025-01-06", "1@2025-01-13"]
+        assert occurrences[0]["tags"] == ["maison"]
+        assert occurrences[0]["status"] == "TODO"
+        assert len(self.tasks) == 2
+
+    def test_window_query_merges_occurrences(self):
+        due = tasks_due_between(
+            self.tasks,
+            "2025-01-01",
+            "2025-01-14",
+            occurrences=RecurrenceIndex.from_tasks(self.tasks),
+        )
+        assert [task["id"] for task in due] == ["1@2025-01-06", 2, "1@2025-01-13"]
+
+    def test_template_deadline_in_window_is_listed_once(self):
+        self.tasks[0]["deadline"] = "2025-01-06"
+        due = tasks_due_between(
+            self.tasks,
+            "2025-01-01",
+            "2025-01-14",
+            occurrences=RecurrenceIndex.from_tasks(self.tasks),
+        )
+        assert [task["id"] for task in due] == ["1@2025-01-06", 2, "1@2025-01-13"]
+
+    def test_materialize_persists_only_touched_occurrence(self):
+        task, tasks = materialize_occurrence(self.tasks, 1, "2025-01-13")
+        assert task["id"] == 3
+        assert task["deadline"] == "2025-01-13"
+        assert task["occurrence_of"] == 1
+        assert task["tags"] == ["maison"]
+        assert self.tasks[0]["exceptions"] == ["2025-01-13"]
+
+        again, _ = materialize_occurrence(self.tasks, 1, "2025-01-13")
+        assert again is task
+
+        due = tasks_due_between(
+            self.tasks,
+            "2025-01-01",
+            "2025-01-14",
+            occurrences=RecurrenceIndex.from_tasks(self.tasks),
+        )
+        assert [t["id"] for t in due] == ["1@2025-01-06", 2, 3]
+
+    def test_materialize_updates_subscribed_indexes(self):
+        index = DeadlineIndex.from_tasks(self.tasks)
+        subscribe(index.apply)
+        try:
+            materialize_occurrence(self.tasks, 1, "2025-01-06")
+        finally:
+            unsubscribe(index.apply)
+        assert len(index) == 2
+
+    def test_materialize_rejects_non_occurrence(self):
+        with pytest.raises(TaskNotFoundError):
+            materialize_occurrence(self.tasks, 1, "2025-01-07")
+        with pytest.raises(TaskValidationError):
+            materialize_occurrence(self.tasks, 2, "2025-01-08")
+
+    def test_clear_recurrence(self):
+        task, _ = clear_recurrence(self.tasks, 1)
+        assert "recurrence" not in task
+        assert len(RecurrenceIndex.from_tasks(self.tasks)) == 0
+
+    def test_parse_occurrence_id(self):
+        assert parse_occurrence_id("12@2025-01-06") == (12, "2025-01-06")
+        with pytest.raises(TaskValidationError):
+            parse_occurrence_id("12-2025-01-06")
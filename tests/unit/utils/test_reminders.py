@@ -0,0 +1,149 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.classes.errors import TaskValidationError
+from src.tasks_manager.utils.file_watcher import FileWatcher
+from src.tasks_manager.utils.reminders import (
+    FileSink,
+    ReminderScheduler,
+    StdoutSink,
+    make_sink,
+    run_reminders,
+)
+
+
+def _ts(value):
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _task(task_id, deadline, status="TODO", title=None):
+    return {
+        "id": task_id,
+        "title": title or f"Tâche {task_id}",
+        "status": status,
+        "deadline": deadline,
+    }
+
+
+class ListSink:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, reminder):
+        self.sent.append(reminder)
+
+
+class TestReminderScheduler:
+    def setup_method(self):
+        self.now = _ts("2025-07-01T08:00")
+        self.scheduler = ReminderScheduler(lead=timedelta(hours=24))
+        self.tasks = [
+            _task(1, "2025-07-03"),
+            _task(2, "2025-07-02"),
+            _task(3, "2025-07-02", status="DONE"),
+            _task(4, None),
+            _task(5, "2025-06-01"),
+        ]
+        self.scheduler.sync(self.tasks, self.now)
+
+    def test_only_upcoming_actionable_deadlines_are_scheduled(self):
+        assert len(self.scheduler) == 2
+        assert self.scheduler.next_time() == _ts("2025-07-01T09:00")
+
+    def test_pop_due_in_order(self):
+        assert self.scheduler.pop_due(self.now) == []
+        due = self.scheduler.pop_due(_ts("2025-07-02T10:00"))
+        assert [r["task_id"] for r in due] == [2, 1]
+        assert due[0]["deadline"] == "2025-07-02"
+        assert "Tâche 2" in due[0]["message"]
+        assert self.scheduler.next_time() is None
+
+    def test_sync_applies_only_changes(self):
+        tasks = [dict(task) for task in self.tasks]
+        tasks[0]["deadline"] = "2025-07-10"
+        tasks[1]["status"] = "DONE"
+        del tasks[4]
+        assert self.scheduler.sync(tasks, self.now) == 3
+        assert len(self.scheduler) == 1
+        assert self.scheduler.next_time() == _ts("2025-07-09T09:00")
+
+    def test_reminder_not_sent_twice_after_reload(self):
+        self.scheduler.pop_due(_ts("2025-07-01T09:00"))
+        tasks = [dict(task) for task in self.tasks]
+        tasks[1]["title"] = "Renommée"
+        self.scheduler.sync(tasks, self.now)
+        assert self.scheduler.pop_due(_ts("2025-07-01T10:00")) == []
+
+    def test_invalid_time(self):
+        with pytest.raises(TaskValidationError):
+            ReminderScheduler(at="9h")
+
+
+class TestSinks:
+    def test_make_sink(self, tmp_path):
+        assert isinstance(make_sink("stdout"), StdoutSink)
+        sink = make_sink(f"file:{tmp_path / 'out.jsonl'}")
+        assert isinstance(sink, FileSink)
+        with pytest.raises(TaskValidationError):
+            make_sink("email")
+
+    def test_file_sink_appends_json_lines(self, tmp_path):
+        path = tmp_path / "out.jsonl"
+        sink = FileSink(str(path))
+        sink.send({"task_id": 1, "message": "a"})
+        sink.send({"task_id": 2, "message": "b"})
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["task_id"] for line in lines] == [1, 2]
+
+    def test_command_sink(self, tmp_path):
+        path = tmp_path / "out.txt"
+        sink = make_sink(f"command:sh -c 'echo $TASK_ID > {path}'")
+        sink.send({"task_id": 7, "title": "T", "deadline": "2025-07-02"})
+        assert path.read_text().strip() == "7"
+
+
+class TestFileWatcher:
+    def test_backoff_and_change(self, tmp_path):
+        path = tmp_path / "tasks.json"
+        path.write_text("[]")
+        watcher = FileWatcher(str(path), min_interval=1, max_interval=4)
+        assert not watcher.changed()
+        assert not watcher.changed()
+        assert not watcher.changed()
+        assert watcher.interval == 4
+        path.write_text("[{}]")
+        assert watcher.changed()
+        assert watcher.interval == 1
+
+
+class TestRunReminders:
+    def test_sleeps_until_next_reminder_and_reloads_changes(self, tmp_path):
+        path = tmp_path / "tasks.json"
+        path.write_text("[]")
+        clock = {"now": _ts("2025-07-01T08:00")}
+        scheduler = ReminderScheduler(lead=timedelta(hours=24))
+        scheduler.sync([_task(1, "2025-07-02")], clock["now"])
+        watcher = FileWatcher(str(path), min_interval=3600, max_interval=7200)
+        sink = ListSink()
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock["now"] += seconds
+            if len(sleeps) == 2:
+                path.write_text(json.dumps([_task(2, "2025-07-03")]))
+
+        run_reminders(
+            scheduler,
+            lambda: json.loads(path.read_text()),
+            watcher,
+            sink,
+            clock=lambda: clock["now"],
+            sleep=sleep,
+            should_stop=lambda: len(sleeps) >= 4,
+        )
+        assert sleeps[0] == 3600
+        assert [r["task_id"] for r in sink.sent] == [1]
+        assert scheduler.next_time() == _ts("2025-07-02T09:00")
@@ -0,0 +1,166 @@
+"""Module to test the subtask tree and its rollups."""
+
+import random
+
+import pytest
+
+from src.classes.errors import TaskNotFoundError, TaskValidationError
+from src.tasks_manager.utils.data_manager import (
+    _change_task_status,
+    _create_task,
+    _delete_task,
+)
+from src.tasks_manager.utils.priority_manager import set_task_priority
+from src.tasks_manager.utils.subtasks import SubtaskTree, set_parent
+from src.tasks_manager.utils.task_events import subscribe, unsubscribe
+
+
+def _task(task_id, parent=None, status="TODO", priority=None):
+    task = {"id": task_id, "title": f"T{task_id}", "status": status}
+    if parent is not None:
+        task["parent"] = parent
+    if priority is not None:
+        task["priority"] = priority
+    return task
+
+
+def _ids(tasks):
+    return [task["id"] for task in tasks]
+
+
+class TestSubtaskTree:
+    def setup_method(self):
+        # 1 ─ 2 ─ 4
+        #   │   └ 5
+        #   └ 3
+        # 6
+        self.tasks = [
+            _task(1),
+            _task(2, parent=1, priority="HIGH"),
+            _task(3, parent=1, status="DONE"),
+            _task(4, parent=2),
+            _task(5, parent=2, status="DONE", priority="LOW"),
+            _task(6),
+        ]
+        self.tree = SubtaskTree.from_tasks(self.tasks)
+        subscribe(self.tree.apply)
+
+    def teardown_method(self):
+        unsubscribe(self.tree.apply)
+
+    def test_paths_and_subtree(self):
+        assert self.tree.paths[5] == (1, 2, 5)
+        assert _ids(self.tree.subtree(1)) == [1, 2, 4, 5, 3]
+        assert _ids(self.tree.subtree(2)) == [2, 4, 5]
+        assert _ids(self.tree.descendants(1, open_only=True)) == [2, 4]
+        assert self.tree.depth(4) == 2
+
+    def test_rollups(self):
+        assert self.tree.rollup(1) == {
+            "tasks": 5,
+            "done": 2,
+            "percent_done": 40.0,
+            "max_priority": "HIGH",
+        }
+        assert self.tree.rollup(5)["percent_done"] == 100.0
+        with pytest.raises(TaskNotFoundError):
+            self.tree.rollup(42)
+
+    def test_rollups_follow_status_and_priority(self):
+        _change_task_status(self.tasks, 4, "DONE")
+        assert self.tree.rollup(2)["done"] == 2
+        assert self.tree.rollup(1)["done"] == 3
+        set_task_priority(self.tasks[4], "CRITICAL")
+        assert self.tree.rollup(1)["max_priority"] == "CRITICAL"
+        set_task_priority(self.tasks[4], "LOW")
+        assert self.tree.rollup(1)["max_priority"] == "HIGH"
+
+    def test_set_parent_moves_the_subtree(self):
+        set_parent(self.tasks, 2, 6, tree=self.tree)
+        assert self.tasks[1]["parent"] == 6
+        assert _ids(self.tree.subtree(6)) == [6, 2, 4, 5]
+        assert self.tree.paths[4] == (6, 2, 4)
+        assert self.tree.rollup(1)["tasks"] == 2
+        assert self.tree.rollup(6)["max_priority"] == "HIGH"
+        set_parent(self.tasks, 2, None, tree=self.tree)
+        assert "parent" not in self.tasks[1]
+        assert self.tree.rollup(6)["tasks"] == 1
+
+    def test_set_parent_refuses_cycles(self):
+        with pytest.raises(TaskValidationError):
+            set_parent(self.tasks, 1, 4, tree=self.tree)
+        with pytest.raises(TaskValidationError):
+            set_parent(self.tasks, 2, 2, tree=self.tree)
+        with pytest.raises(TaskNotFoundError):
+            set_parent(self.tasks, 2, 42, tree=self.tree)
+
+    def test_delete_reattaches_subtasks(self):
+        self.tasks[:] = _delete_task(2, self.tasks)
+        assert [t.get("parent") for t in self.tasks] == [None, 1, 1, 1, None]
+        assert _ids(self.tree.subtree(1)) == [1, 3, 4, 5]
+        assert self.tree.rollup(1)["tasks"] == 4
+
+    def test_created_parent_adopts_waiting_subtasks(self):
+        parent = self.tasks[1]
+        self.tree.apply("delete", parent, {})
+        assert self.tree.paths[4] == (4,)
+        self.tree.apply("create", dict(parent), {})
+        assert self.tree.paths[4] == (1, 2, 4)
+        assert self.tree.rollup(1)["tasks"] == 5
+
+    def test_created_task_is_a_root(self):
+        task, _ = _create_task("Nouvelle", "", self.tasks)
+        assert self.tree.paths[task["id"]] == (task["id"],)
+
+
+def test_cycle_in_file_is_broken():
+    tasks = [_task(1, parent=2), _task(2, parent=1)]
+    tree = SubtaskTree.from_tasks(tasks)
+    assert sorted(tree.paths.values(), key=len) == [(2,), (2, 1)]
+
+
+def test_random_moves_match_a_full_recount():
+    rng = random.Random(5)
+    statuses, priorities = ("TODO", "DONE"), ("LOW", "NORMAL", "HIGH")
+    tasks = [_task(i, status=rng.choice(statuses)) for i in range(1, 31)]
+    tree = SubtaskTree.from_tasks(tasks)
+    subscribe(tree.apply)
+    by_id = {task["id"]: task for task in tasks}
+
+    def subtree(task_id):
+        found = [task_id]
+        for task in tasks:
+            if task.get("parent") == task_id:
+                found += subtree(task["id"])
+        return found
+
+    try:
+        for _ in range(200):
+            task_id = rng.randrange(1, 31)
+            choice = rng.random()
+            if choice < 0.5:
+                parent_id = rng.choice([None] + list(range(1, 31)))
+                try:
+                    set_parent(tasks, task_id, parent_id, tree=tree)
+                except TaskValidationError:
+                    assert parent_id in subtree(task_id)
+            elif choice < 0.75:
+                _change_task_status(tasks, task_id, rng.choice(statuses))
+            else:
+                set_task_priority(by_id[task_id], rng.choice(priorities))
+        for task_id in by_id:
+            members = [by_id[tid] for tid in subtree(task_id)]
+            assert sorted(_ids(tree.subtree(task_id))) == sorted(
+                _ids(members)
+            )
+            rollup = tree.rollup(task_id)
+            assert rollup["tasks"] == len(members)
+            assert rollup["done"] == sum(
+                t["status"] == "DONE" for t in members
+            )
+            highest = max(
+                priorities.index(t.get("priority", "NORMAL")) for t in members
+            )
+            assert rollup["max_priority"] == priorities[highest]
+    finally:
+        unsubscribe(tree.apply)
@@ -0,0 +1,121 @@
+"""Module to test the interned tag dictionary and tag index."""
+
+from src.tasks_manager.utils.tag_dictionary import (
+    TagDictionary,
+    TagIndex,
+    _bits,
+    encode_tags,
+    decode_tags,
+)
+
+
+class TestTagDictionary:
+    def test_intern_returns_stable_ids(self):
+        dictionary = TagDictionary()
+        assert dictionary.intern("work") == 0
+        assert dictionary.intern("home") == 1
+        assert dictionary.intern("work") == 0
+        assert len(dictionary) == 2
+
+    def test_mask_and_names_roundtrip(self):
+        dictionary = TagDictionary(["work", "home", "urgent"])
+        mask = dictionary.mask(["urgent", "work"])
+        assert mask == 0b101
+        assert dictionary.names(mask) == ["urgent", "work"]
+
+    def test_lookup_mask_ignores_unknown_tags(self):
+        dictionary = TagDictionary(["work"])
+        assert dictionary.lookup_mask(["work", "unknown"]) == 1
+        assert "unknown" not in dictionary
+
+    def test_rename_keeps_id(self):
+        dictionary = TagDictionary(["work", "home"])
+        assert dictionary.rename("work", "job") == 0
+        assert dictionary.id_of("job") == 0
+        assert dictionary.id_of("work") is None
+
+    def test_serialization_roundtrip(self):
+        dictionary = TagDictionary(["work", "home"])
+        dictionary.discard("work")
+        restored = TagDictionary.from_list(dictionary.to_list())
+        assert restored.id_of("home") == 1
+        assert restored.intern("new") == 2
+
+
+class TestTagIndex:
+    def setup_method(self):
+        self.tasks = [
+            {"id": 1, "title": "Task 1", "tags": ["work", "urgent"]},
+            {"id": 2, "title": "Task 2", "tags": ["home"]},
+            {"id": 3, "title": "Task 3", "tags": ["work", "home"]},
+            {"id": 4, "title": "Task 4"},
+        ]
+        self.index = TagIndex.from_tasks(self.tasks)
+
+    def test_tasks_with_any(self):
+        tasks = self.index.tasks_with_any(["urgent", "home"])
+        assert [task["id"] for task in tasks] == [1, 2, 3]
+
+    def test_tasks_with_all(self):
+        tasks = self.index.tasks_with_all(["work", "home"])
+        assert [task["id"] for task in tasks] == [3]
+        assert self.index.tasks_with_all(["work", "missing"]) == []
+
+    def test_usage(self):
+        assert self.index.usage() == {"home": 2, "urgent": 1, "work": 2}
+
+    def test_cooccurrence(self):
+        pairs = self.index.cooccurrence()
+        assert pairs == {("home", "work"): 1, ("urgent", "work"): 1}
+        assert self.index.cooccurrence("urgent") == {("urgent", "work"): 1}
+
+    def test_apply_follows_tags_and_delete_events(self):
+        self.tasks[3]["tags"] = ["urgent"]
+        self.index.apply("tags", self.tasks[3], {"tags": []})
+        self.index.apply("delete", self.tasks[0], {})
+        tasks = self.index.tasks_with_any(["urgent"])
+        assert [task["id"] for task in tasks] == [4]
+
+    def test_rename_keeps_tag_id(self):
+        work_id = self.index.dictionary.id_of("work")
+        updated = self.index.rename("work", "job")
+        assert [task["id"] for task, _ in updated] == [1, 3]
+        assert self.tasks[0]["tags"] == ["job", "urgent"]
+        assert self.index.dictionary.id_of("job") == work_id
+        assert self.index.usage() == {"home": 2, "job": 2, "urgent": 1}
+
+    def test_rename_onto_existing_tag_merges(self):
+        self.index.rename("urgent", "home")
+        assert self.tasks[0]["tags"] == ["home", "work"]
+        assert self.index.usage() == {"home": 3, "work": 2}
+        assert self.index.task_mask(1) == self.index.dictionary.lookup_mask(
+            ["home", "work"]
+        )
+
+
+class TestEncoding:
+    def test_encode_decode_roundtrip(self):
+        tasks = [
+            {"id": 1, "tags": ["work", "urgent"]},
+            {"id": 2, "tags": ["work"]},
+            {"id": 3},
+        ]
+        names, encoded = encode_tags(tasks)
+        assert names == ["work", "urgent"]
+        assert encoded[0]["tags"] == [0, 1]
+        assert tasks[0]["tags"] == ["work", "urgent"]
+        assert decode_tags(names, encoded) == tasks
+
+
+def test_bits_of_sparse_and_dense_masks():
+    for positions in ([], [0], [3, 64, 700], list(range(0, 2000, 3))):
+        mask = sum(1 << position for position in positions)
+        assert list(_bits(mask)) == positions
+
+
+def test_dense_tag_over_many_tasks():
+    tasks = [
+        {"id": i, "title": f"T{i}", "tags": ["all"]} for i in range(1, 5001)
+    ]
+    index = TagIndex.from_tasks(tasks)
+    assert index.tasks_with_any(["all"]) == tasks
@@ -1,11 +1,15 @@
 import pytest
 from src.classes.errors import TaskValidationError, TaskNotFoundError
 from src.tasks_manager.utils.task_tags import (
+    bulk_tags_manager,
+    tags_manager,
     _add_tags_to_task,
     _remove_tag_from_task,
     _filter_tasks_by_tags,
     _get_all_tags_with_usage,
 )
+from src.tasks_manager.utils.tag_dictionary import TagIndex
+from src.tasks_manager.utils.task_events import subscribe, unsubscribe
 
 
 class TestTagManager:
@@ -95,3 +99,137 @@ class TestTagManager:
         task, tasks = _add_tags_to_task(self.tasks, 4, ["newtag"])
         assert "newtag" in task["tags"]
         assert isinstance(task["tags"], list)
+
+    def test_tags_manager_filter_returns_tasks_and_list(self):
+        filtered, tasks = tags_manager(self.tasks, 1, "filter", ["home"])
+        assert [task["id"] for task in filtered] == [2]
+        assert tasks is self.tasks
+
+    def test_filter_tasks_by_tags_with_index(self):
+        index = TagIndex.from_tasks(self.tasks)
+        filtered = _filter_tasks_by_tags(self.tasks, ["work", "home"], index)
+        assert [task["id"] for task in filtered] == [1, 2]
+
+    def test_get_all_tags_with_usage_with_index(self):
+        index = TagIndex.from_tasks(self.tasks)
+        assert _get_all_tags_with_usage(self.tasks, index) == {
+            "home": 1,
+            "urgent": 1,
+            "work": 1,
+        }
+
+    def test_tags_manager_remove_multiple_tags(self):
+        task, tasks = tags_manager(self.tasks, 1, "remove", ["work", "urgent"])
+        assert task["tags"] == []
+
+
+class TestBulkTags:
+    def setup_method(self):
+        self.tasks = [
+            {
+                "id": 1,
+                "title": "Faire les courses",
+                "description": "Acheter du lait",
+                "status": "TODO",
+                "tags": ["home", "urgent"],
+                "priority": "HIGH",
+            },
+            {
+                "id": 2,
+                "title": "Rapport",
+                "description": "Finir le rapport",
+                "status": "DONE",
+                "tags": ["work"],
+            },
+            {
+                "id": 3,
+                "title": "Courses de Noël",
+                "description": "Acheter des cadeaux",
+                "status": "TODO",
+            },
+        ]
+
+    def test_bulk_add_to_all_tasks(self):
+        updated, tasks = bulk_tags_manager(self.tasks, "add", ["todo"])
+        assert updated == 3
+        assert all("todo" in task["tags"] for task in tasks)
+
+    def test_bulk_add_with_status_filter(self):
+        updated, tasks = bulk_tags_manager(
+            self.tasks, "add", ["next"], status="TODO"
+        )
+        assert updated == 2
+        assert "next" not in tasks[1]["tags"]
+
+    def test_bulk_add_with_search_and_priority_filters(self):
+        updated, tasks = bulk_tags_manager(
+            self.tasks, "add", ["food"], search="courses", priority="HIGH"
+        )
+        assert updated == 1
+        assert tasks[0]["tags"] == ["food", "home", "urgent"]
+        assert "tags" not in tasks[2]
+
+    def test_bulk_add_already_present_not_counted(self):
+        updated, _ = bulk_tags_manager(self.tasks, "add", ["work"])
+        assert updated == 2
+
+    def test_bulk_remove_with_tag_filter(self):
+        updated, tasks = bulk_tags_manager(
+            self.tasks, "remove", ["urgent", "home"], tag="home"
+        )
+        assert updated == 1
+        assert tasks[0]["tags"] == []
+
+    def test_bulk_rename(self):
+        updated, tasks = bulk_tags_manager(
+            self.tasks, "rename", ["work"], target="job"
+        )
+        assert updated == 1
+        assert tasks[1]["tags"] == ["job"]
+
+    def test_bulk_merge(self):
+        updated, tasks = bulk_tags_manager(
+            self.tasks, "merge", ["home", "work"], target="misc"
+        )
+        assert updated == 2
+        assert tasks[0]["tags"] == ["misc", "urgent"]
+        assert tasks[1]["tags"] == ["misc"]
+
+    def test_bulk_rename_requires_single_source(self):
+        with pytest.raises(TaskValidationError):
+            bulk_tags_manager(self.tasks, "rename", ["a", "b"], target="c")
+
+    def test_bulk_merge_requires_target(self):
+        with pytest.raises(TaskValidationError):
+            bulk_tags_manager(self.tasks, "merge", ["home", "work"])
+
+    def test_bulk_invalid_action(self):
+        with pytest.raises(TaskValidationError):
+            bulk_tags_manager(self.tasks, "explode", ["home"])
+
+    def test_bulk_invalid_status_filter(self):
+        with pytest.raises(TaskValidationError):
+            bulk_tags_manager(self.tasks, "add", ["x"], status="LATER")
+
+    def test_bulk_rename_with_index_is_index_level(self):
+        index = TagIndex.from_tasks(self.tasks)
+        work_id = index.dictionary.id_of("work")
+        updated, tasks = bulk_tags_manager(
+            self.tasks, "rename", ["work"], target="job", index=index
+        )
+        assert updated == 1
+        assert tasks[1]["tags"] == ["job"]
+        assert index.dictionary.id_of("job") == work_id
+
+    def test_bulk_remove_with_index_visits_tagged_tasks(self):
+        index = TagIndex.from_tasks(self.tasks)
+        subscribe(index.apply)
+        try:
+            updated, tasks = bulk_tags_manager(
+                self.tasks, "remove", ["urgent"], status="TODO", index=index
+            )
+        finally:
+            unsubscribe(index.apply)
+        assert updated == 1
+        assert tasks[0]["tags"] == ["home"]
+        assert index.usage() == {"home": 1, "work": 1}
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from src.tasks_manager.utils.task_api import GroupCommit, TaskAPI, start_api
+from src.tasks_manager.utils.task_store import TaskStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    data_file = tmp_path / "tasks.json"
+    data_file.write_text(
+        json.dumps(
+            [
+                {
+                    "id": 1,
+                    "title": "Préparer",
+                    "description": "",
+                    "status": "TODO",
+                    "created_at": "2025-01-01T10:00:00",
+                    "tags": ["urgent"],
+                },
+                {
+                    "id": 2,
+                    "title": "Ranger",
+                    "description": "",
+                    "status": "DONE",
+                    "created_at": "2025-01-02T10:00:00",
+                },
+            ]
+        ),
+        encoding="utf-8",
+    )
+    store = TaskStore(str(data_file))
+    yield store
+    store.close()
+
+
+def _call(api, method, target, body=None):
+    payload = json.dumps(body).encode() if body is not None else b""
+    return asyncio.run(api.handle(method, target, payload))
+
+
+class TestTaskAPI:
+    def test_list_with_filters_and_pagination(self, store):
+        api = TaskAPI(store)
+        status, payload = _call(api, "GET", "/tasks?status=TODO&tag=urgent")
+        assert status == 200
+        assert [task["id"] for task in payload["tasks"]] == [1]
+
+        status, payload = _call(
+            api, "GET", "/tasks?sort_by=title&order=desc&size=1&page=2"
+        )
+        assert [task["title"] for task in payload["tasks"]] == ["Préparer"]
+        assert payload["total_pages"] == 2
+
+    def test_create_update_delete(self, store):
+        api = TaskAPI(store)
+        status, task = _call(api, "POST", "/tasks", {"title": "Écrire"})
+        assert status == 201
+        assert task["id"] == 3
+
+        status, task = _call(
+            api,
+            "PATCH",
+            "/tasks/3",
+            {
+                "status": "ONGOING",
+                "priority": "HIGH",
+                "deadline": "2030-01-01",
+                "tags": {"add": ["rapport"]},
+            },
+        )
+        assert status == 200
+        assert task["status"] == "ONGOING"
+        assert task["tags"] == ["rapport"]
+        assert _call(api, "GET", "/tags")[1] == {"rapport": 1, "urgent": 1}
+
+        status, task = _call(api, "PATCH", "/tasks/3", {"deadline": None})
+        assert task["deadline"] is None
+
+        assert _call(api, "DELETE", "/tasks/3")[0] == 200
+        assert _call(api, "GET", "/tasks/3")[0] == 404
+        assert len(store.journal) > 0
+
+    def test_invalid_update_changes_nothing(self, store):
+        api = TaskAPI(store)
+        status, payload = _call(
+            api, "PATCH", "/tasks/1", {"title": "Nouveau", "priority": "BAD"}
+        )
+        assert status == 400
+        assert store.tasks_list[0]["title"] == "Préparer"
+
+    @pytest.mark.parametrize(
+        "method, target, body",
+        [
+            ("POST", "/tasks", {"title": None}),
+            ("POST", "/tasks", {"title": 123}),
+            ("POST", "/tasks", {"title": "A", "description": ["x"]}),
+            ("PATCH", "/tasks/1", {"tags": {"add": "x"}}),
+            ("PATCH", "/tasks/1", {"tags": {"add": [1]}}),
+            ("PATCH", "/tasks/1", {"tags": ["x"]}),
+            ("PATCH", "/tasks/1", {"status": ["DONE"]}),
+            ("PATCH", "/tasks/1", {"priority": 3}),
+            ("PATCH", "/tasks/1", {"deadline": 20250101}),
+            ("PATCH", "/tasks/1", {"title": "Nouveau", "tags": {"add": [1]}}),
+            (
+                "PATCH",
+                "/tasks/1",
+                {"title": "Nouveau", "description": "x" * 501},
+            ),
+        ],
+    )
+    def test_wrongly_typed_body_is_rejected(self, store, method, target, body):
+        api = TaskAPI(store)
+        before = json.dumps(store.tasks_list)
+        assert _call(api, method, target, body)[0] == 400
+        assert json.dumps(store.tasks_list) == before
+
+    def test_errors(self, store):
+        api = TaskAPI(store)
+        assert _call(api, "GET", "/nowhere")[0] == 404
+        assert _call(api, "PUT", "/tasks/1")[0] == 405
+        assert _call(api, "GET", "/tasks?page=0")[0] == 400
+        assert _call(api, "PATCH", "/tasks/1", {"color": "red"})[0] == 400
+
+
+class TestGroupCommit:
+    def test_concurrent_writes_share_syncs(self):
+        syncs = []
+
+        def sync():
+            time.sleep(0.01)
+            syncs.append(threading.get_ident())
+
+        committer = GroupCommit(sync)
+
+        async def burst():
+            await asyncio.gather(*(committer.commit() for _ in range(50)))
+
+        asyncio.run(burst())
+        assert committer.writes == 50
+        assert committer.commits == len(syncs) <= 2
+
+
+def test_http_round_trip(store):
+    async def scenario():
+        api = TaskAPI(store, GroupCommit(store.journal.sync))
+        server = await start_api(api, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        body = json.dumps({"title": "Via HTTP"}).encode()
+        writer.write(
+            b"POST /tasks HTTP/1.1\r\nHost: localhost\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode()
+            + body
+            + b"GET /stats HTTP/1.1\r\nConnection: close\r\n\r\n"
+        )
+        response = (await reader.read()).decode()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return response
+
+    response = asyncio.run(scenario())
+    assert response.startswith("HTTP/1.1 201 Created")
+    assert '"title": "Via HTTP"' in response
+    assert '"writes": 1, "commits": 1' in response
@@ -0,0 +1,40 @@
+from src.tasks_manager.utils.task_client import (
+    command_name,
+    forward,
+    runs_locally,
+)
+
+
+class TestCommandName:
+    def test_skips_root_options(self):
+        assert command_name(["--storage", "json", "view_tasks"]) == (
+            "view_tasks"
+        )
+        assert command_name(["view_tasks", "--status", "TODO"]) == (
+            "view_tasks"
+        )
+        assert command_name(["--help"]) is None
+        assert command_name(
+            ["--timings", "--profile-file", "x.pstats", "next"]
+        ) == "next"
+
+    def test_watch_runs_locally(self):
+        assert runs_locally(["view_tasks", "--watch"])
+        assert runs_locally(["shell"])
+        assert runs_locally(["--memory-report", "view_tasks"])
+        assert not runs_locally(["view_tasks", "--status", "TODO"])
+
+
+class TestForward:
+    def test_runs_locally_without_server(self, tmp_path):
+        assert forward(["view_tasks"], str(tmp_path / "none.sock")) is None
+
+    def test_local_commands_are_not_forwarded(self, tmp_path):
+        path = tmp_path / "tasks.sock"
+        path.write_text("")
+        assert forward(["serve"], str(path)) is None
+
+    def test_stale_socket_runs_locally(self, tmp_path):
+        path = tmp_path / "tasks.sock"
+        path.write_text("")
+        assert forward(["view_tasks"], str(path)) is None
@@ -1,6 +1,19 @@
 import pytest
-from src.tasks_manager.utils.task_deadline import DeadlineTask
-from src.classes.errors import TaskNotFoundError
+from datetime import date
+from src.tasks_manager.utils.task_deadline import (
+    DeadlineTask,
+    DeadlineIndex,
+    parse_deadline,
+    epoch_day,
+    overdue_tasks,
+    tasks_due_within,
+    tasks_due_between,
+    query_deadlines,
+    schedule_deadlines,
+    load_deadline_mapping,
+)
+from src.tasks_manager.utils.task_events import subscribe, unsubscribe
+from src.classes.errors import TaskNotFoundError, TaskValidationError
 
 
 class TestDeadlineTask:
@@ -92,3 +105,133 @@ class TestDeadlineTask:
                 task_id=task_id,
                 deadline=past_deadline,
             )
+
+
+class TestDeadlineIndex:
+    """Test class for DeadlineIndex and deadline queries."""
+
+    def setup_method(self):
+        self.tasks = [
+            {"id": 1, "status": "TODO", "deadline": "2025-01-05"},
+            {"id": 2, "status": "DONE", "deadline": "2025-01-01"},
+            {"id": 3, "status": "TODO", "deadline": "2025-01-12"},
+            {"id": 4, "status": "ONGOING", "deadline": "2025-01-01"},
+            {"id": 5, "status": "TODO"},
+            {"id": 6, "status": "TODO", "deadline": None},
+        ]
+        self.today = date(2025, 1, 10)
+        self.index = DeadlineIndex.from_tasks(self.tasks)
+
+    def ids(self, tasks):
+        return [task["id"] for task in tasks]
+
+    def test_parse_deadline(self):
+        assert parse_deadline("2025-01-31") == date(2025, 1, 31)
+        assert epoch_day(date(1970, 1, 2)) == 1
+        for invalid in ("31-01-2025", "20250131", "2025-02-30", None):
+            with pytest.raises(ValueError, match="YYYY-MM-DD"):
+                parse_deadline(invalid)
+
+    def test_only_tasks_with_deadline_are_indexed(self):
+        assert len(self.index) == 4
+
+    def test_overdue_excludes_done_tasks(self):
+        overdue = overdue_tasks(self.tasks, self.today, self.index)
+        assert self.ids(overdue) == [4, 1]
+
+    def test_due_within(self):
+        due = tasks_due_within(self.tasks, 2, date(2025, 1, 3), self.index)
+        assert self.ids(due) == [1]
+
+    def test_due_within_negative_raises(self):
+        with pytest.raises(TaskValidationError):
+            tasks_due_within(self.tasks, -1, self.today, self.index)
+
+    def test_due_between_is_inclusive(self):
+        due = tasks_due_between(self.tasks, "2025-01-01", "2025-01-05")
+        assert self.ids(due) == [2, 4, 1]
+
+    def test_due_between_reversed_raises(self):
+        with pytest.raises(TaskValidationError):
+            tasks_due_between(self.tasks, "2025-01-05", "2025-01-01")
+
+    def test_query_deadlines_single_query(self):
+        assert query_deadlines(self.tasks) is None
+        with pytest.raises(TaskValidationError):
+            query_deadlines(self.tasks, overdue=True, due_within=3)
+
+    def test_index_follows_deadline_changes(self):
+        subscribe(self.index.apply)
+        try:
+            DeadlineTask(self.tasks, 3, "2025-01-02").modify_task_deadline()
+            DeadlineTask(self.tasks, 1).remove_deadline_from_task()
+            DeadlineTask(self.tasks, 5, "2025-01-03").add_deadline_to_task()
+            self.index.apply("delete", self.tasks[3], {})
+        finally:
+            unsubscribe(self.index.apply)
+        due = self.index.between(date(2025, 1, 1), date(2025, 1, 31))
+        assert self.ids(due) == [2, 3, 5]
+
+
+class TestScheduleDeadlines:
+    """Test class for bulk deadline scheduling."""
+
+    def setup_method(self):
+        self.tasks = [
+            {"id": 1, "status": "TODO"},
+            {"id": 2, "status": "DONE", "deadline": "2025-01-01"},
+            {"id": 3, "status": "TODO"},
+        ]
+        self.today = date(2025, 1, 10)
+
+    def test_one_deadline_for_selected_tasks(self):
+        updated, past = schedule_deadlines(
+            self.tasks,
+            deadline="2025-02-01",
+            select=lambda task: task["status"] == "TODO",
+            today=self.today,
+        )
+        assert [task["id"] for task in updated] == [1, 3]
+        assert past == []
+        assert self.tasks[0]["deadline"] == "2025-02-01"
+        assert self.tasks[1]["deadline"] == "2025-01-01"
+
+    def test_mapping_with_aggregated_past_warning(self):
+        with pytest.warns(UserWarning, match="2 deadline") as record:
+            updated, past = schedule_deadlines(
+                self.tasks,
+                assignments={1: "2025-01-02", 2: "2025-01-03", 3: "2025-03-01"},
+                today=self.today,
+            )
+        assert len(record) == 1
+        assert past == [1, 2]
+        assert self.tasks[2]["deadline"] == "2025-03-01"
+
+    def test_unknown_ids_leave_tasks_untouched(self):
+        with pytest.raises(TaskNotFoundError, match="42"):
+            schedule_deadlines(self.tasks, assignments={1: "2025-02-01", 42: "2025-02-01"})
+        assert "deadline" not in self.tasks[0]
+
+    def test_invalid_date_raises(self):
+        with pytest.raises(ValueError, match="YYYY-MM-DD"):
+            schedule_deadlines(self.tasks, deadline="01/02/2025")
+
+    def test_deadline_or_mapping_required(self):
+        with pytest.raises(TaskValidationError):
+            schedule_deadlines(self.tasks)
+
+    def test_load_deadline_mapping_json_and_csv(self, tmp_path):
+        json_file = tmp_path / "mapping.json"
+        json_file.write_text('{"1": "2025-02-01", "3": "2025-03-01"}')
+        csv_file = tmp_path / "mapping.csv"
+        csv_file.write_text("id,deadline\n1,2025-02-01\n3, 2025-03-01\n")
+
+        expected = {1: "2025-02-01", 3: "2025-03-01"}
+        assert load_deadline_mapping(str(json_file)) == expected
+        assert load_deadline_mapping(str(csv_file)) == expected
+
+    def test_load_deadline_mapping_invalid(self, tmp_path):
+        bad_file = tmp_path / "mapping.json"
+        bad_file.write_text('{"one": "2025-02-01"}')
+        with pytest.raises(TaskValidationError):
+            load_deadline_mapping(str(bad_file))
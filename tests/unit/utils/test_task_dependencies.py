@@ -0,0 +1,161 @@
+"""Module to test the task dependency graph."""
+
+import random
+
+import pytest
+
+from src.classes.errors import TaskNotFoundError, TaskValidationError
+from src.tasks_manager.utils.data_manager import (
+    _change_task_status,
+    _create_task,
+    _delete_task,
+)
+from src.tasks_manager.utils.task_dependencies import (
+    DependencyGraph,
+    add_dependencies,
+    remove_dependencies,
+)
+from src.tasks_manager.utils.task_events import subscribe, unsubscribe
+
+
+def _task(task_id, status="TODO", blocked_by=None):
+    task = {"id": task_id, "title": f"T{task_id}", "status": status}
+    if blocked_by:
+        task["blocked_by"] = blocked_by
+    return task
+
+
+class TestDependencyGraph:
+    def setup_method(self):
+        self.tasks = [
+            _task(1),
+            _task(2, blocked_by=[1]),
+            _task(3, blocked_by=[1, 2]),
+            _task(4, status="DONE"),
+            _task(5, blocked_by=[4]),
+        ]
+        self.graph = DependencyGraph.from_tasks(self.tasks)
+        subscribe(self.graph.apply)
+
+    def teardown_method(self):
+        unsubscribe(self.graph.apply)
+
+    def _ready(self):
+        return sorted(task["id"] for task in self.graph.unblocked())
+
+    def test_indexes_both_ways(self):
+        assert self.graph.blockers[3] == {1, 2}
+        assert self.graph.dependents[1] == {2, 3}
+        assert self.graph.open_blockers == {1: 0, 2: 1, 3: 2, 4: 0, 5: 0}
+        assert self._ready() == [1, 5]
+
+    def test_unblocked_count(self):
+        assert len(self.graph.unblocked(1)) == 1
+        assert len(self.graph) == 2
+
+    def test_status_changes_update_counters(self):
+        _change_task_status(self.tasks, 1, "DONE")
+        assert self._ready() == [2, 5]
+        _change_task_status(self.tasks, 2, "ONGOING")
+        _change_task_status(self.tasks, 2, "DONE")
+        assert self._ready() == [3, 5]
+        _change_task_status(self.tasks, 1, "TODO")
+        assert self._ready() == [1, 5]
+        assert self.graph.open_blockers[3] == 1
+
+    def test_add_and_remove(self):
+        add_dependencies(self.tasks, 5, [3], graph=self.graph)
+        assert self.tasks[4]["blocked_by"] == [4, 3]
+        assert self._ready() == [1]
+        remove_dependencies(self.tasks, 5, [3, 4])
+        assert "blocked_by" not in self.tasks[4]
+        assert 5 not in self.graph.blockers
+        assert self._ready() == [1, 5]
+
+    def test_cycle_is_refused(self):
+        with pytest.raises(TaskValidationError):
+            add_dependencies(self.tasks, 1, [3], graph=self.graph)
+        with pytest.raises(TaskValidationError):
+            add_dependencies(self.tasks, 1, [1], graph=self.graph)
+        assert "blocked_by" not in self.tasks[0]
+        # chemin 1 -> 3 -> 4 -> 5 : 5 ne peut plus bloquer 1
+        add_dependencies(self.tasks, 4, [3], graph=self.graph)
+        with pytest.raises(TaskValidationError):
+            add_dependencies(self.tasks, 1, [5], graph=self.graph)
+
+    def test_unknown_blocker(self):
+        with pytest.raises(TaskNotFoundError):
+            add_dependencies(self.tasks, 1, [42], graph=self.graph)
+        with pytest.raises(TaskValidationError):
+            remove_dependencies(self.tasks, 1, [2])
+
+    def test_delete_cleans_edges(self):
+        self.tasks[:] = _delete_task(1, self.tasks, dependencies=self.graph)
+        assert "blocked_by" not in self.tasks[0]
+        assert self.tasks[1]["blocked_by"] == [2]
+        assert 1 not in self.graph.tasks
+        assert self._ready() == [2, 5]
+
+    def test_delete_without_graph(self):
+        self.tasks[:] = _delete_task(2, self.tasks)
+        assert self.tasks[1]["blocked_by"] == [1]
+        assert self.graph.blockers[3] == {1}
+
+    def test_created_task_joins_the_graph(self):
+        task, _ = _create_task("Nouvelle", "", self.tasks)
+        assert task["id"] in self.graph.ready
+        add_dependencies(self.tasks, 1, [task["id"]], graph=self.graph)
+        assert self._ready() == [5, task["id"]]
+
+    def test_recreated_blocker_is_linked_again(self):
+        blocker = self.tasks[0]
+        self.graph.apply("delete", blocker, {})
+        assert self.graph.blockers[3] == {2}
+        self.graph.apply("create", dict(blocker), {})
+        assert self.graph.blockers[3] == {1, 2}
+        assert self._ready() == [1, 5]
+
+    def test_cycle_in_file_is_ignored(self):
+        tasks = [_task(1, blocked_by=[2]), _task(2, blocked_by=[1]), _task(3)]
+        graph = DependencyGraph.from_tasks(tasks)
+        assert graph.blockers == {}
+        add_dependencies(tasks, 2, [1], graph=graph)
+
+
+def test_random_edges_match_a_full_search():
+    """Cycles refused incrementally are exactly those a full DFS finds."""
+    rng = random.Random(3)
+    tasks = [_task(i) for i in range(1, 41)]
+    graph = DependencyGraph.from_tasks(tasks)
+    subscribe(graph.apply)
+    edges = {i: set() for i in range(1, 41)}
+
+    def reaches(start, goal):
+        stack, seen = [start], set()
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                return True
+            if node not in seen:
+                seen.add(node)
+                stack.extend(edges[node])
+        return False
+
+    try:
+        for _ in range(300):
+            task_id, blocker_id = rng.sample(range(1, 41), 2)
+            # arête blocker -> task : cycle si task atteint déjà blocker
+            cycle = reaches(task_id, blocker_id)
+            try:
+                add_dependencies(tasks, task_id, [blocker_id], graph=graph)
+                edges[blocker_id].add(task_id)
+            except TaskValidationError:
+                assert cycle
+            else:
+                assert not cycle
+        position = {tid: graph._order[tid] for tid in edges}
+        for blocker_id, dependents in edges.items():
+            for task_id in dependents:
+                assert position[blocker_id] < position[task_id]
+    finally:
+        unsubscribe(graph.apply)
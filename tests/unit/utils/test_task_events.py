@@ -0,0 +1,70 @@
+"""Module to test task mutation events."""
+
+from src.tasks_manager.utils.task_events import (
+    subscribe,
+    unsubscribe,
+    emit,
+    cached_index,
+    replace_tasks,
+)
+
+
+class RecordingIndex:
+    def __init__(self, tasks_list):
+        self.tasks_list = tasks_list
+        self.events = []
+
+    def apply(self, action, task, previous):
+        self.events.append((action, task["id"], previous))
+
+
+class TestTaskEvents:
+    def test_emit_calls_subscribed_function(self):
+        events = []
+
+        def listener(action, task, previous):
+            events.append((action, task["id"], previous))
+
+        subscribe(listener)
+        try:
+            emit("status", {"id": 1}, {"status": "TODO"})
+        finally:
+            unsubscribe(listener)
+        emit("status", {"id": 2})
+
+        assert events == [("status", 1, {"status": "TODO"})]
+
+    def test_bound_methods_are_held_weakly(self):
+        index = RecordingIndex([])
+        subscribe(index.apply)
+        emit("create", {"id": 1})
+        events = index.events
+        del index
+        emit("create", {"id": 2})
+        assert events == [("create", 1, {})]
+
+    def test_replace_tasks_notifies_changes(self):
+        events = []
+
+        def listener(action, task, previous):
+            events.append((action, task["id"]))
+
+        tasks = [{"id": i, "status": "TODO"} for i in (1, 2, 3)]
+        fresh = [tasks[0], dict(tasks[1], status="DONE")]
+        subscribe(listener)
+        try:
+            assert replace_tasks(tasks, fresh) == 2
+        finally:
+            unsubscribe(listener)
+        assert tasks == fresh
+        assert sorted(events) == [("create", 2), ("delete", 2), ("delete", 3)]
+
+    def test_cached_index_is_built_once_and_subscribed(self):
+        obj = {"tasks_list": [{"id": 1}]}
+        index = cached_index(obj, "recording", RecordingIndex)
+        assert cached_index(obj, "recording", RecordingIndex) is index
+        assert index.tasks_list is obj["tasks_list"]
+
+        emit("delete", {"id": 1})
+        assert index.events == [("delete", 1, {})]
+        unsubscribe(index.apply)
@@ -0,0 +1,159 @@
+import json
+
+import pytest
+
+from src.classes.errors import TaskValidationError
+from src.tasks_manager.utils.data_manager import (
+    _change_task_status,
+    _create_task,
+    _delete_task,
+)
+from src.tasks_manager.utils.priority_manager import set_task_priority
+from src.tasks_manager.utils.recurrence import set_recurrence
+from src.tasks_manager.utils.task_deadline import DeadlineTask
+from src.tasks_manager.utils.task_history import OperationLog, oplog_path
+from src.tasks_manager.utils.task_tags import (
+    _add_tags_to_task,
+    bulk_tags_manager,
+)
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    return str(tmp_path / "tasks.json")
+
+
+def _run(log, command, mutate, tasks):
+    log.begin(command)
+    mutate(tasks)
+    return log.commit()
+
+
+class TestOperationLog:
+    def test_undo_and_redo_a_group(self, data_file, capsys):
+        log = OperationLog(data_file)
+        tasks = []
+        _run(log, "create_task", lambda t: _create_task("A", "", t), tasks)
+        _run(
+            log,
+            "bulk",
+            lambda t: (
+                _change_task_status(t, 1, "DONE"),
+                _add_tags_to_task(t, 1, ["urgent"]),
+                set_task_priority(t[0], "HIGH"),
+            ),
+            tasks,
+        )
+        snapshot = json.loads(json.dumps(tasks))
+
+        group, count = log.undo(tasks)
+        assert (group[3], count) == ("bulk", 3)
+        assert tasks[0]["status"] == "TODO"
+        assert "priority" not in tasks[0]
+        assert log.commit() == 1
+
+        log.begin("redo")
+        log.redo(tasks)
+        log.commit()
+        assert tasks == snapshot
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda t: _add_tags_to_task(t, 1, ["x"]),
+            lambda t: bulk_tags_manager(t, "add", ["x"]),
+            lambda t: set_task_priority(t[0], "HIGH"),
+            lambda t: DeadlineTask(t, 1, "2030-01-01").add_deadline_to_task(),
+            lambda t: set_recurrence(t, 1, "weekly"),
+        ],
+    )
+    def test_undo_restores_the_whole_task(self, data_file, mutate):
+        log = OperationLog(data_file)
+        tasks = []
+        _run(log, "create_task", lambda t: _create_task("A", "", t), tasks)
+        before = json.loads(json.dumps(tasks))
+
+        _run(log, "change", mutate, tasks)
+        after = json.loads(json.dumps(tasks))
+        log.undo(tasks)
+        log.commit()
+        assert tasks == before
+
+        log.begin("redo")
+        log.redo(tasks)
+        log.commit()
+        assert tasks == after
+
+    def test_undo_delete_restores_position(self, data_file, capsys):
+        log = OperationLog(data_file)
+        tasks = []
+        for title in "ABC":
+            _create_task(title, "", tasks)
+        log.begin("delete_task")
+        tasks[:] = _delete_task(2, tasks)
+        log.commit()
+
+        log.undo(tasks)
+        assert [task["id"] for task in tasks] == [1, 2, 3]
+
+    def test_conflicting_change_is_refused(self, data_file, capsys):
+        log = OperationLog(data_file)
+        tasks = []
+        _create_task("A", "", tasks)
+        _run(log, "s", lambda t: _change_task_status(t, 1, "DONE"), tasks)
+        tasks[0]["status"] = "ONGOING"  # modifiée hors du journal
+
+        with pytest.raises(TaskValidationError):
+            log.undo(tasks)
+        assert tasks[0]["status"] == "ONGOING"
+
+    def test_failed_command_is_not_logged(self, data_file):
+        log = OperationLog(data_file)
+        log.begin("create_task")
+        _create_task("A", "", [])
+        assert log.commit(saved=False) == 0
+        log.begin("create_task", shared=True)
+        _create_task("B", "", [])
+        assert log.commit(saved=False) == 1
+
+    def test_history_reads_the_task_index(self, data_file, capsys):
+        log = OperationLog(data_file)
+        tasks = []
+        _run(log, "c", lambda t: _create_task("A", "", t), tasks)
+        _run(log, "c", lambda t: _create_task("B", "", t), tasks)
+        _run(log, "s", lambda t: _change_task_status(t, 1, "DONE"), tasks)
+        log.undo(tasks)
+        log.commit()
+
+        entries = list(log.history(1))
+        assert [entry["a"] for entry, _ in entries] == ["create", "status"]
+        assert [undone for _, undone in entries] == [False, True]
+        assert [e["a"] for e, _ in log.history(1, limit=1)] == ["status"]
+        assert list(log.history(99)) == []
+
+
+class TestSnapshots:
+    def test_reopen_replays_only_the_tail(self, data_file, capsys):
+        log = OperationLog(data_file, snapshot_every=3)
+        tasks = []
+        for title in "ABCD":
+            _run(log, "c", lambda t: _create_task(title, "", t), tasks)
+        with open(f"{oplog_path(data_file)}.idx", encoding="utf-8") as f:
+            state = json.load(f)
+        assert state["seq"] == 3
+        assert len(state["undo"]) == 3
+
+        reopened = OperationLog(data_file, snapshot_every=3)
+        reopened._ensure_loaded()
+        assert reopened.since_snapshot == 1
+        assert [group[0] for group in reopened.undo_stack] == [1, 2, 3, 4]
+        assert sorted(reopened.tasks) == [1, 2, 3, 4]
+
+    def test_truncated_log_ignores_the_snapshot(self, data_file, capsys):
+        log = OperationLog(data_file, snapshot_every=1)
+        _run(log, "c", lambda t: _create_task("A", "", t), [])
+        with open(oplog_path(data_file), "w"):
+            pass
+
+        reopened = OperationLog(data_file)
+        assert reopened.undo([]) is None
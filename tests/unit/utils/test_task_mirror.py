@@ -0,0 +1,105 @@
+import json
+
+from src.tasks_manager.utils.journal import Journal
+from src.tasks_manager.utils.tag_dictionary import TagIndex
+from src.tasks_manager.utils.task_events import cached_index
+from src.tasks_manager.utils.task_mirror import TaskMirror
+
+
+TASKS = [
+    {
+        "id": 1,
+        "title": "Une",
+        "description": "",
+        "status": "TODO",
+        "created_at": "2025-01-01T10:00:00",
+    },
+    {
+        "id": 2,
+        "title": "Deux",
+        "description": "",
+        "status": "TODO",
+        "created_at": "2025-01-02T10:00:00",
+    },
+]
+
+
+class TestTaskMirror:
+    """The writer side is another process; its journal is written here."""
+
+    def setup_method(self):
+        self.journal = None
+
+    def teardown_method(self):
+        if self.journal is not None:
+            self.journal.close()
+
+    def _open(self, tmp_path):
+        self.data_file = tmp_path / "tasks.json"
+        self.data_file.write_text(json.dumps(TASKS), encoding="utf-8")
+        self.journal = Journal(str(tmp_path / "tasks.json.journal"))
+        self.obj = {}
+        return TaskMirror(self.obj, str(self.data_file))
+
+    def test_journal_lines_are_applied_incrementally(self, tmp_path):
+        mirror = self._open(tmp_path)
+        untouched = mirror.tasks_list[1]
+        assert mirror.refresh() == 0
+
+        self.journal.record("status", dict(TASKS[0], status="DONE"))
+        self.journal.record("create", dict(TASKS[0], id=3, title="Trois"))
+        assert mirror.refresh() == 2
+        assert [t["status"] for t in mirror.tasks_list] == [
+            "DONE",
+            "TODO",
+            "TODO",
+        ]
+        assert mirror.tasks_list[1] is untouched
+
+        self.journal.record("delete", TASKS[1])
+        self.journal.record("delete", TASKS[1])
+        assert mirror.refresh() == 1
+        assert [t["id"] for t in mirror.tasks_list] == [1, 3]
+        assert self.obj["tasks_list"] is mirror.tasks_list
+
+    def test_snapshot_is_diffed_by_id(self, tmp_path):
+        mirror = self._open(tmp_path)
+        self.journal.record("create", dict(TASKS[0], id=3, title="Trois"))
+        mirror.refresh()
+
+        self.data_file.write_text(
+            json.dumps(mirror.tasks_list), encoding="utf-8"
+        )
+        self.journal.truncate()
+        assert mirror.refresh() == 0
+        assert [t["id"] for t in mirror.tasks_list] == [1, 2, 3]
+
+        self.data_file.write_text(
+            json.dumps([dict(TASKS[0], title="Modifiée"), TASKS[1]]),
+            encoding="utf-8",
+        )
+        assert mirror.refresh() == 2
+        assert [t["title"] for t in mirror.tasks_list] == ["Modifiée", "Deux"]
+
+    def test_cached_indexes_follow_the_mirror(self, tmp_path):
+        mirror = self._open(tmp_path)
+        index = cached_index(self.obj, "tag_index", TagIndex.from_tasks)
+
+        self.journal.record("tags", dict(TASKS[1], tags=["urgent"]))
+        mirror.refresh()
+        assert index.usage() == {"urgent": 1}
+
+        self.journal.record("delete", TASKS[1])
+        mirror.refresh()
+        assert index.usage() == {}
+
+    def test_torn_journal_line_waits_for_completion(self, tmp_path):
+        mirror = self._open(tmp_path)
+        entry = json.dumps({"action": "create", "task": dict(TASKS[0], id=9)})
+        with open(self.journal.path, "a", encoding="utf-8") as f:
+            f.write(entry[:10])
+        assert mirror.refresh() == 0
+        with open(self.journal.path, "a", encoding="utf-8") as f:
+            f.write(entry[10:] + "\n")
+        assert mirror.refresh() == 1
+        assert mirror.tasks_list[-1]["id"] == 9
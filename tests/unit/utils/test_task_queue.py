@@ -0,0 +1,120 @@
+"""Module to test the urgency priority queue."""
+
+import pytest
+from datetime import datetime, timedelta
+
+from src.classes.errors import TaskValidationError
+from src.tasks_manager.utils.task_queue import UrgencyQueue, urgency_score
+from src.tasks_manager.utils.task_events import subscribe, unsubscribe
+from src.tasks_manager.utils.data_manager import (
+    _change_task_status,
+    _delete_task,
+)
+from src.tasks_manager.utils.priority_manager import set_task_priority
+
+NOW = datetime(2025, 1, 10, 12, 0, 0)
+
+
+class TestUrgencyScore:
+    def test_higher_priority_scores_higher(self):
+        low = {"priority": "LOW", "created_at": "2025-01-10T00:00:00"}
+        high = {"priority": "HIGH", "created_at": "2025-01-10T00:00:00"}
+        assert urgency_score(high, NOW) > urgency_score(low, NOW)
+
+    def test_closer_deadline_scores_higher(self):
+        soon = {"created_at": "2025-01-10T00:00:00", "deadline": "2025-01-11"}
+        later = {"created_at": "2025-01-10T00:00:00", "deadline": "2025-03-01"}
+        overdue = {
+            "created_at": "2025-01-10T00:00:00",
+            "deadline": "2025-01-01",
+        }
+        assert urgency_score(overdue, NOW) > urgency_score(soon, NOW)
+        assert urgency_score(soon, NOW) > urgency_score(later, NOW)
+
+    def test_age_weight(self):
+        old = {"created_at": "2024-01-10T12:00:00"}
+        new = {"created_at": "2025-01-10T12:00:00"}
+        weights = {"priority": 1.0, "deadline": 0.0, "age": 1.0}
+        assert urgency_score(old, NOW, weights) == pytest.approx(
+            urgency_score(new, NOW, weights) + 366
+        )
+
+    def test_invalid_weight_raises(self):
+        with pytest.raises(TaskValidationError):
+            urgency_score({"created_at": "2025-01-10T00:00:00"}, NOW, {"x": 1})
+
+
+class TestUrgencyQueue:
+    def setup_method(self):
+        self.tasks = [
+            {
+                "id": 1,
+                "title": "Low",
+                "status": "TODO",
+                "priority": "LOW",
+                "created_at": "2025-01-01T10:00:00",
+            },
+            {
+                "id": 2,
+                "title": "Critical",
+                "status": "ONGOING",
+                "priority": "CRITICAL",
+                "created_at": "2025-01-02T10:00:00",
+            },
+            {
+                "id": 3,
+                "title": "Done",
+                "status": "DONE",
+                "priority": "CRITICAL",
+                "created_at": "2025-01-03T10:00:00",
+            },
+            {
+                "id": 4,
+                "title": "Due tomorrow",
+                "status": "TODO",
+                "created_at": "2025-01-04T10:00:00",
+                "deadline": "2025-01-11",
+            },
+        ]
+        self.queue = UrgencyQueue.from_tasks(self.tasks)
+        self.queue.rebuild(NOW.timestamp())
+        subscribe(self.queue.apply)
+
+    def teardown_method(self):
+        unsubscribe(self.queue.apply)
+
+    def ids(self, k):
+        return [task["id"] for task in self.queue.top(k, now=NOW)]
+
+    def test_only_actionable_tasks_are_queued(self):
+        assert len(self.queue) == 3
+        assert self.ids(10) == [4, 2, 1]
+
+    def test_top_k_does_not_consume_queue(self):
+        assert self.ids(2) == [4, 2]
+        assert self.ids(2) == [4, 2]
+
+    def test_status_change_updates_queue(self):
+        _change_task_status(self.tasks, 4, "DONE")
+        _change_task_status(self.tasks, 3, "TODO")
+        assert self.ids(2) == [2, 3]
+
+    def test_priority_change_rescores_task(self):
+        set_task_priority(self.tasks[0], "CRITICAL")
+        set_task_priority(self.tasks[1], "LOW")
+        assert self.ids(3) == [4, 1, 2]
+
+    def test_delete_removes_task(self):
+        _delete_task(4, self.tasks)
+        assert self.ids(10) == [2, 1]
+
+    def test_rebuilds_when_clock_drifts(self):
+        # Two weeks later the deadline of task 4 is overdue: still first,
+        # and its score reflects the new reference time.
+        before = self.queue.score(4)
+        self.queue.top(1, now=NOW + timedelta(days=14))
+        assert self.queue.score(4) > before
+
+    def test_configure_rebuilds_with_new_weights(self):
+        self.queue.configure({"deadline": 0.0})
+        assert self.ids(1) == [2]
@@ -0,0 +1,121 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.tasks_manager.utils.data_manager import (
+    _create_task,
+    _change_task_status,
+)
+from src.tasks_manager.utils.task_store import TaskStore
+
+
+class TestTaskStore:
+    def setup_method(self):
+        self.store = None
+
+    def teardown_method(self):
+        if self.store is not None:
+            self.store.close()
+
+    def _open(self, tmp_path, tasks=(), **kwargs):
+        data_file = tmp_path / "tasks.json"
+        data_file.write_text(json.dumps(list(tasks)), encoding="utf-8")
+        self.store = TaskStore(str(data_file), **kwargs)
+        return data_file
+
+    def test_mutations_are_journaled_then_snapshotted(self, tmp_path):
+        data_file = self._open(tmp_path)
+        _create_task("Une", "", self.store.tasks_list)
+
+        journal = tmp_path / "tasks.json.journal"
+        assert len(journal.read_text(encoding="utf-8").splitlines()) == 1
+        assert json.loads(data_file.read_text(encoding="utf-8")) == []
+
+        self.store.snapshot()
+        saved = json.loads(data_file.read_text(encoding="utf-8"))
+        assert [task["title"] for task in saved] == ["Une"]
+        assert journal.read_text(encoding="utf-8") == ""
+
+    def test_journal_is_replayed_on_open(self, tmp_path):
+        data_file = self._open(
+            tmp_path, [{"id": 1, "title": "Une", "status": "TODO"}]
+        )
+        _change_task_status(self.store.tasks_list, 1, "DONE")
+        # Simulate a crash: the store is dropped without a snapshot
+        self.store.journal.close()
+        self.store = TaskStore(str(data_file))
+
+        assert self.store.tasks_list[0]["status"] == "DONE"
+        saved = json.loads(data_file.read_text(encoding="utf-8"))
+        assert saved[0]["status"] == "DONE"
+
+    def test_failed_snapshot_keeps_the_journal(self, tmp_path):
+        data_file = self._open(tmp_path)
+        _create_task("Une", "", self.store.tasks_list)
+        journal = tmp_path / "tasks.json.journal"
+
+        with patch(
+            "src.tasks_manager.utils.task_store._write_tasks",
+            side_effect=OSError("disk full"),
+        ):
+            with pytest.raises(OSError):
+                self.store.snapshot()
+            with pytest.warns(UserWarning, match="disk full"):
+                assert not self.store.maybe_snapshot(0)
+
+        assert len(journal.read_text(encoding="utf-8").splitlines()) == 1
+        assert json.loads(data_file.read_text(encoding="utf-8")) == []
+        assert self.store.changes == 1
+        assert self.store.maybe_snapshot(0)
+
+    def test_maybe_snapshot_waits_for_interval(self, tmp_path):
+        self._open(tmp_path)
+        assert not self.store.maybe_snapshot(0)
+        _create_task("Une", "", self.store.tasks_list)
+        assert not self.store.maybe_snapshot(3600)
+        assert self.store.maybe_snapshot(0)
+        assert self.store.changes == 0
+
+    def test_close_saves_and_removes_journal(self, tmp_path):
+        data_file = self._open(tmp_path)
+        _create_task("Une", "", self.store.tasks_list)
+        self.store.close()
+        self.store = None
+
+        assert not (tmp_path / "tasks.json.journal").exists()
+        assert len(json.loads(data_file.read_text(encoding="utf-8"))) == 1
+
+    def test_background_writer_coalesces_the_journal(self, tmp_path):
+        data_file = self._open(
+            tmp_path,
+            [{"id": 1, "title": "Une", "status": "TODO"}],
+            write_delay=60,
+        )
+        for status in ("ONGOING", "DONE") * 10:
+            _change_task_status(self.store.tasks_list, 1, status)
+        assert (tmp_path / "tasks.json.journal").read_text("utf-8") == ""
+
+        self.store.sync()
+        lines = (tmp_path / "tasks.json.journal").read_text("utf-8")
+        assert len(lines.splitlines()) == 1
+        stats = self.store.write_stats()
+        assert stats["mutations"] == 20
+        assert stats["journal_writes"] == 1
+        assert stats["write_amplification"] < 0.1
+
+        _change_task_status(self.store.tasks_list, 1, "TODO")
+        self.store.snapshot()
+        self.store.sync()
+        assert (tmp_path / "tasks.json.journal").read_text("utf-8") == ""
+        saved = json.loads(data_file.read_text(encoding="utf-8"))
+        assert saved[0]["status"] == "TODO"
+
+    def test_close_writes_pending_entries(self, tmp_path):
+        data_file = self._open(tmp_path, write_delay=60)
+        _create_task("Une", "", self.store.tasks_list)
+        self.store.close()
+        self.store = None
+
+        assert not (tmp_path / "tasks.json.journal").exists()
+        assert len(json.loads(data_file.read_text(encoding="utf-8"))) == 1
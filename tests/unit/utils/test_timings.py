@@ -0,0 +1,85 @@
+import json
+import time
+
+from click.testing import CliRunner
+
+from src.task_manager import task_manager
+from src.tasks_manager.utils import timings
+from src.tasks_manager.utils.timings import PhaseTimer, timed
+
+
+class TestPhaseTimer:
+    def test_nested_phases_are_exclusive(self):
+        timer = PhaseTimer()
+        with timer.phase("command"):
+            time.sleep(0.01)
+            with timer.phase("display"):
+                time.sleep(0.02)
+        timer.stop()
+
+        assert list(timer.phases) == ["command", "display"]
+        assert 0.01 <= timer.phases["command"] < 0.02
+        assert timer.phases["display"] >= 0.02
+        assert sum(timer.phases.values()) <= timer.total
+        assert "display" in timer.report()
+
+    def test_stop_closes_open_phases(self):
+        timer = PhaseTimer()
+        timer.push("command")
+        timer.stop()
+        record = timer.as_record(command="view_tasks")
+        assert record["command"] == "view_tasks"
+        assert set(record["phases_ms"]) == {"command"}
+
+    def test_timed_is_a_no_op_without_active_timer(self):
+        calls = []
+
+        @timed("load")
+        def load():
+            calls.append(1)
+            return "ok"
+
+        assert load() == "ok"
+        timer = PhaseTimer()
+        timings.activate(timer)
+        try:
+            load()
+        finally:
+            timings.activate(None)
+        assert len(calls) == 2
+        assert "load" in timer.phases
+
+
+class TestCliTimings:
+    def test_timings_flag_and_log(self, monkeypatch, tmp_path):
+        log_file = tmp_path / "timings.jsonl"
+        monkeypatch.setenv(timings.TIMINGS_LOG_ENV, str(log_file))
+        runner = CliRunner(mix_stderr=False)
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            for _ in range(2):
+                result = runner.invoke(
+                    task_manager,
+                    ["--timings", "view_tasks", "--format", "plain"],
+                    obj={},
+                )
+                assert result.exit_code == 0
+
+        assert "Temps par phase" in result.stderr
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        records = [json.loads(line) for line in lines]
+        assert len(records) == 2
+        assert records[0]["command"] == "view_tasks"
+        assert {"load", "command", "save"} <= set(records[0]["phases_ms"])
+        assert timings.active() is None
+
+    def test_profile_writes_pstats(self, tmp_path):
+        runner = CliRunner(mix_stderr=False)
+        profile_file = tmp_path / "run.pstats"
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            result = runner.invoke(
+                task_manager,
+                ["--profile", "--profile-file", str(profile_file), "next"],
+                obj={},
+            )
+        assert result.exit_code == 0
+        assert profile_file.exists()